@@ -20,6 +20,9 @@ CREATE TABLE IF NOT EXISTS documents (
 
 CREATE INDEX IF NOT EXISTS idx_documents_url ON documents(url);
 CREATE INDEX IF NOT EXISTS idx_documents_content_hash ON documents(content_hash);
+-- Date-range listings: range scan on published_at, doc_id carried for the
+-- join to relations(doc_id) without touching the table.
+CREATE INDEX IF NOT EXISTS idx_documents_published ON documents(published_at, doc_id);
 
 -- Entities table (extracted entities with canonical IDs)
 CREATE TABLE IF NOT EXISTS entities (
@@ -39,6 +42,8 @@ CREATE TABLE IF NOT EXISTS entities (
 
 CREATE INDEX IF NOT EXISTS idx_entities_name ON entities(name);
 CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(type);
+-- Date-range listings filter by type and first_seen together
+CREATE INDEX IF NOT EXISTS idx_entities_type_first_seen ON entities(type, first_seen);
 
 -- Relations table (extracted relationships between entities)
 CREATE TABLE IF NOT EXISTS relations (
@@ -299,3 +304,10 @@ CREATE TABLE IF NOT EXISTS token_usage (
 CREATE INDEX IF NOT EXISTS idx_token_usage_date  ON token_usage(run_date);
 CREATE INDEX IF NOT EXISTS idx_token_usage_stage ON token_usage(stage);
 CREATE INDEX IF NOT EXISTS idx_token_usage_model ON token_usage(model);
+
+-- Database bookkeeping (key/value).  schema_hash = SHA-256 of this file as
+-- last applied; init_db skips re-running the DDL while it matches.
+CREATE TABLE IF NOT EXISTS _meta (
+  key TEXT PRIMARY KEY,
+  value TEXT
+);
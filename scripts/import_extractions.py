@@ -29,7 +29,7 @@ def _bootstrap_domain() -> None:
 
 _bootstrap_domain()
 
-from db import init_db, insert_relation, insert_evidence
+from db import init_db, insert_relation, insert_evidences_batch, tuple_cursor
 from extract import EXTRACTOR_VERSION
 from resolve import EntityResolver
 from schema import validate_extraction, ValidationError
@@ -105,22 +105,24 @@ def import_extractions(
 
         # Resolve entities — get name-to-ID mapping
         # Track which are new vs resolved to existing
-        entities_before = set()
-        cursor = conn.execute("SELECT entity_id FROM entities")
-        entities_before = {row[0] for row in cursor.fetchall()}
+        entities_before = {
+            row[0] for row in tuple_cursor(conn).execute("SELECT entity_id FROM entities")
+        }
 
         name_to_id = resolver.resolve_extraction(extraction, observed_date=doc_published)
 
-        entities_after = set()
-        cursor = conn.execute("SELECT entity_id FROM entities")
-        entities_after = {row[0] for row in cursor.fetchall()}
+        entities_after = {
+            row[0] for row in tuple_cursor(conn).execute("SELECT entity_id FROM entities")
+        }
 
         new_entities = entities_after - entities_before
         stats["entities_total"] += len(name_to_id)
         stats["entities_new"] += len(new_entities)
         stats["entities_resolved"] += len(name_to_id) - len(new_entities)
 
-        # Insert relations
+        # Insert relations; their evidence rows are collected and written
+        # in one batch per document.
+        evidence_rows = []
         for rel in extraction.get("relations", []):
             source_id = name_to_id.get(rel["source"])
             target_id = name_to_id.get(rel["target"])
@@ -149,10 +151,11 @@ def import_extractions(
                 time_text=time_obj.get("text"),
                 time_start=time_obj.get("start"),
                 time_end=time_obj.get("end"),
+                commit=False,
             )
             stats["relations"] += 1
 
-            # Insert evidence for this relation
+            # Collect evidence for this relation
             # Use the known-good URL from documents table instead of
             # the LLM-returned URL, which is often truncated or mangled
             for ev in rel.get("evidence", []):
@@ -168,18 +171,19 @@ def import_extractions(
                     r = cur.fetchone()
                     ev_url = r[0] if r else ev.get("url", "")
                 char_span = ev.get("charSpan", {})
-                insert_evidence(
-                    conn,
-                    relation_id=relation_id,
-                    doc_id=ev_doc_id,
-                    url=ev_url,
-                    published=ev.get("published"),
-                    snippet=ev["snippet"],
-                    char_start=char_span.get("start"),
-                    char_end=char_span.get("end"),
-                )
+                evidence_rows.append({
+                    "relation_id": relation_id,
+                    "doc_id": ev_doc_id,
+                    "url": ev_url,
+                    "published": ev.get("published"),
+                    "snippet": ev["snippet"],
+                    "char_start": char_span.get("start"),
+                    "char_end": char_span.get("end"),
+                })
                 stats["evidence_records"] += 1
 
+        insert_evidences_batch(conn, evidence_rows, commit=False)
+
         # Generate MENTIONS relations from document to each resolved entity.
         # These populate the mentions view (Document ↔ Entity graph).
         doc_node_id = f"doc:{doc_id}"
@@ -201,6 +205,7 @@ def import_extractions(
                 confidence=1.0,
                 doc_id=doc_id,
                 extractor_version=extraction.get("extractorVersion", EXTRACTOR_VERSION),
+                commit=False,
             )
             stats["mentions_generated"] += 1
 
@@ -217,6 +222,7 @@ def import_extractions(
                WHERE doc_id = ?""",
             (extracted_by, quality_score, escalation_failed, doc_id),
         )
+        # One commit per document covers its relations and evidence too
         conn.commit()
 
         # Accumulate per-source stats
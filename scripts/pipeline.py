@@ -0,0 +1,148 @@
+"""Run several read-heavy post-import steps on one SQLite connection.
+
+Each of run_resolve.py, run_trending.py and shadow_report.py opens its own
+connection and starts with a cold page cache. This entry point opens the
+database once, raises the page cache / mmap limits for the bulk reads, and
+runs the requested steps in the order given on that connection.
+
+Usage:
+    python scripts/pipeline.py resolve trending shadow-report [--domain ai]
+    python scripts/pipeline.py trending --top-n 100 --narratives
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add src/ to import path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+def _load_dotenv() -> None:
+    """Load .env from project root so standalone invocations pick up API keys."""
+    env_path = Path(__file__).resolve().parents[1] / ".env"
+    if env_path.exists():
+        with open(env_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, val = line.partition("=")
+                os.environ.setdefault(key.strip(), val.strip())
+
+
+def _bootstrap_domain() -> None:
+    """Set PREDICTOR_DOMAIN from --domain arg before any domain-aware imports."""
+    for i, arg in enumerate(sys.argv):
+        if arg == "--domain" and i + 1 < len(sys.argv):
+            os.environ["PREDICTOR_DOMAIN"] = sys.argv[i + 1]
+            return
+        if arg.startswith("--domain="):
+            os.environ["PREDICTOR_DOMAIN"] = arg.split("=", 1)[1]
+            return
+
+
+_load_dotenv()
+_bootstrap_domain()
+
+from db import init_db
+from run_resolve import resolve_entities
+from run_trending import export_trending
+from shadow_report import run_report
+
+STEPS = ("resolve", "trending", "shadow-report")
+
+# Bulk-read tuning for the shared connection: 256 MB page cache (negative
+# values are KiB) and memory-mapped reads up to SQLite's compiled-in cap.
+_CACHE_SIZE_KIB = 262144
+_MMAP_SIZE = 30_000_000_000
+
+
+def open_pipeline_db(db_path: Path) -> sqlite3.Connection:
+    """Open the database once for all steps, with bulk-read PRAGMAs."""
+    conn = init_db(db_path)
+    conn.execute(f"PRAGMA cache_size = -{_CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+    return conn
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Run resolve / trending / shadow-report on one database connection."
+    )
+    parser.add_argument(
+        "steps", nargs="+", choices=STEPS,
+        help="Steps to run, in order",
+    )
+    parser.add_argument(
+        "--domain", default=None,
+        help="Domain slug (default: ai or PREDICTOR_DOMAIN env var)",
+    )
+    parser.add_argument(
+        "--db", default=None,
+        help="Path to SQLite database (default: data/db/{domain}.db)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.85,
+        help="resolve: similarity threshold for matching (default: 0.85)",
+    )
+    parser.add_argument(
+        "--since", default=None, metavar="YYYY-MM-DD",
+        help="resolve: only re-check entities seen on or after this date",
+    )
+    parser.add_argument(
+        "--output-dir", default=None,
+        help="trending: output directory (default: data/graphs/{domain}/{today})",
+    )
+    parser.add_argument(
+        "--top-n", type=int, default=50,
+        help="trending: maximum trending entities (default: 50)",
+    )
+    parser.add_argument(
+        "--narratives", action="store_true",
+        help="trending: generate LLM-powered trend narratives",
+    )
+    parser.add_argument(
+        "--days", type=int, default=None,
+        help="shadow-report: limit to last N days (default: all time)",
+    )
+    args = parser.parse_args()
+
+    from util.paths import get_db_path, get_graphs_dir
+    db_path = Path(args.db) if args.db else get_db_path(args.domain)
+    if "resolve" not in args.steps and not db_path.exists():
+        print(f"Database not found: {db_path}")
+        print("Run the pipeline first to create it.")
+        return 1
+
+    conn = open_pipeline_db(db_path)
+    try:
+        for step in args.steps:
+            if step == "resolve":
+                rc = resolve_entities(conn, threshold=args.threshold, since=args.since)
+            elif step == "trending":
+                output_dir = (
+                    Path(args.output_dir) if args.output_dir
+                    else get_graphs_dir(args.domain) / date.today().isoformat()
+                )
+                export_trending(
+                    db_path, output_dir, args.top_n,
+                    generate_narratives=args.narratives, conn=conn,
+                )
+                rc = 0
+            else:
+                rc = run_report(db_path, args.days, domain=args.domain, conn=conn)
+            if rc:
+                return rc
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,14 +14,33 @@ from __future__ import annotations
 
 import argparse
 import json
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+# Optional fast JSON parsers for large docpacks; stdlib json is the fallback.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_dotenv() -> None:
     env_path = Path(__file__).resolve().parents[1] / ".env"
@@ -49,25 +68,124 @@ from extract import (
 )
 
 
+PROGRESS_FLUSH_EVERY = 20
+
+# Prompts built ahead of the in-flight API call (ThreadPoolExecutor workers)
+PROMPT_PIPELINE_DEPTH = 2
+
+
+class _ProgressHandler(logging.StreamHandler):
+    """Writes progress records verbatim, flushing every `flush_every` records."""
+
+    def __init__(self, stream, flush_every: int) -> None:
+        super().__init__(stream)
+        self.flush_every = flush_every
+        self._unflushed = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.stream.write(record.getMessage() + getattr(record, "end", "\n"))
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+            self._unflushed = 0
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    # QueueHandler.prepare() formats in the caller's thread; progress args
+    # are plain ints/strings, so pass the record through and let the
+    # listener thread do the formatting.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_progress_logger = logging.getLogger("run_extract.progress")
+_progress_logger.setLevel(logging.INFO)
+_progress_logger.propagate = False
+
+
+class ProgressLog:
+    """Per-doc progress lines for run_extraction.
+
+    Records go through a QueueHandler; a QueueListener thread formats and
+    writes them, so the extraction loop only enqueues. On a TTY the
+    "extracting..." marker is written immediately so the operator sees
+    which doc is in flight. When stdout is redirected (cron, nohup, log
+    files) each status is one complete line, flushed every
+    PROGRESS_FLUSH_EVERY lines.
+
+    Use as a context manager; exiting drains the queue.
+    """
+
+    def __init__(self, stream=None, flush_every: int = PROGRESS_FLUSH_EVERY) -> None:
+        stream = stream if stream is not None else sys.stdout
+        self.interactive = stream.isatty()
+        self._handler = _ProgressHandler(stream, 1 if self.interactive else flush_every)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = _DeferredQueueHandler(self._queue)
+        self._listener = logging.handlers.QueueListener(self._queue, self._handler)
+        self._prefix: tuple = ("",)
+
+    def __enter__(self) -> "ProgressLog":
+        _progress_logger.addHandler(self._queue_handler)
+        self._listener.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _progress_logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        self._handler.flush()
+
+    def line(self, msg: str, *args: Any) -> None:
+        _progress_logger.info(msg, *args)
+
+    def start(self, msg: str, *args: Any) -> None:
+        if self.interactive:
+            _progress_logger.info(msg, *args, extra={"end": " "})
+        else:
+            self._prefix = (msg, *args)
+
+    def finish(self, msg: str, *args: Any) -> None:
+        if self.interactive:
+            _progress_logger.info(msg, *args)
+        else:
+            prefix_msg, *prefix_args = self._prefix
+            _progress_logger.info(f"{prefix_msg} {msg}", *prefix_args, *args)
+
+
 def get_model() -> str:
     model = os.environ.get("PRIMARY_MODEL", "").strip()
     return model if model else "claude-sonnet-5"
 
 
+def _line_parser() -> Callable[[bytes], Any]:
+    """Return a JSONL line parser, preferring one reused simdjson Parser."""
+    if simdjson is not None:
+        parser = simdjson.Parser()
+        # as_dict() materializes the lazy view before the buffer is reused
+        return lambda line: parser.parse(line).as_dict()
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
+
+
 def load_docpack(path: Path) -> list[dict[str, Any]]:
+    parse = _line_parser()
     docs = []
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if line:
-                docs.append(json.loads(line))
+                docs.append(parse(line))
     return docs
 
 
-def extract_with_anthropic(doc: dict[str, Any], model: str, max_tokens: int = 8192) -> tuple[str, int]:
-    try:
-        import anthropic
-    except ImportError:
+def extract_with_anthropic(
+    doc: dict[str, Any],
+    model: str,
+    max_tokens: int = 8192,
+    prompt: str | None = None,
+) -> tuple[str, int]:
+    if anthropic is None:
         print("ERROR: anthropic package not installed. Run: pip install anthropic")
         sys.exit(1)
 
@@ -77,7 +195,8 @@ def extract_with_anthropic(doc: dict[str, Any], model: str, max_tokens: int = 81
         sys.exit(1)
 
     client = anthropic.Anthropic(api_key=api_key)
-    prompt = build_extraction_prompt(doc, EXTRACTOR_VERSION)
+    if prompt is None:
+        prompt = build_extraction_prompt(doc, EXTRACTOR_VERSION)
 
     start = time.time()
     response = client.messages.create(
@@ -98,6 +217,12 @@ def extract_with_anthropic(doc: dict[str, Any], model: str, max_tokens: int = 81
     return response.content[0].text, duration_ms
 
 
+def _write_error(output_dir: Path, doc_id: str, exc: BaseException) -> None:
+    (output_dir / f"{doc_id}.error").write_text(
+        f"{type(exc).__name__}: {exc}\n", encoding="utf-8"
+    )
+
+
 def run_extraction(
     docpack_path: Path,
     output_dir: Path,
@@ -119,38 +244,58 @@ def run_extraction(
 
     processed = succeeded = failed = 0
 
-    for i, doc in enumerate(docs, 1):
-        doc_id = doc.get("docId", f"unknown_{i}")
-
-        if skip_existing and (output_dir / f"{doc_id}.json").exists():
-            print(f"  [{i}/{len(docs)}] {doc_id}: SKIPPED (exists)")
-            continue
-
-        print(f"  [{i}/{len(docs)}] {doc_id}: extracting...", end=" ", flush=True)
-        processed += 1
-
-        try:
-            response_text, duration_ms = extract_with_anthropic(doc, model=model)
-            extraction = parse_extraction_response(response_text, doc_id)
-            save_extraction(extraction, output_dir)
-
-            n_e = len(extraction.get("entities", []))
-            n_r = len(extraction.get("relations", []))
-            print(f"OK ({n_e}e, {n_r}r, {duration_ms}ms)")
-            succeeded += 1
-
-        except ExtractionError as e:
-            print(f"FAILED: {e}")
-            failed += 1
-            (output_dir / f"{doc_id}.error").write_text(f"ExtractionError: {e}\n")
-
-        except Exception as e:
-            print(f"ERROR: {e}")
-            failed += 1
-            (output_dir / f"{doc_id}.error").write_text(f"{type(e).__name__}: {e}\n")
-
-        if i < len(docs):
-            time.sleep(0.5)
+    doc_ids = [doc.get("docId", f"unknown_{i}") for i, doc in enumerate(docs, 1)]
+    todo = [
+        idx for idx, doc_id in enumerate(doc_ids)
+        if not (skip_existing and (output_dir / f"{doc_id}.json").exists())
+    ]
+    todo_set = set(todo)
+
+    with ProgressLog() as progress, ThreadPoolExecutor(max_workers=PROMPT_PIPELINE_DEPTH) as pool:
+        # Prompt formatting for the next docs overlaps the current API call.
+        prompts: dict[int, Future] = {}
+
+        def prefetch(pos: int) -> None:
+            if pos < len(todo):
+                idx = todo[pos]
+                prompts[idx] = pool.submit(build_extraction_prompt, docs[idx], EXTRACTOR_VERSION)
+
+        for pos in range(PROMPT_PIPELINE_DEPTH):
+            prefetch(pos)
+        next_pos = PROMPT_PIPELINE_DEPTH
+
+        for i, doc in enumerate(docs, 1):
+            doc_id = doc_ids[i - 1]
+
+            if i - 1 not in todo_set:
+                progress.line("  [%d/%d] %s: SKIPPED (exists)", i, len(docs), doc_id)
+                continue
+
+            progress.start("  [%d/%d] %s: extracting...", i, len(docs), doc_id)
+            processed += 1
+            prompt_future = prompts.pop(i - 1)
+            prefetch(next_pos)
+            next_pos += 1
+
+            try:
+                prompt = prompt_future.result()
+                response_text, duration_ms = extract_with_anthropic(doc, model=model, prompt=prompt)
+                extraction = parse_extraction_response(response_text, doc_id)
+                save_extraction(extraction, output_dir)
+
+                n_e = len(extraction.get("entities", []))
+                n_r = len(extraction.get("relations", []))
+                progress.finish("OK (%de, %dr, %dms)", n_e, n_r, duration_ms)
+                succeeded += 1
+
+            except Exception as e:
+                label = "FAILED" if isinstance(e, ExtractionError) else "ERROR"
+                progress.finish("%s: %s", label, e)
+                failed += 1
+                _write_error(output_dir, doc_id, e)
+
+            if i < len(docs):
+                time.sleep(0.5)
 
     return processed, succeeded, failed
 
@@ -15,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from db import init_db
 from domain import set_active_domain
+from util.stage_stats import emit_stage_stats
 
 
 def main() -> int:
@@ -52,6 +53,12 @@ def main() -> int:
     print(f"  - {result.relations_inferred} relations inferred")
     print(f"  - {result.relations_skipped} skipped (already existed)")
     print(f"  - {result.duration_ms}ms")
+    emit_stage_stats({
+        "rulesEvaluated": result.rules_evaluated,
+        "relationsInferred": result.relations_inferred,
+        "relationsSkipped": result.relations_skipped,
+        "durationMs": result.duration_ms,
+    })
 
     conn.close()
     return 0
@@ -11,6 +11,7 @@ Usage:
     python scripts/run_network_tests.py --quick     # Just feed parsing, no full ingestion
 """
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -36,7 +37,8 @@ def main():
         cmd.extend(["-k", "fetch_arxiv or fetch_huggingface or fetch_openai"])
 
     # Set PYTHONPATH
-    env = {"PYTHONPATH": str(repo_root / "src")}
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(repo_root / "src")
 
     print("=" * 60)
     print("Running network-dependent tests")
@@ -45,7 +47,7 @@ def main():
     print(f"\nCommand: {' '.join(cmd)}\n")
 
     # Run tests
-    result = subprocess.run(cmd, cwd=repo_root, env={**dict(__import__('os').environ), **env})
+    result = subprocess.run(cmd, cwd=repo_root, env=env)
 
     return result.returncode
 
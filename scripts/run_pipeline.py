@@ -12,6 +12,9 @@ Runs all stages in order:
   9. trending   — compute and export trending view with narratives
  10. movers     — export Movers tabular view (rank delta / velocity)
 
+Stages tagged with the same "group" (export + trending) have no data
+dependency on each other and run concurrently via asyncio subprocesses.
+
 Writes a JSON run log to data/logs/pipeline_YYYY-MM-DD.json and prints
 a one-liner summary suitable for cron email capture.
 """
@@ -19,18 +22,36 @@ a one-liner summary suitable for cron email capture.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import collections
 import json
+import mmap
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
 import time
 from datetime import date, datetime, timezone
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX: fall back to a plain marker file
+    fcntl = None
+
+# Optional fast JSON encoder for the run log; stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src/ to import path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from util.stage_stats import parse_stage_stats  # noqa: E402
+
 
 def load_dotenv() -> None:
     """Load .env file from project root if it exists."""
@@ -55,6 +76,96 @@ def utc_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+# run_log keeps only this much of each stage's stdout (see main)
+STDOUT_TAIL_CHARS = 2000
+
+
+class _OutputTail:
+    """Most recent output lines, totalling at least `max_chars` characters."""
+
+    def __init__(self, max_chars: int = STDOUT_TAIL_CHARS) -> None:
+        self.max_chars = max_chars
+        self._lines: collections.deque[str] = collections.deque()
+        self._size = 0
+
+    def append(self, line: str) -> None:
+        self._lines.append(line)
+        self._size += len(line)
+        while self._lines and self._size - len(self._lines[0]) >= self.max_chars:
+            self._size -= len(self._lines.popleft())
+
+    def __iter__(self):
+        return iter(self._lines)
+
+
+class _StageOutput:
+    """Routes a stage's output lines to its parser and the captured text.
+
+    Without a parser the full stdout is kept. With one, each line is parsed
+    as it arrives and only the stdout tail is kept for the run log.
+    """
+
+    def __init__(self, parser: StageParser | None = None) -> None:
+        self.parser = parser
+        self._stdout: _OutputTail | list[str] = _OutputTail() if parser is not None else []
+        self._stderr: list[str] = []
+        self._emitted: dict = {}
+
+    def stdout_line(self, line: str) -> None:
+        emitted = parse_stage_stats(line)
+        if emitted is not None:
+            self._emitted.update(emitted)
+        elif self.parser is not None:
+            self.parser.on_line(line.rstrip("\r\n"))
+        self._stdout.append(line)
+
+    def stderr_line(self, line: str) -> None:
+        if self.parser is not None:
+            self.parser.on_stderr_line(line.rstrip("\r\n"))
+        self._stderr.append(line)
+
+    @property
+    def tail_only(self) -> bool:
+        """True when only the stdout tail matters (the parser ignores stdout)."""
+        return self.parser is not None and type(self.parser).on_line is StageParser.on_line
+
+    @property
+    def stdout(self) -> str:
+        return "".join(self._stdout)
+
+    @property
+    def stderr(self) -> str:
+        return "".join(self._stderr)
+
+    @property
+    def stats(self) -> dict:
+        """Parsed stats, overridden by any ##STATS## line the stage emitted."""
+        stats = self.parser.result() if self.parser is not None else {}
+        return {**stats, **self._emitted} if self._emitted else stats
+
+
+def _feed_lines(f, handler, tail_bytes: int | None = None) -> None:
+    """Pass each line of a finished stage's output file to handler.
+
+    With tail_bytes, only the last tail_bytes of the file are decoded.
+    """
+    size = f.seek(0, os.SEEK_END)
+    if size == 0:
+        return  # mmap cannot map an empty file
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if tail_bytes is not None:
+            mm.seek(max(0, size - tail_bytes))
+        for raw in iter(mm.readline, b""):
+            handler(raw.decode("utf-8", errors="replace").replace("\r\n", "\n"))
+
+
+def _reap(proc: subprocess.Popen) -> None:
+    """Kill *proc* if it is still running and wait for it to exit."""
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+
+
 def run_stage(
     name: str,
     cmd: list[str],
@@ -63,6 +174,7 @@ def run_stage(
     env: dict[str, str] | None = None,
     timeout: int | None = 600,
     stream: bool = False,
+    parser: StageParser | None = None,
 ) -> dict:
     """Run a pipeline stage as a subprocess.
 
@@ -74,63 +186,61 @@ def run_stage(
         timeout: Maximum seconds before killing (None = no timeout)
         stream: If True, print stdout/stderr lines in real-time
                 (prefixed with stage name) while still capturing them.
+        parser: Optional StageParser fed each output line; stdout is
+                then kept only as its last STDOUT_TAIL_CHARS.
 
     Returns:
-        Dict with status, duration, output, and returncode
+        Dict with status, duration, output, returncode, and parsed stats
     """
     import select
-    import io
 
-    merged_env = {**os.environ}
-    if env:
-        merged_env.update(env)
+    # None lets the child inherit os.environ without copying it per stage
+    merged_env = {**os.environ, **env} if env else None
 
     start = time.monotonic()
 
     if not stream:
-        # Original captured mode for quick stages
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=cwd,
-                env=merged_env,
-                timeout=timeout,
-            )
-            duration = time.monotonic() - start
-            return {
-                "stage": name,
-                "status": "ok" if result.returncode == 0 else "error",
-                "returncode": result.returncode,
-                "duration_sec": round(duration, 1),
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-            }
-        except subprocess.TimeoutExpired:
-            duration = time.monotonic() - start
-            return {
-                "stage": name,
-                "status": "timeout",
-                "returncode": -1,
-                "duration_sec": round(duration, 1),
-                "stdout": "",
-                "stderr": f"Stage {name} timed out after {timeout}s",
-            }
-        except Exception as e:
-            duration = time.monotonic() - start
-            return {
-                "stage": name,
-                "status": "error",
-                "returncode": -1,
-                "duration_sec": round(duration, 1),
-                "stdout": "",
-                "stderr": str(e),
-            }
+        # Captured mode: output goes straight to temp files (not pipes held
+        # in memory) and is line-iterated via mmap once the stage exits.
+        output = _StageOutput(parser)
+        with tempfile.TemporaryFile() as out_f, tempfile.TemporaryFile() as err_f:
+            status, returncode, note = "error", -1, ""
+            try:
+                result = subprocess.run(
+                    cmd,
+                    stdout=out_f,
+                    stderr=err_f,
+                    cwd=cwd,
+                    env=merged_env,
+                    timeout=timeout,
+                )
+                returncode = result.returncode
+                status = "ok" if returncode == 0 else "error"
+            except subprocess.TimeoutExpired:
+                status = "timeout"
+                note = f"Stage {name} timed out after {timeout}s"
+            except Exception as e:
+                note = str(e)
+            # UTF-8 needs at most 4 bytes per character of the kept tail
+            _feed_lines(out_f, output.stdout_line,
+                        4 * STDOUT_TAIL_CHARS if output.tail_only else None)
+            _feed_lines(err_f, output.stderr_line)
+        stderr = output.stderr
+        if note:
+            stderr = f"{stderr}\n{note}" if stderr else note
+        return {
+            "stage": name,
+            "status": status,
+            "returncode": returncode,
+            "duration_sec": round(time.monotonic() - start, 1),
+            "stdout": output.stdout,
+            "stderr": stderr,
+            "stats": output.stats,
+        }
 
-    # Streaming mode: show output in real-time while capturing it
-    stdout_lines: list[str] = []
-    stderr_lines: list[str] = []
+    # Streaming mode: show output in real-time while parsing/capturing it
+    output = _StageOutput(parser)
+    proc = None
     try:
         proc = subprocess.Popen(
             cmd,
@@ -142,24 +252,21 @@ def run_stage(
         )
 
         # Read both streams without blocking using select()
-        streams = {proc.stdout: stdout_lines, proc.stderr: stderr_lines}
+        streams = {proc.stdout: output.stdout_line, proc.stderr: output.stderr_line}
         while streams:
             # Check timeout (skip if timeout is None)
             elapsed = time.monotonic() - start
             if timeout is not None and elapsed > timeout:
-                proc.kill()
-                proc.wait()
-                captured_out = "".join(stdout_lines)
-                captured_err = "".join(stderr_lines)
-                captured_err += f"\nStage {name} timed out after {timeout}s"
+                _reap(proc)
                 duration = time.monotonic() - start
                 return {
                     "stage": name,
                     "status": "timeout",
                     "returncode": -1,
                     "duration_sec": round(duration, 1),
-                    "stdout": captured_out,
-                    "stderr": captured_err,
+                    "stdout": output.stdout,
+                    "stderr": output.stderr + f"\nStage {name} timed out after {timeout}s",
+                    "stats": output.stats,
                 }
 
             if timeout is not None:
@@ -180,14 +287,15 @@ def run_stage(
                     # EOF on this stream
                     streams.pop(stream_obj, None)
                     continue
-                buf = streams.get(stream_obj)
-                if buf is not None:
-                    buf.append(line)
-                # Print with stage prefix — stdout gets "  " indent, stderr gets "  WARN:"
-                if stream_obj is proc.stdout:
-                    print(f"  {line.rstrip()}", flush=True)
-                else:
-                    print(f"  WARN: {line.rstrip()}", flush=True)
+                handler = streams.get(stream_obj)
+                if handler is not None:
+                    handler(line)
+                if stream:
+                    # Print with stage prefix — stdout gets "  " indent, stderr gets "  WARN:"
+                    if stream_obj is proc.stdout:
+                        print(f"  {line.rstrip()}", flush=True)
+                    else:
+                        print(f"  WARN: {line.rstrip()}", flush=True)
 
         proc.wait(timeout=10)
         duration = time.monotonic() - start
@@ -196,8 +304,9 @@ def run_stage(
             "status": "ok" if proc.returncode == 0 else "error",
             "returncode": proc.returncode,
             "duration_sec": round(duration, 1),
-            "stdout": "".join(stdout_lines),
-            "stderr": "".join(stderr_lines),
+            "stdout": output.stdout,
+            "stderr": output.stderr,
+            "stats": output.stats,
         }
 
     except Exception as e:
@@ -207,9 +316,264 @@ def run_stage(
             "status": "error",
             "returncode": -1,
             "duration_sec": round(duration, 1),
-            "stdout": "".join(stdout_lines),
-            "stderr": "".join(stderr_lines) + f"\n{e}",
+            "stdout": output.stdout,
+            "stderr": output.stderr + f"\n{e}",
+            "stats": output.stats,
+        }
+    finally:
+        # Never leave a stage alive (and holding SQLite locks) behind us,
+        # whether we bailed out on an error or on KeyboardInterrupt.
+        if proc is not None:
+            _reap(proc)
+
+
+async def _run_stage_async(
+    name: str,
+    cmd: list[str],
+    *,
+    cwd: Path | None = None,
+    timeout: int | None = 600,
+    parser: StageParser | None = None,
+) -> dict:
+    """Captured-mode run_stage on top of asyncio.create_subprocess_exec.
+
+    Output lines are consumed with ``async for`` and routed through the
+    same _StageOutput as run_stage. Returns the same dict shape.
+    """
+    start = time.monotonic()
+    output = _StageOutput(parser)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            limit=1 << 20,  # long log lines (default 64 KiB readline cap)
+        )
+    except Exception as e:
+        return {
+            "stage": name,
+            "status": "error",
+            "returncode": -1,
+            "duration_sec": round(time.monotonic() - start, 1),
+            "stdout": "",
+            "stderr": str(e),
+            "stats": output.stats,
+        }
+
+    async def _pump(reader: asyncio.StreamReader, handler) -> None:
+        async for raw in reader:
+            handler(raw.decode("utf-8", errors="replace"))
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                _pump(proc.stdout, output.stdout_line),
+                _pump(proc.stderr, output.stderr_line),
+                proc.wait(),
+            ),
+            timeout,
+        )
+    except asyncio.TimeoutError:
+        return {
+            "stage": name,
+            "status": "timeout",
+            "returncode": -1,
+            "duration_sec": round(time.monotonic() - start, 1),
+            "stdout": output.stdout,
+            "stderr": output.stderr + f"\nStage {name} timed out after {timeout}s",
+            "stats": output.stats,
         }
+    finally:
+        # Covers the timeout and a cancelled sibling alike
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    return {
+        "stage": name,
+        "status": "ok" if proc.returncode == 0 else "error",
+        "returncode": proc.returncode,
+        "duration_sec": round(time.monotonic() - start, 1),
+        "stdout": output.stdout,
+        "stderr": output.stderr,
+        "stats": output.stats,
+    }
+
+
+def run_stages_concurrently(
+    specs: list[tuple[str, list[str], int | None, StageParser | None]],
+    *,
+    cwd: Path | None = None,
+) -> list[dict]:
+    """Run independent stages at the same time.
+
+    Args:
+        specs: (name, cmd, timeout, parser) per stage
+        cwd: Working directory
+
+    Returns:
+        One run_stage-style result dict per spec, in spec order
+    """
+    async def _gather() -> list[dict]:
+        return await asyncio.gather(*(
+            _run_stage_async(name, cmd, cwd=cwd, timeout=timeout, parser=parser)
+            for name, cmd, timeout, parser in specs
+        ))
+
+    return asyncio.run(_gather())
+
+
+def _run_script_in_process(script: str, argv: list[str], cwd: str) -> tuple[int, str, str]:
+    """Execute a stage script as __main__ inside the warm worker.
+
+    Returns (returncode, stdout, stderr), mirroring a subprocess run.
+    """
+    import contextlib
+    import io
+    import runpy
+    import traceback
+
+    os.chdir(cwd)
+    sys.argv = [script, *argv]
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+    return returncode, out.getvalue(), err.getvalue()
+
+
+def _stage_worker_loop(conn) -> None:
+    """Warm worker body: run each (script, argv, cwd) job received on conn."""
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        conn.send(_run_script_in_process(*job))
+
+
+class StageWorkerPool:
+    """A warm, forked Python worker that runs script stages in-process.
+
+    Stages of the form ``[sys.executable, "scripts/x.py", ...]`` skip
+    interpreter startup and re-importing db/resolve/graph/etc. for every
+    stage; modules imported by one stage stay loaded for the next. The
+    worker is forked lazily and replaced after a timeout or if it dies
+    mid-stage (the wait watches its process sentinel as well as the
+    result pipe, so a crash fails the stage even without a timeout).
+    Only used with --warm-workers, and only where fork is available.
+    """
+
+    def __init__(self) -> None:
+        self._worker = None
+        self._conn = None
+
+    @staticmethod
+    def can_run(cmd: list[str]) -> bool:
+        import multiprocessing
+        return (
+            len(cmd) >= 2
+            and cmd[0] == sys.executable
+            and cmd[1].endswith(".py")
+            and "fork" in multiprocessing.get_all_start_methods()
+        )
+
+    def _start(self) -> None:
+        import multiprocessing
+        ctx = multiprocessing.get_context("fork")
+        self._conn, child_conn = ctx.Pipe()
+        self._worker = ctx.Process(target=_stage_worker_loop, args=(child_conn,), daemon=True)
+        self._worker.start()
+        child_conn.close()
+
+    def _discard(self) -> None:
+        """Kill the worker (if still running) so the next stage forks a new one."""
+        self._worker.terminate()
+        self._worker.join()
+        self._conn.close()
+        self._worker = self._conn = None
+
+    def run(
+        self,
+        name: str,
+        cmd: list[str],
+        *,
+        cwd: Path,
+        timeout: int | None = 600,
+        parser: StageParser | None = None,
+    ) -> dict:
+        """Run one stage; returns the same dict shape as run_stage."""
+        from multiprocessing.connection import wait
+
+        start = time.monotonic()
+
+        def failed(status: str, stderr: str) -> dict:
+            return {
+                "stage": name,
+                "status": status,
+                "returncode": -1,
+                "duration_sec": round(time.monotonic() - start, 1),
+                "stdout": "",
+                "stderr": stderr,
+                "stats": parser.result() if parser is not None else {},
+            }
+
+        if self._worker is None:
+            self._start()
+        try:
+            self._conn.send((cmd[1], cmd[2:], str(cwd)))
+            ready = wait([self._conn, self._worker.sentinel], timeout)
+            if not ready:
+                self._discard()
+                return failed("timeout", f"Stage {name} timed out after {timeout}s")
+            # A result that was sent just before exiting is still readable
+            returncode, out, err = self._conn.recv()
+        except EOFError:
+            self._worker.join()
+            exitcode = self._worker.exitcode
+            self._discard()
+            return failed("error", f"Stage {name}: warm worker exited with code {exitcode}")
+        except Exception as e:
+            self._discard()
+            return failed("error", str(e))
+
+        output = _StageOutput(parser)
+        for line in out.splitlines(keepends=True):
+            output.stdout_line(line)
+        for line in err.splitlines(keepends=True):
+            output.stderr_line(line)
+        return {
+            "stage": name,
+            "status": "ok" if returncode == 0 else "error",
+            "returncode": returncode,
+            "duration_sec": round(time.monotonic() - start, 1),
+            "stdout": output.stdout,
+            "stderr": output.stderr,
+            "stats": output.stats,
+        }
+
+    def close(self) -> None:
+        if self._worker is not None:
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._worker.join(5)
+            self._discard()
 
 
 def _extract_int_before(text: str, label: str, stats: dict, key: str) -> None:
@@ -222,68 +586,105 @@ def _extract_int_before(text: str, label: str, stats: dict, key: str) -> None:
         stats[key] += int(before[-1])
 
 
-def parse_ingest_output(stdout: str, stderr: str = "") -> dict:
-    """Parse ingest stage stdout (and optionally stderr) for stats.
-
-    Args:
-        stdout: Captured stdout from ingest subprocess
-        stderr: Captured stderr from ingest subprocess (for diagnostics)
+class StageParser:
+    """Incremental parser for a stage's output.
 
-    Returns:
-        Dict with feed-level stats and per-feed error details.
+    Lines are fed one at a time as the subprocess produces them (see
+    run_stage), so stats are built in a single pass without holding the
+    full log. The base class ignores all output and returns no stats.
     """
-    import re
-
-    stats = {
-        "feedsChecked": 0,
-        "feedsReachable": 0,
-        "feedsUnreachable": 0,
-        "newDocsFound": 0,
-        "duplicatesSkipped": 0,
-        "fetchErrors": 0,
-    }
-    errored_feeds: list[str] = []
-    current_feed: str = ""
 
-    for line in stdout.splitlines():
+    def __init__(self) -> None:
+        self.stats: dict = {}
+
+    def on_line(self, line: str) -> None:
+        """Consume one stdout line (trailing newline optional)."""
+
+    def on_stderr_line(self, line: str) -> None:
+        """Consume one stderr line."""
+
+    def result(self) -> dict:
+        return self.stats
+
+    @classmethod
+    def parse(cls, stdout: str, stderr: str = "") -> dict:
+        """Parse already-captured output in one call."""
+        output = _StageOutput(cls())
+        for line in stdout.splitlines():
+            output.stdout_line(line)
+        for line in stderr.splitlines():
+            output.stderr_line(line)
+        return output.stats
+
+
+# First whitespace-delimited token that is all digits (was split()+isdigit())
+_RE_INT_TOKEN = re.compile(r"(?<!\S)(\d+)(?!\S)")
+# Same, also accepting an "N/M" token (yields N)
+_RE_RATIO_TOKEN = re.compile(r"(?<!\S)(\d+)(?:/\S*)?(?!\S)")
+_RE_UNMAPPED_TYPE = re.compile(r"([A-Z_]+)\s*\((\d+)\)")
+# Count token plus the token after it: "(12 nodes," / "30 edges)"
+_RE_GRAPH_COUNT = re.compile(r"(?<!\S)(\(?)(\d+)(?!\S)(?=(?:\s+(\S+))?)")
+# First run of digits anywhere in the line
+_RE_DIGITS = re.compile(r"\d+")
+_RE_DURATION_MS = re.compile(r"(\d+)ms")
+_RE_MOVERS_ROWS = re.compile(r"(\d+)\s+rows\s+\(window:\s+(\d+)\s+days\)")
+
+
+def _first_int(text: str, pattern: re.Pattern = _RE_INT_TOKEN) -> int | None:
+    m = pattern.search(text)
+    return int(m.group(1)) if m else None
+
+
+_RE_FEED_COUNTER = re.compile(r"^\[\d+/\d+\]\s*")
+_RE_PROCESSING = re.compile(r"processing(?:\s+feed)?:", re.IGNORECASE)
+_RE_FEED_SUFFIX = re.compile(r"\s*\((?:limit \d+|elapsed [^)]+)\)\s*")
+_RE_REACHABLE = re.compile(r"feeds reachable:\s*(\d+)/(\d+)")
+_RE_SUMMARY_ERRORS = re.compile(r"errors\s+(\d+)")
+# Every branch of IngestOutputParser.on_line needs one of these substrings
+_INGEST_KEYWORDS = ("process", "feed", "saved", "new documents", "skip")
+
+
+class IngestOutputParser(StageParser):
+    """Feed-level stats and per-feed error details from the ingest stage."""
+
+    def __init__(self) -> None:
+        self.stats = {
+            "feedsChecked": 0,
+            "feedsReachable": 0,
+            "feedsUnreachable": 0,
+            "newDocsFound": 0,
+            "duplicatesSkipped": 0,
+            "fetchErrors": 0,
+        }
+        self.errored_feeds: list[str] = []
+        self.current_feed = ""
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
         lower = line.lower().strip()
+        if not any(kw in lower for kw in _INGEST_KEYWORDS):
+            return
         # Count feeds checked: "[N/M] Processing feed: ..." or legacy "Processing feed: ..."
         # Strip optional "[N/M] " prefix before matching
-        check_lower = re.sub(r"^\[\d+/\d+\]\s*", "", lower)
-        if check_lower.startswith("processing feed:") or check_lower.startswith("processing:"):
+        check_lower = _RE_FEED_COUNTER.sub("", lower) if lower.startswith("[") else lower
+        if check_lower.startswith(("processing feed:", "processing:")):
             stats["feedsChecked"] += 1
             # Track current feed name for error association
             # Split on "Processing feed:" (or "Processing:") to get the feed name
-            feed_part = re.split(r"processing(?:\s+feed)?:", line.strip(), flags=re.IGNORECASE)
+            feed_part = _RE_PROCESSING.split(line.strip())
             current_feed = feed_part[-1].strip() if len(feed_part) > 1 else ""
             # Strip limit suffix like " (limit 50)" and elapsed time like " (elapsed 42s)"
-            current_feed = re.sub(r"\s*\((?:limit \d+|elapsed [^)]+)\)\s*", "", current_feed).strip()
-        # Per-feed success: "Feed OK: N new documents, M duplicates skipped"
-        if "feed ok" in lower:
-            stats["feedsReachable"] += 1
-            _extract_int_before(lower, "new documents", stats, "newDocsFound")
-            _extract_int_before(lower, "duplicates skipped", stats, "duplicatesSkipped")
-        # Per-feed unreachable: "Feed UNREACHABLE: ..."
-        if "feed unreachable" in lower:
-            stats["feedsUnreachable"] += 1
-            feed_name = line.strip().split(":", 1)[-1].strip() if ":" in line else current_feed
-            errored_feeds.append(f"{feed_name} (unreachable)")
-        # Per-feed crash: "Feed CRASHED: ..."
-        if "feed crashed" in lower:
-            stats["feedsUnreachable"] += 1
-            stats["fetchErrors"] += 1
-            feed_name = line.strip().split(":", 1)[-1].strip() if ":" in line else current_feed
-            errored_feeds.append(f"{feed_name} (crashed)")
-        # Per-feed errors: "Feed errors: N fetch errors, ..."
-        if "feed errors:" in lower:
-            stats["feedsReachable"] += 1  # feed was reachable but had article fetch errors
-            _extract_int_before(lower, "fetch errors", stats, "fetchErrors")
-            _extract_int_before(lower, "saved", stats, "newDocsFound")
-            _extract_int_before(lower, "duplicates skipped", stats, "duplicatesSkipped")
-            errored_feeds.append(f"{current_feed} (fetch errors)")
+            self.current_feed = _RE_FEED_SUFFIX.sub("", current_feed).strip()
+        # Per-feed status lines ("    Feed OK: ...", "    Feed CRASHED: ...")
+        # are mutually exclusive, so dispatch on the prefix once.
+        if lower.startswith(self._FEED_PREFIXES):
+            for prefix, handler in self._FEED_HANDLERS:
+                if lower.startswith(prefix):
+                    handler(self, line, lower)
+                    return
         # Summary line: "Fetched N items, skipped M, errors E. Feeds reachable: R/T."
         if "feeds reachable:" in lower:
-            m = re.search(r"feeds reachable:\s*(\d+)/(\d+)", lower)
+            m = _RE_REACHABLE.search(lower)
             if m:
                 summary_reachable = int(m.group(1))
                 summary_total = int(m.group(2))
@@ -295,272 +696,336 @@ def parse_ingest_output(stdout: str, stderr: str = "") -> dict:
                 if summary_unreachable > stats["feedsUnreachable"]:
                     stats["feedsUnreachable"] = summary_unreachable
             # Extract fetch errors from summary: "errors N"
-            err_match = re.search(r"errors\s+(\d+)", lower)
+            err_match = _RE_SUMMARY_ERRORS.search(lower)
             if err_match:
                 summary_errors = int(err_match.group(1))
                 if summary_errors > stats["fetchErrors"]:
                     stats["fetchErrors"] = summary_errors
-            continue  # Don't process summary line further (avoid false positives)
+            return  # Don't process summary line further (avoid false positives)
         # Legacy: "Saved N new documents"
-        if ("new documents" in lower or "saved" in lower) and "feed ok" not in lower and "feed errors:" not in lower:
-            for word in line.split():
-                if word.isdigit():
-                    stats["newDocsFound"] += int(word)
-                    break
+        if "new documents" in lower or "saved" in lower:
+            stats["newDocsFound"] += _first_int(line) or 0
         # Legacy: "Skipping N existing duplicates"
-        if "skip" in lower and ("exist" in lower or "duplicate" in lower) and "feed ok" not in lower and "feed errors:" not in lower:
-            for word in line.split():
-                if word.isdigit():
-                    stats["duplicatesSkipped"] += int(word)
-                    break
-
-    # Parse stderr for feed-specific diagnostic errors
-    for line in stderr.splitlines():
+        if "skip" in lower and ("exist" in lower or "duplicate" in lower):
+            stats["duplicatesSkipped"] += _first_int(line) or 0
+
+    def _feed_name(self, line: str) -> str:
+        return line.strip().split(":", 1)[-1].strip() if ":" in line else self.current_feed
+
+    def _on_feed_ok(self, line: str, lower: str) -> None:
+        # "Feed OK: N new documents, M duplicates skipped"
+        stats = self.stats
+        stats["feedsReachable"] += 1
+        _extract_int_before(lower, "new documents", stats, "newDocsFound")
+        _extract_int_before(lower, "duplicates skipped", stats, "duplicatesSkipped")
+
+    def _on_feed_unreachable(self, line: str, lower: str) -> None:
+        # "Feed UNREACHABLE: <name>"
+        self.stats["feedsUnreachable"] += 1
+        self.errored_feeds.append(f"{self._feed_name(line)} (unreachable)")
+
+    def _on_feed_crashed(self, line: str, lower: str) -> None:
+        # "Feed CRASHED: <name>"
+        self.stats["feedsUnreachable"] += 1
+        self.stats["fetchErrors"] += 1
+        self.errored_feeds.append(f"{self._feed_name(line)} (crashed)")
+
+    def _on_feed_errors(self, line: str, lower: str) -> None:
+        # "Feed errors: N fetch errors, M saved, K duplicates skipped"
+        stats = self.stats
+        stats["feedsReachable"] += 1  # feed was reachable but had article fetch errors
+        _extract_int_before(lower, "fetch errors", stats, "fetchErrors")
+        _extract_int_before(lower, "saved", stats, "newDocsFound")
+        _extract_int_before(lower, "duplicates skipped", stats, "duplicatesSkipped")
+        self.errored_feeds.append(f"{self.current_feed} (fetch errors)")
+
+    _FEED_HANDLERS = (
+        ("feed ok", _on_feed_ok),
+        ("feed unreachable", _on_feed_unreachable),
+        ("feed crashed", _on_feed_crashed),
+        ("feed errors:", _on_feed_errors),
+    )
+    _FEED_PREFIXES = tuple(prefix for prefix, _ in _FEED_HANDLERS)
+
+    def on_stderr_line(self, line: str) -> None:
+        # Parse stderr for feed-specific diagnostic errors
         lower = line.lower().strip()
         # Collect bozo exceptions as feed warnings
         if "bozo_exception=" in lower and "diag" in lower:
             # Extract feed URL from preceding [diag] line for context
             exc_part = line.strip().split("bozo_exception=")[-1] if "bozo_exception=" in line else ""
             if exc_part:
-                errored_feeds.append(f"bozo: {exc_part[:80]}")
+                self.errored_feeds.append(f"bozo: {exc_part[:80]}")
 
-    if errored_feeds:
-        stats["erroredFeeds"] = errored_feeds
-    return stats
+    def result(self) -> dict:
+        if self.errored_feeds:
+            self.stats["erroredFeeds"] = self.errored_feeds
+        return self.stats
 
 
-def parse_docpack_output(stdout: str) -> dict:
-    """Parse docpack stage stdout for stats."""
-    stats = {"docsBundled": 0, "qualifiedTotal": 0, "qualifiedExcluded": 0}
-    for line in stdout.splitlines():
+def parse_ingest_output(stdout: str, stderr: str = "") -> dict:
+    """Parse ingest stage stdout (and optionally stderr) for stats.
+
+    Args:
+        stdout: Captured stdout from ingest subprocess
+        stderr: Captured stderr from ingest subprocess (for diagnostics)
+
+    Returns:
+        Dict with feed-level stats and per-feed error details.
+    """
+    return IngestOutputParser.parse(stdout, stderr)
+
+
+class DocpackOutputParser(StageParser):
+    def __init__(self) -> None:
+        self.stats = {"docsBundled": 0, "qualifiedTotal": 0, "qualifiedExcluded": 0}
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
         if "bundled" in line.lower():
-            for word in line.split():
-                if word.isdigit():
-                    stats["docsBundled"] = int(word)
-                    break
+            n = _first_int(line)
+            if n is not None:
+                stats["docsBundled"] = n
         # "Qualified: 42 total, 17 excluded by budget"
         if line.startswith("Qualified:"):
-            parts = line.split(",")
-            for part in parts:
-                part = part.strip()
-                for word in part.split():
-                    if word.isdigit():
-                        if "total" in part:
-                            stats["qualifiedTotal"] = int(word)
-                        elif "excluded" in part:
-                            stats["qualifiedExcluded"] = int(word)
-                        break
-    return stats
+            for part in line.split(","):
+                n = _first_int(part)
+                if n is None:
+                    continue
+                if "total" in part:
+                    stats["qualifiedTotal"] = n
+                elif "excluded" in part:
+                    stats["qualifiedExcluded"] = n
 
 
-def parse_extract_output(stdout: str) -> dict:
-    """Parse extract stage stdout for stats."""
-    stats = {
-        "docsExtracted": 0,
-        "entitiesFound": 0,
-        "relationsFound": 0,
-        "validationErrors": 0,
-        "escalated": 0,
-        "unmappedRelationTypes": [],
-    }
-    for line in stdout.splitlines():
+def parse_docpack_output(stdout: str) -> dict:
+    """Parse docpack stage stdout for stats."""
+    return DocpackOutputParser.parse(stdout)
+
+
+class ExtractOutputParser(StageParser):
+    def __init__(self) -> None:
+        self.stats = {
+            "docsExtracted": 0,
+            "entitiesFound": 0,
+            "relationsFound": 0,
+            "validationErrors": 0,
+            "escalated": 0,
+            "unmappedRelationTypes": [],
+        }
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
         if line.startswith("Done."):
-            parts = line.split(",")
-            for part in parts:
-                part = part.strip()
+            for part in line.split(","):
                 if "Succeeded" in part:
-                    for word in part.split():
-                        if word.isdigit():
-                            stats["docsExtracted"] = int(word)
-                            break
+                    n = _first_int(part)
+                    if n is not None:
+                        stats["docsExtracted"] = n
                 if "Failed" in part:
-                    for word in part.split():
-                        if word.isdigit():
-                            stats["validationErrors"] = int(word)
-                            break
+                    n = _first_int(part)
+                    if n is not None:
+                        stats["validationErrors"] = n
                 if "Escalated" in part:
-                    for word in part.split():
-                        if "/" in word and word.split("/")[0].isdigit():
-                            stats["escalated"] = int(word.split("/")[0])
-                            break
-                        elif word.isdigit():
-                            stats["escalated"] = int(word)
-                            break
+                    n = _first_int(part, _RE_RATIO_TOKEN)
+                    if n is not None:
+                        stats["escalated"] = n
         # Count entities/relations from individual doc lines
         if "entities" in line and "relations" in line:
             parts = line.split("(")
             if len(parts) > 1:
                 inner = parts[-1].rstrip(")")
                 for token in inner.split(","):
-                    token = token.strip()
                     if "entit" in token:
-                        for w in token.split():
-                            if w.isdigit():
-                                stats["entitiesFound"] += int(w)
-                                break
+                        stats["entitiesFound"] += _first_int(token) or 0
                     if "relation" in token:
-                        for w in token.split():
-                            if w.isdigit():
-                                stats["relationsFound"] += int(w)
-                                break
+                        stats["relationsFound"] += _first_int(token) or 0
         # Capture unmapped relation types (e.g., "Unmapped relation types: WORKS_ON (1), LOCATED_IN (2)")
         if line.startswith("Unmapped relation types:"):
-            import re
-            for m in re.finditer(r"([A-Z_]+)\s*\((\d+)\)", line):
+            for m in _RE_UNMAPPED_TYPE.finditer(line):
                 stats["unmappedRelationTypes"].append(
                     {"type": m.group(1), "count": int(m.group(2))}
                 )
-    return stats
 
 
-def parse_import_output(stdout: str) -> dict:
-    """Parse import stage stdout for stats."""
-    stats = {
-        "filesImported": 0,
-        "entitiesNew": 0,
-        "entitiesResolved": 0,
-        "relations": 0,
-        "mentionsGenerated": 0,
-        "evidenceRecords": 0,
-    }
-    import re
-    for line in stdout.splitlines():
-        if "imported" in line.lower() and "extraction" in line.lower():
-            for word in line.split():
-                if word.isdigit():
-                    stats["filesImported"] = int(word)
-                    break
+def parse_extract_output(stdout: str) -> dict:
+    """Parse extract stage stdout for stats."""
+    return ExtractOutputParser.parse(stdout)
+
+
+_RE_IMPORT_NEW = re.compile(r"(\d+)\s+new")
+_RE_IMPORT_RESOLVED = re.compile(r"(\d+)\s+resolved")
+
+
+class ImportOutputParser(StageParser):
+    def __init__(self) -> None:
+        self.stats = {
+            "filesImported": 0,
+            "entitiesNew": 0,
+            "entitiesResolved": 0,
+            "relations": 0,
+            "mentionsGenerated": 0,
+            "evidenceRecords": 0,
+        }
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
+        lower = line.lower()
+        if "imported" in lower and "extraction" in lower:
+            n = _first_int(line)
+            if n is not None:
+                stats["filesImported"] = n
         # Match "4 new" pattern specifically
-        new_match = re.search(r"(\d+)\s+new", line.lower())
-        if new_match:
-            stats["entitiesNew"] = int(new_match.group(1))
-        resolved_match = re.search(r"(\d+)\s+resolved", line.lower())
-        if resolved_match:
-            stats["entitiesResolved"] = int(resolved_match.group(1))
+        if "new" in lower:
+            new_match = _RE_IMPORT_NEW.search(lower)
+            if new_match:
+                stats["entitiesNew"] = int(new_match.group(1))
+        if "resolved" in lower:
+            resolved_match = _RE_IMPORT_RESOLVED.search(lower)
+            if resolved_match:
+                stats["entitiesResolved"] = int(resolved_match.group(1))
+        if not line.lstrip().startswith("-"):
+            return
         # "- 12 relations" (but not lines containing "evidence" or "mentions")
-        if "relations" in line.lower() and "evidence" not in line.lower() and "mentions" not in line.lower() and line.strip().startswith("-"):
-            for word in line.split():
-                if word.isdigit():
-                    stats["relations"] = int(word)
-                    break
+        if "relations" in lower and "evidence" not in lower and "mentions" not in lower:
+            n = _first_int(line)
+            if n is not None:
+                stats["relations"] = n
         # "- 28 mentions (doc→entity)"
-        if "mentions" in line.lower() and line.strip().startswith("-"):
-            for word in line.split():
-                if word.isdigit():
-                    stats["mentionsGenerated"] = int(word)
-                    break
-        if "evidence" in line.lower() and line.strip().startswith("-"):
-            for word in line.split():
-                if word.isdigit():
-                    stats["evidenceRecords"] = int(word)
-                    break
-    return stats
+        if "mentions" in lower:
+            n = _first_int(line)
+            if n is not None:
+                stats["mentionsGenerated"] = n
+        if "evidence" in lower:
+            n = _first_int(line)
+            if n is not None:
+                stats["evidenceRecords"] = n
 
 
-def parse_export_output(stdout: str) -> dict:
-    """Parse export stage stdout for stats."""
-    stats = {"views": [], "totalNodes": 0, "totalEdges": 0}
-    for line in stdout.splitlines():
-        if "nodes" in line.lower() and "edges" in line.lower():
+def parse_import_output(stdout: str) -> dict:
+    """Parse import stage stdout for stats."""
+    return ImportOutputParser.parse(stdout)
+
+
+class ExportOutputParser(StageParser):
+    def __init__(self) -> None:
+        self.stats = {"views": [], "totalNodes": 0, "totalEdges": 0}
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
+        lower = line.lower()
+        if "nodes" in lower and "edges" in lower:
             view_name = ""
             nodes = 0
             edges = 0
             if "-" in line:
-                view_name = line.split("-")[-1].strip().split()[0] if "-" in line else ""
-            for i, word in enumerate(line.split()):
-                if word.startswith("(") and word[1:].isdigit():
-                    nodes = int(word[1:])
-                elif word.isdigit():
-                    # Check context
-                    words = line.split()
-                    idx = words.index(word) if word in words else -1
-                    if idx >= 0 and idx + 1 < len(words) and "node" in words[idx + 1]:
-                        nodes = int(word)
-                    elif idx >= 0 and idx + 1 < len(words) and "edge" in words[idx + 1]:
-                        edges = int(word)
+                tail = line.rpartition("-")[2].split(None, 1)
+                view_name = tail[0] if tail else ""
+            for m in _RE_GRAPH_COUNT.finditer(line):
+                following = m.group(3) or ""
+                if m.group(1):  # "(12"
+                    nodes = int(m.group(2))
+                elif "node" in following:
+                    nodes = int(m.group(2))
+                elif "edge" in following:
+                    edges = int(m.group(2))
             stats["totalNodes"] += nodes
             stats["totalEdges"] += edges
             if view_name:
                 stats["views"].append(view_name)
-    return stats
 
 
-def parse_movers_output(stdout: str) -> dict:
-    """Parse movers stage stdout for stats.
+def parse_export_output(stdout: str) -> dict:
+    """Parse export stage stdout for stats."""
+    return ExportOutputParser.parse(stdout)
+
 
-    Expected lines from run_movers.py:
+class MoversOutputParser(StageParser):
+    """Expected lines from run_movers.py:
         - "Exported Movers view to <path>"
         - "  - N rows (window: D days)"
     """
-    import re as _re
-    stats = {"moversRows": 0, "moversWindowDays": 0}
-    for line in stdout.splitlines():
-        m = _re.search(r"(\d+)\s+rows\s+\(window:\s+(\d+)\s+days\)", line)
+
+    def __init__(self) -> None:
+        self.stats = {"moversRows": 0, "moversWindowDays": 0}
+        self._found = False
+
+    def on_line(self, line: str) -> None:
+        if self._found:
+            return
+        m = _RE_MOVERS_ROWS.search(line)
         if m:
-            stats["moversRows"] = int(m.group(1))
-            stats["moversWindowDays"] = int(m.group(2))
-            break
-    return stats
+            self.stats["moversRows"] = int(m.group(1))
+            self.stats["moversWindowDays"] = int(m.group(2))
+            self._found = True
 
 
-def parse_trending_output(stdout: str) -> dict:
-    """Parse trending stage stdout for stats.
+def parse_movers_output(stdout: str) -> dict:
+    """Parse movers stage stdout for stats."""
+    return MoversOutputParser.parse(stdout)
+
 
-    Expected narrative lines from narratives.py:
+class TrendingOutputParser(StageParser):
+    """Expected narrative lines from narratives.py:
         - N LLM narratives returned
         - N narratives mapped to entity IDs
         - N name mismatches dropped (LLM name not in context)
         - N narrative context skipped (entity_id not in entities table)
     """
-    import re as _re
-    stats = {
-        "trendingNodes": 0,
-        "trendingEdges": 0,
-        "narrativesGenerated": 0,
-        "narrativesLlmReturned": 0,
-        "narrativesMapped": 0,
-        "narrativesMismatches": 0,
-        "narrativesContextSkipped": 0,
-    }
-    for line in stdout.splitlines():
+
+    def __init__(self) -> None:
+        self.stats = {
+            "trendingNodes": 0,
+            "trendingEdges": 0,
+            "narrativesGenerated": 0,
+            "narrativesLlmReturned": 0,
+            "narrativesMapped": 0,
+            "narrativesMismatches": 0,
+            "narrativesContextSkipped": 0,
+        }
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
         lower = line.strip().lower()
         if "nodes" in lower and "edges" in lower:
-            for i, word in enumerate(line.split()):
-                if word.isdigit():
-                    words = line.split()
-                    idx = words.index(word)
-                    if idx + 1 < len(words) and "node" in words[idx + 1]:
-                        stats["trendingNodes"] = int(word)
-                    elif idx + 1 < len(words) and "edge" in words[idx + 1]:
-                        stats["trendingEdges"] = int(word)
+            for m in _RE_GRAPH_COUNT.finditer(line):
+                if m.group(1):
+                    continue  # "(12" is not a bare count here
+                following = m.group(3) or ""
+                if "node" in following:
+                    stats["trendingNodes"] = int(m.group(2))
+                elif "edge" in following:
+                    stats["trendingEdges"] = int(m.group(2))
         # "Generated narratives for 10 entities"
         elif "generated narratives" in lower:
-            m = _re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["narrativesGenerated"] = int(m.group(1))
+                stats["narrativesGenerated"] = int(m.group())
         elif "llm narratives returned" in lower:
-            m = _re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["narrativesLlmReturned"] = int(m.group(1))
+                stats["narrativesLlmReturned"] = int(m.group())
         elif "narratives mapped to entity" in lower:
-            m = _re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["narrativesMapped"] = int(m.group(1))
+                stats["narrativesMapped"] = int(m.group())
         elif "name mismatches dropped" in lower:
-            m = _re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["narrativesMismatches"] = int(m.group(1))
+                stats["narrativesMismatches"] = int(m.group())
         elif "narrative context skipped" in lower:
-            m = _re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["narrativesContextSkipped"] = int(m.group(1))
-    return stats
+                stats["narrativesContextSkipped"] = int(m.group())
 
 
-def parse_synthesize_output(stdout: str) -> dict:
-    """Parse synthesize stage stdout for stats.
+def parse_trending_output(stdout: str) -> dict:
+    """Parse trending stage stdout for stats."""
+    return TrendingOutputParser.parse(stdout)
 
-    Expected output format from run_synthesize.py:
+
+class SynthesizeOutputParser(StageParser):
+    """Expected output format from run_synthesize.py:
         Synthesis complete:
           - 3 document clusters processed
           - 5 entities corroborated
@@ -568,43 +1033,48 @@ def parse_synthesize_output(stdout: str) -> dict:
           - 3 LLM calls
           - 1234ms
     """
-    import re
-    stats = {
-        "batchesProcessed": 0,
-        "entitiesCorroborated": 0,
-        "relationsInferred": 0,
-        "llmCalls": 0,
-        "durationMs": 0,
-    }
-    for line in stdout.splitlines():
+
+    def __init__(self) -> None:
+        self.stats = {
+            "batchesProcessed": 0,
+            "entitiesCorroborated": 0,
+            "relationsInferred": 0,
+            "llmCalls": 0,
+            "durationMs": 0,
+        }
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
         lower = line.strip().lower()
         if "document clusters processed" in lower or "clusters processed" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["batchesProcessed"] = int(m.group(1))
+                stats["batchesProcessed"] = int(m.group())
         elif "entities corroborated" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["entitiesCorroborated"] = int(m.group(1))
+                stats["entitiesCorroborated"] = int(m.group())
         elif "relations inferred" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["relationsInferred"] = int(m.group(1))
+                stats["relationsInferred"] = int(m.group())
         elif "llm calls" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["llmCalls"] = int(m.group(1))
+                stats["llmCalls"] = int(m.group())
         elif lower.endswith("ms") and lower.startswith("-"):
-            m = re.search(r"(\d+)ms", lower)
+            m = _RE_DURATION_MS.search(lower)
             if m:
                 stats["durationMs"] = int(m.group(1))
-    return stats
 
 
-def parse_resolve_output(stdout: str) -> dict:
-    """Parse resolve stage stdout for stats.
+def parse_synthesize_output(stdout: str) -> dict:
+    """Parse synthesize stage stdout for stats."""
+    return SynthesizeOutputParser.parse(stdout)
+
 
-    Expected output format from run_resolve.py:
+class ResolveOutputParser(StageParser):
+    """Expected output format from run_resolve.py:
         Resolution pass complete:
           - 42 entities checked
           - 3 merges performed
@@ -613,80 +1083,141 @@ def parse_resolve_output(stdout: str) -> dict:
           - 8 kept separate
           - 2 uncertain
     """
-    import re
-    stats = {
-        "entitiesChecked": 0,
-        "mergesPerformed": 0,
-        "disambigPairsEvaluated": 0,
-        "disambigMerges": 0,
-        "disambigKeptSeparate": 0,
-        "disambigUncertain": 0,
-    }
-    for line in stdout.splitlines():
+
+    def __init__(self) -> None:
+        self.stats = {
+            "entitiesChecked": 0,
+            "mergesPerformed": 0,
+            "disambigPairsEvaluated": 0,
+            "disambigMerges": 0,
+            "disambigKeptSeparate": 0,
+            "disambigUncertain": 0,
+        }
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
         lower = line.strip().lower()
         if "entities checked" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["entitiesChecked"] = int(m.group(1))
+                stats["entitiesChecked"] = int(m.group())
         elif "merges performed" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["mergesPerformed"] = int(m.group(1))
+                stats["mergesPerformed"] = int(m.group())
         elif "gray-zone pairs evaluated" in lower or "pairs evaluated" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["disambigPairsEvaluated"] = int(m.group(1))
+                stats["disambigPairsEvaluated"] = int(m.group())
         elif "llm-confirmed merges" in lower or "confirmed merges" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["disambigMerges"] = int(m.group(1))
+                stats["disambigMerges"] = int(m.group())
         elif "kept separate" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["disambigKeptSeparate"] = int(m.group(1))
+                stats["disambigKeptSeparate"] = int(m.group())
         elif "uncertain" in lower and "merges" not in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["disambigUncertain"] = int(m.group(1))
-    return stats
+                stats["disambigUncertain"] = int(m.group())
 
 
-def parse_infer_output(stdout: str) -> dict:
-    """Parse infer stage stdout for stats.
+def parse_resolve_output(stdout: str) -> dict:
+    """Parse resolve stage stdout for stats."""
+    return ResolveOutputParser.parse(stdout)
 
-    Expected output format from run_infer.py:
+
+class InferOutputParser(StageParser):
+    """Expected output format from run_infer.py:
         Inference pass complete:
           - 5 rules evaluated
           - 12 relations inferred
           - 3 skipped (already existed)
           - 450ms
     """
-    import re
-    stats = {
-        "rulesEvaluated": 0,
-        "relationsInferred": 0,
-        "relationsSkipped": 0,
-        "durationMs": 0,
-    }
-    for line in stdout.splitlines():
+
+    def __init__(self) -> None:
+        self.stats = {
+            "rulesEvaluated": 0,
+            "relationsInferred": 0,
+            "relationsSkipped": 0,
+            "durationMs": 0,
+        }
+
+    def on_line(self, line: str) -> None:
+        stats = self.stats
         lower = line.strip().lower()
         if "rules evaluated" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["rulesEvaluated"] = int(m.group(1))
+                stats["rulesEvaluated"] = int(m.group())
         elif "relations inferred" in lower:
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["relationsInferred"] = int(m.group(1))
+                stats["relationsInferred"] = int(m.group())
         elif "skipped" in lower and ("already existed" in lower or "relations" in lower):
-            m = re.search(r"(\d+)", line)
+            m = _RE_DIGITS.search(line)
             if m:
-                stats["relationsSkipped"] = int(m.group(1))
+                stats["relationsSkipped"] = int(m.group())
         elif lower.endswith("ms") and lower.startswith("-"):
-            m = re.search(r"(\d+)ms", lower)
+            m = _RE_DURATION_MS.search(lower)
             if m:
                 stats["durationMs"] = int(m.group(1))
-    return stats
+
+
+def parse_infer_output(stdout: str) -> dict:
+    """Parse infer stage stdout for stats."""
+    return InferOutputParser.parse(stdout)
+
+
+# linux/fs.h FICLONE: copy-on-write clone on Btrfs/XFS (reflink)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str | Path, dst: Path) -> None:
+    """Copy file contents only (no metadata), reflinking when possible.
+
+    Not a hardlink: a same-date re-export rewrites the source files in
+    place, which must not show up half-written in the live directory.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    # copyfile uses os.sendfile on Linux (no userspace buffer copies)
+    shutil.copyfile(src, dst)
+
+
+def _acquire_pipeline_lock(lock_path: Path) -> int | None:
+    """Create and flock the pipeline lock file.
+
+    Returns the open fd (held for the whole run; the kernel drops the lock
+    if the process dies) or None if another pipeline holds the lock.
+    """
+    while True:
+        fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+        if fcntl is None:
+            return fd
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        # The previous holder may have unlinked the file between our open()
+        # and flock(); only a lock on the file still at lock_path counts.
+        try:
+            if os.stat(lock_path).st_ino == os.fstat(fd).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+    os.ftruncate(fd, 0)
+    os.write(fd, f"{os.getpid()}\n".encode())
+    return fd
 
 
 def copy_graphs_to_live(graphs_dir: Path, run_date: str, web_live_dir: Path) -> bool:
@@ -705,8 +1236,12 @@ def copy_graphs_to_live(graphs_dir: Path, run_date: str, web_live_dir: Path) ->
         return False
 
     web_live_dir.mkdir(parents=True, exist_ok=True)
-    for json_file in source_dir.glob("*.json"):
-        shutil.copy2(json_file, web_live_dir / json_file.name)
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            # glob("*.json") skipped dotfiles; keep that
+            if entry.name.endswith(".json") and not entry.name.startswith(".") \
+                    and entry.is_file(follow_symlinks=False):
+                _clone_file(entry.path, web_live_dir / entry.name)
     return True
 
 
@@ -943,6 +1478,11 @@ def main() -> int:
         "--dry-run", action="store_true",
         help="Print what would be run without executing",
     )
+    parser.add_argument(
+        "--warm-workers", action="store_true",
+        help="Run non-streaming script stages in one persistent forked "
+             "Python worker instead of a fresh interpreter per stage",
+    )
     args = parser.parse_args()
 
     # Set active domain before any module imports that read the profile
@@ -993,7 +1533,10 @@ def main() -> int:
     # Lock file for safe-reboot awareness
     lock_path = project_root / "data" / "pipeline.lock"
 
-    # Define pipeline stages
+    # Define pipeline stages.  Stages run under a normal interpreter: -S
+    # would drop the venv's site-packages (and the editable install's .pth),
+    # and PYTHONDONTWRITEBYTECODE would only forfeit the .pyc cache.  Use
+    # --warm-workers to avoid per-stage interpreter startup instead.
     stages = [
         {
             "name": "collect",
@@ -1003,7 +1546,7 @@ def main() -> int:
                 "--domain", args.domain,
                 "--output-dir", extractions_dir,
             ],
-            "parse": parse_extract_output,
+            "parser": ExtractOutputParser,
             "fatal": False,
             "skip": args.skip_collect,
             "timeout": 300,
@@ -1015,7 +1558,7 @@ def main() -> int:
                 sys.executable, "scripts/import_extractions.py",
                 "--db", db_path,
             ],
-            "parse": parse_import_output,
+            "parser": ImportOutputParser,
             "fatal": False,
         },
         {
@@ -1026,7 +1569,7 @@ def main() -> int:
                 "--run-date", run_date,
                 "--domain", args.domain,
             ],
-            "parse": parse_synthesize_output,
+            "parser": SynthesizeOutputParser,
             "fatal": False,
         },
         {
@@ -1036,7 +1579,7 @@ def main() -> int:
                 "--db", db_path,
                 "--llm-disambiguate",
             ],
-            "parse": parse_resolve_output,
+            "parser": ResolveOutputParser,
             "fatal": False,
             "timeout": 1800,  # fuzzy pass + LLM disambiguation on 10k+ entity corpus
         },
@@ -1048,7 +1591,7 @@ def main() -> int:
                 "--run-date", run_date,
                 "--domain", args.domain,
             ],
-            "parse": parse_infer_output,
+            "parser": InferOutputParser,
             "fatal": False,
         },
         {
@@ -1059,8 +1602,12 @@ def main() -> int:
                 "--output-dir", graphs_dir,
                 "--date", run_date,
             ],
-            "parse": parse_export_output,
+            "parser": ExportOutputParser,
             "fatal": False,
+            # export and trending both only read the resolved graph, so they
+            # run concurrently. movers reads trending's trend_history rows
+            # and stays after them.
+            "group": "graphs",
         },
         {
             "name": "trending",
@@ -1071,8 +1618,9 @@ def main() -> int:
                 "--narratives",
                 "--narrative-model", "claude-haiku-4-5-20251001",
             ],
-            "parse": parse_trending_output,
+            "parser": TrendingOutputParser,
             "fatal": False,
+            "group": "graphs",
         },
         {
             "name": "movers",
@@ -1082,7 +1630,7 @@ def main() -> int:
                 "--output-dir", f"{graphs_dir}/{run_date}",
                 "--domain", args.domain,
             ],
-            "parse": parse_movers_output,
+            "parser": MoversOutputParser,
             "fatal": False,
         },
         # Phase 2: ingest + docpack + submit (staggered handoff — ADR-008)
@@ -1096,7 +1644,7 @@ def main() -> int:
                 "--db", db_path,
                 "--skip-existing",
             ],
-            "parse": parse_ingest_output,
+            "parser": IngestOutputParser,
             "fatal": True,
             "timeout": 2700,
             "stream": True,
@@ -1110,7 +1658,7 @@ def main() -> int:
                 "--label", docpack_label,
             ] + (["--budget", str(args.budget), "--stretch-max", str(args.stretch_max)]
                  if args.budget else []),
-            "parse": parse_docpack_output,
+            "parser": DocpackOutputParser,
             "fatal": False,
         },
         {
@@ -1122,7 +1670,7 @@ def main() -> int:
                 "--docpack", docpack_path,
                 "--date", run_date,
             ],
-            "parse": lambda s: {},
+            "parser": StageParser,
             "fatal": False,
             "skip": args.skip_submit,
             "timeout": 120,
@@ -1136,7 +1684,7 @@ def main() -> int:
                 "--days", "7",
                 "--log-suggestions",
             ],
-            "parse": lambda s: {},
+            "parser": StageParser,
             "fatal": False,
         },
     ]
@@ -1163,9 +1711,17 @@ def main() -> int:
             print(f"  {stage['name']}{label}: {' '.join(stage['cmd'])}")
         return 0
 
-    # Create lock file
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-    lock_path.touch()
+    # Create output directories once, before any stage runs, so an
+    # unwritable log dir fails fast instead of after the whole run.
+    log_dir = project_root / args.log_dir
+    for d in (lock_path.parent, log_dir):
+        d.mkdir(parents=True, exist_ok=True)
+
+    # Create and hold the lock file; a second concurrent run exits here
+    lock_fd = _acquire_pipeline_lock(lock_path)
+    if lock_fd is None:
+        print(f"Another pipeline run holds {lock_path}; exiting.", file=sys.stderr)
+        return 2
 
     pipeline_start = time.monotonic()
     overall_status = "success"
@@ -1206,112 +1762,148 @@ def main() -> int:
 
     print()
 
+    worker_pool = StageWorkerPool() if args.warm_workers else None
+
     try:
-        for stage in stages:
-            name = stage["name"]
+        pos = 0
+        aborted = False
+        while pos < len(stages) and not aborted:
+            # Consecutive stages sharing a "group" have no data dependency on
+            # each other and run concurrently; everything else runs alone.
+            batch = [stages[pos]]
+            group = stages[pos].get("group")
+            while group and pos + len(batch) < len(stages) \
+                    and stages[pos + len(batch)].get("group") == group:
+                batch.append(stages[pos + len(batch)])
+            pos += len(batch)
+
+            runnable = []
+            for stage in batch:
+                name = stage["name"]
+
+                if stage.get("skip", False):
+                    print(f"[{name}] SKIPPED")
+                    run_log["stages"][name] = {"status": "skipped"}
+                    continue
 
-            if stage.get("skip", False):
-                print(f"[{name}] SKIPPED")
-                run_log["stages"][name] = {"status": "skipped"}
-                continue
+                # Skip graph stages when batch collection is still pending (ADR-008)
+                _graph_stages = {"import", "synthesize", "resolve", "infer", "export", "trending", "movers"}
+                if skip_graph_stages and name in _graph_stages:
+                    print(f"[{name}] SKIPPED (batch pending)")
+                    run_log["stages"][name] = {"status": "skipped", "reason": "batch_pending"}
+                    continue
 
-            # Skip graph stages when batch collection is still pending (ADR-008)
-            _graph_stages = {"import", "synthesize", "resolve", "infer", "export", "trending", "movers"}
-            if skip_graph_stages and name in _graph_stages:
-                print(f"[{name}] SKIPPED (batch pending)")
-                run_log["stages"][name] = {"status": "skipped", "reason": "batch_pending"}
-                continue
+                # Skip submit if docpack produced nothing
+                if name == "submit" and docpack_bundled == 0:
+                    print(f"[{name}] SKIPPED (no docs in docpack)")
+                    run_log["stages"][name] = {"status": "skipped", "reason": "no_docpack"}
+                    continue
 
-            # Skip submit if docpack produced nothing
-            if name == "submit" and docpack_bundled == 0:
-                print(f"[{name}] SKIPPED (no docs in docpack)")
-                run_log["stages"][name] = {"status": "skipped", "reason": "no_docpack"}
+                runnable.append(stage)
+
+            if not runnable:
                 continue
+            if len(runnable) == 1:
+                stage = runnable[0]
+                stage_timeout = None if args.no_timeout else stage.get("timeout", 600)
+                print(f"[{stage['name']}] Running...", flush=True)
+                if worker_pool is not None and not stage.get("stream", False) \
+                        and worker_pool.can_run(stage["cmd"]):
+                    results = [worker_pool.run(stage["name"], stage["cmd"], cwd=project_root,
+                                               timeout=stage_timeout, parser=stage["parser"]())]
+                else:
+                    results = [run_stage(stage["name"], stage["cmd"], cwd=project_root,
+                                         timeout=stage_timeout, stream=stage.get("stream", False),
+                                         parser=stage["parser"]())]
+            else:
+                print(f"[{', '.join(st['name'] for st in runnable)}] Running concurrently...",
+                      flush=True)
+                results = run_stages_concurrently(
+                    [(st["name"], st["cmd"],
+                      None if args.no_timeout else st.get("timeout", 600),
+                      st["parser"]())
+                     for st in runnable],
+                    cwd=project_root,
+                )
 
-            stage_timeout = None if args.no_timeout else stage.get("timeout", 600)
-            stage_stream = stage.get("stream", False)
-            print(f"[{name}] Running...", flush=True)
-            result = run_stage(name, stage["cmd"], cwd=project_root,
-                               timeout=stage_timeout, stream=stage_stream)
+            for stage, result in zip(runnable, results):
+                name = stage["name"]
+                # Stage-specific stats, parsed line-by-line while the stage ran
+                stage_stats = result["stats"]
+
+                # collect rc=2 means batch still in flight — skip graph stages (ADR-008)
+                if name == "collect" and result.get("returncode") == 2:
+                    skip_graph_stages = True
+                    result["status"] = "ok"  # not a failure — expected pending state
+                    print(f"[collect] Batch still pending — graph stages will be skipped today")
+
+                run_log["stages"][name] = {
+                    "status": result["status"],
+                    "duration_sec": result["duration_sec"],
+                    **stage_stats,
+                }
+                if name == "collect" and skip_graph_stages:
+                    run_log["stages"][name]["batch_pending"] = True
 
-            # Parse stage-specific stats (ingest parser also uses stderr)
-            if name == "ingest":
-                stage_stats = stage["parse"](result["stdout"], result["stderr"])
-            else:
-                stage_stats = stage["parse"](result["stdout"])
-
-            # collect rc=2 means batch still in flight — skip graph stages (ADR-008)
-            if name == "collect" and result.get("returncode") == 2:
-                skip_graph_stages = True
-                result["status"] = "ok"  # not a failure — expected pending state
-                print(f"[collect] Batch still pending — graph stages will be skipped today")
-
-            run_log["stages"][name] = {
-                "status": result["status"],
-                "duration_sec": result["duration_sec"],
-                **stage_stats,
-            }
-            if name == "collect" and skip_graph_stages:
-                run_log["stages"][name]["batch_pending"] = True
-
-            # Track docpack output so submit can be skipped when empty
-            if name == "docpack":
-                docpack_bundled = stage_stats.get("docsBundled", 0)
-
-            # Always save raw stdout/stderr for diagnostics
-            if result["stdout"].strip():
-                run_log["stages"][name]["stdout"] = result["stdout"][-2000:]
-            if result["stderr"].strip():
-                run_log["stages"][name]["stderr"] = result["stderr"][-2000:]
-
-            if result["status"] == "ok":
-                # For ingest: always show key feed stats even when 0
-                if name == "ingest":
-                    errored = stage_stats.pop("erroredFeeds", [])
-                    key_stats = ["feedsChecked", "feedsReachable", "feedsUnreachable",
-                                 "newDocsFound", "fetchErrors"]
-                    parts = []
-                    for k in key_stats:
-                        v = stage_stats.get(k, 0)
-                        parts.append(f"{k}={v}")
-                    # Add non-zero secondary stats
-                    for k, v in stage_stats.items():
-                        if v and k not in key_stats:
-                            parts.append(f"{k}={v}")
-                    stats_str = ", ".join(parts)
-                    print(f"[{name}] OK ({result['duration_sec']}s) — {stats_str}")
-                    # Print errored feed names
-                    for feed_err in errored:
-                        print(f"  ERR: {feed_err}")
-                else:
-                    stats_str = ", ".join(f"{k}={v}" for k, v in stage_stats.items() if v) or "ok"
-                    print(f"[{name}] OK ({result['duration_sec']}s) — {stats_str}")
-                # Print stderr warnings even on success (more lines for ingest)
+                # Track docpack output so submit can be skipped when empty
+                if name == "docpack":
+                    docpack_bundled = stage_stats.get("docsBundled", 0)
+
+                # Always save raw stdout/stderr for diagnostics
+                if result["stdout"].strip():
+                    run_log["stages"][name]["stdout"] = result["stdout"][-STDOUT_TAIL_CHARS:]
                 if result["stderr"].strip():
-                    max_warn = 10 if name == "ingest" else 5
-                    stderr_lines = result["stderr"].strip().splitlines()
-                    # For ingest, show error-related lines first, then last N
+                    run_log["stages"][name]["stderr"] = result["stderr"][-STDOUT_TAIL_CHARS:]
+
+                if result["status"] == "ok":
+                    # For ingest: always show key feed stats even when 0
                     if name == "ingest":
-                        err_lines = [l for l in stderr_lines
-                                     if any(kw in l.lower() for kw in
-                                            ["bozo", "unreachable", "error", "crash", "fail"])]
-                        other_lines = [l for l in stderr_lines[-max_warn:]
-                                       if l not in err_lines]
-                        warn_lines = err_lines + other_lines
+                        errored = stage_stats.pop("erroredFeeds", [])
+                        key_stats = ["feedsChecked", "feedsReachable", "feedsUnreachable",
+                                     "newDocsFound", "fetchErrors"]
+                        parts = []
+                        for k in key_stats:
+                            v = stage_stats.get(k, 0)
+                            parts.append(f"{k}={v}")
+                        # Add non-zero secondary stats
+                        for k, v in stage_stats.items():
+                            if v and k not in key_stats:
+                                parts.append(f"{k}={v}")
+                        stats_str = ", ".join(parts)
+                        print(f"[{name}] OK ({result['duration_sec']}s) — {stats_str}")
+                        # Print errored feed names
+                        for feed_err in errored:
+                            print(f"  ERR: {feed_err}")
                     else:
-                        warn_lines = stderr_lines[-max_warn:]
-                    for line in warn_lines[:max_warn]:
-                        print(f"  WARN: {line.strip()}")
-            else:
-                error_msg = result["stderr"][-200:] if result["stderr"] else "unknown error"
-                print(f"[{name}] FAILED (rc={result['returncode']}): {error_msg}")
-                run_log["stages"][name]["error"] = error_msg
-                failed_stages.append(name)
-
-                if stage["fatal"]:
-                    overall_status = "failed"
-                    print(f"\nFatal stage '{name}' failed. Aborting pipeline.")
-                    break
+                        stats_str = ", ".join(f"{k}={v}" for k, v in stage_stats.items() if v) or "ok"
+                        print(f"[{name}] OK ({result['duration_sec']}s) — {stats_str}")
+                    # Print stderr warnings even on success (more lines for ingest)
+                    if result["stderr"].strip():
+                        max_warn = 10 if name == "ingest" else 5
+                        stderr_lines = result["stderr"].strip().splitlines()
+                        # For ingest, show error-related lines first, then last N
+                        if name == "ingest":
+                            err_lines = [l for l in stderr_lines
+                                         if any(kw in l.lower() for kw in
+                                                ["bozo", "unreachable", "error", "crash", "fail"])]
+                            other_lines = [l for l in stderr_lines[-max_warn:]
+                                           if l not in err_lines]
+                            warn_lines = err_lines + other_lines
+                        else:
+                            warn_lines = stderr_lines[-max_warn:]
+                        for line in warn_lines[:max_warn]:
+                            print(f"  WARN: {line.strip()}")
+                else:
+                    error_msg = result["stderr"][-200:] if result["stderr"] else "unknown error"
+                    print(f"[{name}] FAILED (rc={result['returncode']}): {error_msg}")
+                    run_log["stages"][name]["error"] = error_msg
+                    failed_stages.append(name)
+
+                    if stage["fatal"]:
+                        overall_status = "failed"
+                        aborted = True
+                        print(f"\nFatal stage '{name}' failed. Aborting pipeline.")
+                        break
 
         # Copy graphs to live directory if requested
         if args.copy_to_live and overall_status != "failed":
@@ -1326,8 +1918,11 @@ def main() -> int:
                 print(f"\nWARNING: No graphs found for {run_date} to copy")
 
     finally:
-        # Remove lock file
+        if worker_pool is not None:
+            worker_pool.close()
+        # Remove lock file (marker for safe-reboot checks), then release it
         lock_path.unlink(missing_ok=True)
+        os.close(lock_fd)
 
     # Finalize run log
     total_duration = time.monotonic() - pipeline_start
@@ -1341,11 +1936,13 @@ def main() -> int:
         run_log["failedStages"] = failed_stages
 
     # Write log file
-    log_dir = project_root / args.log_dir
-    log_dir.mkdir(parents=True, exist_ok=True)
     log_path = log_dir / f"pipeline_{run_date}.json"
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(run_log, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        log_path.write_bytes(orjson.dumps(
+            run_log, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(log_path, "w", encoding="utf-8") as f:
+            json.dump(run_log, f, indent=2, ensure_ascii=False)
 
     # Persist pipeline_runs and funnel_stats to DB
     _persist_run_stats(project_root / db_path, run_log, args.domain)
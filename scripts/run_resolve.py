@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import argparse
 import os
+import sqlite3
 import sys
 from pathlib import Path
 
@@ -43,6 +44,63 @@ _bootstrap_domain()
 
 from db import init_db
 from resolve import EntityResolver
+from util.stage_stats import emit_stage_stats
+
+
+def resolve_entities(
+    conn: sqlite3.Connection,
+    threshold: float = 0.85,
+    dry_run: bool = False,
+    since: str | None = None,
+    llm_disambiguate: bool = False,
+    disambiguate_model: str = "gpt-5-nano",
+    jobs: int = 1,
+) -> int:
+    """Run (or, with dry_run, only size up) a resolution pass on conn.
+
+    The caller owns the connection; it is not closed here.
+    """
+    if dry_run:
+        # Count entities and report what would happen
+        cursor = conn.execute("SELECT COUNT(*) FROM entities")
+        total = cursor.fetchone()[0]
+        print(f"[DRY RUN] {total} entities in database (threshold: {threshold})")
+        if since:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM entities WHERE last_seen >= ?", (since,)
+            )
+            recent = cursor.fetchone()[0]
+            print(f"[DRY RUN] {recent} entities seen since {since} would be re-checked")
+        print("[DRY RUN] Run without --dry-run to perform merges")
+        return 0
+
+    resolver = EntityResolver(conn, threshold=threshold)
+    stats = resolver.run_resolution_pass(
+        llm_disambiguate=llm_disambiguate,
+        disambiguate_model=disambiguate_model,
+        dry_run=dry_run,
+        since=since,
+        jobs=jobs,
+    )
+
+    print("Resolution pass complete:")
+    print(f"  - {stats['entities_checked']} entities checked")
+    print(f"  - {stats['merges_performed']} merges performed")
+
+    if llm_disambiguate:
+        print(f"  - {stats.get('disambig_pairs_evaluated', 0)} gray-zone pairs evaluated by LLM")
+        print(f"  - {stats.get('disambig_merges', 0)} LLM-confirmed merges")
+        print(f"  - {stats.get('disambig_kept_separate', 0)} kept separate")
+        print(f"  - {stats.get('disambig_uncertain', 0)} uncertain")
+    emit_stage_stats({
+        "entitiesChecked": stats["entities_checked"],
+        "mergesPerformed": stats["merges_performed"],
+        "disambigPairsEvaluated": stats.get("disambig_pairs_evaluated", 0),
+        "disambigMerges": stats.get("disambig_merges", 0),
+        "disambigKeptSeparate": stats.get("disambig_kept_separate", 0),
+        "disambigUncertain": stats.get("disambig_uncertain", 0),
+    })
+    return 0
 
 
 def main() -> int:
@@ -65,6 +123,16 @@ def main() -> int:
         "--dry-run", action="store_true",
         help="Report potential merges without applying",
     )
+    parser.add_argument(
+        "--since", default=None, metavar="YYYY-MM-DD",
+        help="Incremental pass: only compare pairs involving entities with "
+             "last_seen on or after this date (default: all entities)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, metavar="N",
+        help="Worker processes for the similarity scan (default: 1; "
+             "0 = one per CPU)",
+    )
     parser.add_argument(
         "--llm-disambiguate", action="store_true",
         help="Enable LLM-powered disambiguation for gray-zone pairs",
@@ -79,36 +147,26 @@ def main() -> int:
     if args.db is None:
         args.db = str(get_db_path(args.domain))
 
-    conn = init_db(Path(args.db))
-    resolver = EntityResolver(conn, threshold=args.threshold)
-
-    if args.dry_run:
-        # Count entities and report what would happen
-        cursor = conn.execute("SELECT COUNT(*) FROM entities")
-        total = cursor.fetchone()[0]
-        print(f"[DRY RUN] {total} entities in database (threshold: {args.threshold})")
-        print("[DRY RUN] Run without --dry-run to perform merges")
+    db_path = Path(args.db)
+    if args.dry_run and db_path.exists():
+        # Counting only: a read-only connection never takes the write lock,
+        # so a dry run can overlap a still-writing import stage.
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    else:
+        conn = init_db(db_path)
+
+    try:
+        return resolve_entities(
+            conn,
+            threshold=args.threshold,
+            dry_run=args.dry_run,
+            since=args.since,
+            llm_disambiguate=args.llm_disambiguate,
+            disambiguate_model=args.disambiguate_model,
+            jobs=args.jobs or os.cpu_count() or 1,
+        )
+    finally:
         conn.close()
-        return 0
-
-    stats = resolver.run_resolution_pass(
-        llm_disambiguate=args.llm_disambiguate,
-        disambiguate_model=args.disambiguate_model,
-        dry_run=args.dry_run,
-    )
-
-    print("Resolution pass complete:")
-    print(f"  - {stats['entities_checked']} entities checked")
-    print(f"  - {stats['merges_performed']} merges performed")
-
-    if args.llm_disambiguate:
-        print(f"  - {stats.get('disambig_pairs_evaluated', 0)} gray-zone pairs evaluated by LLM")
-        print(f"  - {stats.get('disambig_merges', 0)} LLM-confirmed merges")
-        print(f"  - {stats.get('disambig_kept_separate', 0)} kept separate")
-        print(f"  - {stats.get('disambig_uncertain', 0)} uncertain")
-
-    conn.close()
-    return 0
 
 
 if __name__ == "__main__":
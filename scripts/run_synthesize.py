@@ -31,6 +31,7 @@ _load_dotenv()
 
 from db import init_db
 from domain import set_active_domain
+from util.stage_stats import emit_stage_stats
 
 
 def main() -> int:
@@ -73,6 +74,13 @@ def main() -> int:
     print(f"  - {result.relations_inferred} relations inferred")
     print(f"  - {result.llm_calls} LLM calls")
     print(f"  - {result.duration_ms}ms")
+    emit_stage_stats({
+        "batchesProcessed": result.batches_processed,
+        "entitiesCorroborated": result.entities_corroborated,
+        "relationsInferred": result.relations_inferred,
+        "llmCalls": result.llm_calls,
+        "durationMs": result.duration_ms,
+    })
 
     conn.close()
     return 0
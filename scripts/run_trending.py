@@ -9,10 +9,17 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import sqlite3
 import sys
 from datetime import date
 from pathlib import Path
 
+# Optional fast JSON encoder; stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src/ to import path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
@@ -49,6 +56,69 @@ from graph import GraphExporter, build_node, build_edge
 from trend import TrendScorer
 from util import utc_now_iso
 
+# Trend score fields copied onto each trending node
+_TREND_FIELDS = ("velocity", "novelty", "trend_score", "mention_count_7d", "mention_count_30d")
+_ZERO_SCORES = dict.fromkeys(_TREND_FIELDS, 0)
+
+
+def _trend_node(entity: dict, trend_lookup: dict, bridge_ids: set[str]) -> dict:
+    """Build a Cytoscape node enriched with trend scores (bridges get zeroes)."""
+    node = build_node(entity)
+    eid = entity["entity_id"]
+    node["data"].update(trend_lookup.get(eid, _ZERO_SCORES))
+    if eid in bridge_ids:
+        node["data"]["bridge"] = True
+    return node
+
+
+def _date_range(entities: list[dict]) -> tuple[str | None, str | None]:
+    """Earliest first_seen and latest last_seen (YYYY-MM-DD) in one pass."""
+    first = last = None
+    for e in entities:
+        fs = e.get("first_seen")
+        ls = e.get("last_seen")
+        if fs and (first is None or fs < first):
+            first = fs
+        if ls and (last is None or ls > last):
+            last = ls
+    return (first[:10] if first else None), (last[:10] if last else None)
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write data as indented JSON (same layout with or without orjson)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _ndjson_line(obj: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _write_ndjson(path: Path, data: dict) -> None:
+    """Write a Cytoscape export as NDJSON: the meta line, then one element
+    per line tagged with its Cytoscape group ("nodes"/"edges")."""
+    with open(path, "wb") as f:
+        f.write(_ndjson_line({"meta": data["meta"]}))
+        for group, elements in data["elements"].items():
+            for element in elements:
+                f.write(_ndjson_line({"group": group, **element}))
+
+
+def _write_export(output_dir: Path, data: dict, streaming: bool) -> Path:
+    """Write trending.json, or trending.ndjson when streaming."""
+    if streaming:
+        output_path = output_dir / "trending.ndjson"
+        _write_ndjson(output_path, data)
+    else:
+        output_path = output_dir / "trending.json"
+        _write_json(output_path, data)
+    return output_path
+
 
 def export_trending(
     db_path: Path,
@@ -56,6 +126,8 @@ def export_trending(
     top_n: int,
     generate_narratives: bool = False,
     narrative_model: str = "claude-haiku-4-5-20251001",
+    conn: sqlite3.Connection | None = None,
+    streaming: bool = False,
 ) -> Path:
     """Export trending entities in Cytoscape.js format.
 
@@ -65,24 +137,33 @@ def export_trending(
         top_n: Maximum trending entities
         generate_narratives: If True, add LLM-generated "WHY" narratives
         narrative_model: Model for narrative generation
+        conn: Open connection to reuse (left open); if None, one is
+            opened on db_path and closed before returning
+        streaming: Write trending.ndjson (meta line, then one element
+            per line) instead of a single indented trending.json
 
     Returns:
         Path to created file
     """
-    conn = init_db(db_path)
+    owns_conn = conn is None
+    if owns_conn:
+        conn = init_db(db_path)
     scorer = TrendScorer(conn)
     exporter = GraphExporter(conn)
 
     # Step 1: Get trending entity IDs and scores
     trending = scorer.get_trending(limit=top_n)
     trending_ids = {t["entity_id"] for t in trending}
-    trend_lookup = {t["entity_id"]: t for t in trending}
+    # Node score fields, pre-filled once per trending entity
+    trend_lookup = {
+        t["entity_id"]: {k: t.get(k, 0) for k in _TREND_FIELDS} for t in trending
+    }
 
     if not trending_ids:
         print("No trending entities found")
-        conn.close()
+        if owns_conn:
+            conn.close()
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / "trending.json"
         empty = {
             "meta": {
                 "view": "trending",
@@ -93,13 +174,13 @@ def export_trending(
             },
             "elements": {"nodes": [], "edges": []},
         }
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(empty, f, indent=2, ensure_ascii=False)
-        return output_path
+        return _write_export(output_dir, empty, streaming)
 
     # Step 2: Get relations where BOTH source and target are trending,
-    # then aggregate cross-document edges into single logical edges
-    all_relations = exporter._get_relations()
+    # then aggregate cross-document edges into single logical edges.
+    # Only relations touching a trending entity are loaded; the bridge
+    # search below never looks at any other relation.
+    all_relations = exporter._get_relations_touching(trending_ids)
     filtered_relations = [
         r for r in all_relations
         if r["source_id"] in trending_ids and r["target_id"] in trending_ids
@@ -162,33 +243,10 @@ def export_trending(
     merged_relations = exporter._aggregate_relations(all_view_relations)
 
     # Step 3: Build Cytoscape nodes with trend scores
-    all_entities = exporter._get_entities()
     included_ids = trending_ids | bridge_ids
-    filtered_entities = [e for e in all_entities if e["entity_id"] in included_ids]
-
-    nodes = []
-    first_seen_dates = []
-    last_seen_dates = []
-
-    for entity in filtered_entities:
-        node = build_node(entity)
-        eid = entity["entity_id"]
-        # Enrich with trend scores (bridge entities get zeroes)
-        scores = trend_lookup.get(eid, {})
-        node["data"]["velocity"] = scores.get("velocity", 0)
-        node["data"]["novelty"] = scores.get("novelty", 0)
-        node["data"]["trend_score"] = scores.get("trend_score", 0)
-        node["data"]["mention_count_7d"] = scores.get("mention_count_7d", 0)
-        node["data"]["mention_count_30d"] = scores.get("mention_count_30d", 0)
-        if eid in bridge_ids:
-            node["data"]["bridge"] = True
-        nodes.append(node)
-
-        # Collect dates for meta range
-        if entity.get("first_seen"):
-            first_seen_dates.append(entity["first_seen"][:10])
-        if entity.get("last_seen"):
-            last_seen_dates.append(entity["last_seen"][:10])
+    filtered_entities = exporter._get_entities_by_ids(included_ids)
+
+    nodes = [_trend_node(e, trend_lookup, bridge_ids) for e in filtered_entities]
 
     edges = exporter._build_aggregated_edges(merged_relations)
     edges = GraphExporter._strip_orphan_edges(nodes, edges)
@@ -212,8 +270,8 @@ def export_trending(
             print(f"  - Narrative generation failed (non-fatal): {e}")
 
     # Step 4: Compute date range
-    date_start = min(first_seen_dates) if first_seen_dates else None
-    date_end = max(last_seen_dates) if last_seen_dates else date.today().isoformat()
+    date_start, date_end = _date_range(filtered_entities)
+    date_end = date_end or date.today().isoformat()
 
     # Step 5: Write Cytoscape format with meta object
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -231,14 +289,13 @@ def export_trending(
         },
     }
 
-    output_path = output_dir / "trending.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    output_path = _write_export(output_dir, output, streaming)
 
     print(f"Exported trending view to {output_path}")
     print(f"  - {len(nodes)} nodes, {len(edges)} edges (top {top_n} by trend score)")
 
-    conn.close()
+    if owns_conn:
+        conn.close()
     return output_path
 
 
@@ -275,6 +332,11 @@ def main() -> int:
         "--narrative-model", default="claude-haiku-4-5-20251001",
         help="Model for narrative generation (default: claude-haiku-4-5-20251001)",
     )
+    parser.add_argument(
+        "--streaming", action="store_true",
+        help="Write trending.ndjson (meta line, then one element per line) "
+             "instead of trending.json",
+    )
     args = parser.parse_args()
 
     from util.paths import get_db_path, get_graphs_dir
@@ -288,6 +350,7 @@ def main() -> int:
         top_n=args.top_n,
         generate_narratives=args.narratives,
         narrative_model=args.narrative_model,
+        streaming=args.streaming,
     )
 
     return 0
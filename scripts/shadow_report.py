@@ -13,12 +13,13 @@ from __future__ import annotations
 import argparse
 import sqlite3
 import sys
+from collections import defaultdict
 from datetime import date, timedelta
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from db import init_db, list_understudy_models, get_understudy_summary
+from db import init_db
 
 # Promotion thresholds from docs/llm-selection.md
 PROMOTE_SCHEMA_PASS = 95.0
@@ -30,26 +31,34 @@ PROMOTE_MIN_DOCS = 100
 STALE_WARN_DAYS = 14
 STALE_CRITICAL_DAYS = 30
 
+# Source freshness table row: source, docs, latest date, status
+_FRESHNESS_ROW = "  {:<30} {:>5} {:<18} {}".format
 
-def grade(value: float | None, threshold: float) -> str:
-    """Return a pass/fail marker for a metric."""
-    if value is None:
-        return "  --"
-    return " OK " if value >= threshold else "MISS"
+# Pass/fail marker indexed by the metric's promotion check (False, True)
+_GRADE = ("MISS", " OK ")
 
 
 def run_source_freshness(conn: sqlite3.Connection) -> None:
     """Report per-source content freshness from the documents table."""
+    # Latest date and its age in days are computed in SQL; days_ago is NULL
+    # when the latest date is missing or unparseable.
     cursor = conn.execute(
         """
         SELECT source,
-               COUNT(*) as total_docs,
-               MAX(published_at) as latest_published,
-               MAX(fetched_at) as latest_fetched,
-               MIN(published_at) as earliest_published
-        FROM documents
-        WHERE status != 'error'
-        GROUP BY source
+               total_docs,
+               substr(latest, 1, 10) as latest_date,
+               CAST(julianday('now', 'localtime', 'start of day')
+                    - julianday(substr(latest, 1, 10)) AS INTEGER) as days_ago
+        FROM (
+            SELECT source,
+                   COUNT(*) as total_docs,
+                   MAX(published_at) as latest_published,
+                   COALESCE(NULLIF(MAX(published_at), ''),
+                            NULLIF(MAX(fetched_at), '')) as latest
+            FROM documents
+            WHERE status != 'error'
+            GROUP BY source
+        )
         ORDER BY latest_published DESC
         """
     )
@@ -59,39 +68,112 @@ def run_source_freshness(conn: sqlite3.Connection) -> None:
         print("\nSource Freshness: no documents found")
         return
 
-    today = date.today().isoformat()
-    print("\nSource Freshness")
-    print("=" * 80)
-    print(f"  {'Source':<30} {'Docs':>5} {'Latest Published':<18} {'Status'}")
-    print(f"  {'─' * 72}")
-
+    lines = [
+        "\nSource Freshness",
+        "=" * 80,
+        _FRESHNESS_ROW("Source", "Docs", "Latest Published", "Status"),
+        f"  {'─' * 72}",
+    ]
     for row in rows:
         source = row["source"] or "unknown"
         total = row["total_docs"]
-        latest = row["latest_published"] or row["latest_fetched"] or ""
-        latest_date = latest[:10] if latest else "--"
-
-        # Compute staleness
-        status = ""
-        if latest_date and latest_date != "--":
-            try:
-                days_ago = (date.fromisoformat(today) - date.fromisoformat(latest_date)).days
-                if days_ago > STALE_CRITICAL_DAYS:
-                    status = f"STALE ({days_ago}d ago)"
-                elif days_ago > STALE_WARN_DAYS:
-                    status = f"WARN ({days_ago}d ago)"
-                else:
-                    status = f"active ({days_ago}d ago)"
-            except ValueError:
-                status = "unknown date"
-        else:
+        latest_date = row["latest_date"] or "--"
+        days_ago = row["days_ago"]
+
+        # Classify staleness
+        if latest_date == "--":
             status = "no dates"
+        elif days_ago is None:
+            status = "unknown date"
+        elif days_ago > STALE_CRITICAL_DAYS:
+            status = f"STALE ({days_ago}d ago)"
+        elif days_ago > STALE_WARN_DAYS:
+            status = f"WARN ({days_ago}d ago)"
+        else:
+            status = f"active ({days_ago}d ago)"
 
         # Truncate long source names
         display_source = source[:28] + ".." if len(source) > 30 else source
-        print(f"  {display_source:<30} {total:>5} {latest_date:<18} {status}")
-
-    print()
+        lines.append(_FRESHNESS_ROW(display_source, total, latest_date, status))
+
+    # One write for the whole table instead of a print per source
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
+
+
+def load_shadow_stats(
+    conn: sqlite3.Connection, min_date: str | None
+) -> tuple[dict[str, dict], dict[str, list[tuple]]]:
+    """Per-model summaries and per-day rows from extraction_comparison.
+
+    Two grouped queries cover every understudy model.  Every model ever
+    compared gets a summary; only rows on/after min_date are counted.
+
+    Returns:
+        (summary by model, daily rows by model newest first); both empty
+        when the table does not exist (dropped by migrate_batch_api.py).
+        Daily rows are plain (run_date, docs, valid, entity_pct,
+        relation_pct, avg_ms) tuples.
+    """
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='extraction_comparison'"
+    ).fetchone()
+    if not has_table:
+        return {}, {}
+
+    # One SQL text whether or not a window is given, so both report modes
+    # share a single cached statement and query plan.
+    in_window = "(:min_date IS NULL OR run_date >= :min_date)"
+    params = {"min_date": min_date or None}
+
+    summaries: dict[str, dict] = {}
+    for row in conn.execute(
+        f"""
+        SELECT understudy_model,
+               COALESCE(SUM({in_window}), 0) as docs,
+               COALESCE(AVG(CASE WHEN {in_window} THEN schema_valid END), 0) * 100
+                   as pass_rate,
+               AVG(CASE WHEN {in_window} THEN entity_overlap_pct END) as entity_pct,
+               AVG(CASE WHEN {in_window} THEN relation_overlap_pct END) as relation_pct,
+               AVG(CASE WHEN {in_window} THEN understudy_duration_ms END) as avg_ms
+        FROM extraction_comparison
+        GROUP BY understudy_model
+        ORDER BY understudy_model
+        """,
+        params,
+    ):
+        summaries[row["understudy_model"]] = {
+            "total_docs": row["docs"],
+            "schema_pass_rate": row["pass_rate"],
+            "avg_entity_overlap_pct": row["entity_pct"],
+            "avg_relation_overlap_pct": row["relation_pct"],
+            "avg_duration_ms": row["avg_ms"],
+        }
+
+    # Plain tuples for the per-day rows: the report loop unpacks them
+    # positionally instead of paying for sqlite3.Row name lookups.
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    daily: dict[str, list[tuple]] = defaultdict(list)
+    for model, *day in cursor.execute(
+        f"""
+        SELECT understudy_model,
+               run_date,
+               COUNT(*) as docs,
+               SUM(schema_valid) as valid,
+               AVG(entity_overlap_pct) as entity_pct,
+               AVG(relation_overlap_pct) as relation_pct,
+               AVG(understudy_duration_ms) as avg_ms
+        FROM extraction_comparison
+        WHERE {in_window}
+        GROUP BY understudy_model, run_date
+        ORDER BY understudy_model, run_date DESC
+        """,
+        params,
+    ):
+        daily[model].append(tuple(day))
+
+    return summaries, daily
 
 
 def run_escalation_stats(extractions_dir: Path) -> None:
@@ -166,9 +248,29 @@ def run_escalation_stats(extractions_dir: Path) -> None:
     print()
 
 
-def run_report(db_path: Path, days: int | None, domain: str | None = None) -> int:
+def run_report(
+    db_path: Path,
+    days: int | None,
+    domain: str | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> int:
+    """Print the freshness, escalation and shadow sections.
+
+    An open ``conn`` is reused and left open; otherwise one is opened on
+    db_path and closed before returning.
+    """
+    owns_conn = conn is None
+    if owns_conn:
+        conn = init_db(db_path)
+    try:
+        return _print_report(conn, days, domain)
+    finally:
+        if owns_conn:
+            conn.close()
+
+
+def _print_report(conn: sqlite3.Connection, days: int | None, domain: str | None) -> int:
     from util.paths import get_extractions_dir
-    conn = init_db(db_path)
 
     # Source freshness first — always useful
     run_source_freshness(conn)
@@ -177,51 +279,38 @@ def run_report(db_path: Path, days: int | None, domain: str | None = None) -> in
     extractions_dir = get_extractions_dir(domain)
     run_escalation_stats(extractions_dir)
 
-    models = list_understudy_models(conn)
+    min_date = None
+    if days:
+        min_date = (date.today() - timedelta(days=days)).isoformat()
+
+    summaries, daily_by_model = load_shadow_stats(conn, min_date)
 
-    if not models:
+    if not summaries:
         print("No shadow comparison data found.")
         print("Run: make shadow-only  (or make extract --shadow)")
         return 0
 
-    min_date = None
-    if days:
-        min_date = (date.today() - timedelta(days=days)).isoformat()
+    # The shadow section is collected and written once rather than
+    # printed line by line (models x days rows).
+    lines: list[str] = []
+    out = lines.append
 
     window_label = f"last {days} days" if days else "all time"
-    print(f"Shadow Mode Report ({window_label})")
-    print(f"Promotion: schema >= {PROMOTE_SCHEMA_PASS}%, "
-          f"entity >= {PROMOTE_ENTITY_OVERLAP}%, "
-          f"relation >= {PROMOTE_RELATION_OVERLAP}%, "
-          f"docs >= {PROMOTE_MIN_DOCS}")
-    print("=" * 80)
-
-    for model in models:
-        summary = get_understudy_summary(conn, model, min_date=min_date)
+    out(f"Shadow Mode Report ({window_label})")
+    out(f"Promotion: schema >= {PROMOTE_SCHEMA_PASS}%, "
+        f"entity >= {PROMOTE_ENTITY_OVERLAP}%, "
+        f"relation >= {PROMOTE_RELATION_OVERLAP}%, "
+        f"docs >= {PROMOTE_MIN_DOCS}")
+    out("=" * 80)
+
+    for model, summary in summaries.items():
         total = summary["total_docs"]
         schema = summary["schema_pass_rate"]
         entity = summary["avg_entity_overlap_pct"]
         relation = summary["avg_relation_overlap_pct"]
         duration = summary["avg_duration_ms"]
 
-        # Per-day breakdown
-        cursor = conn.execute(
-            """
-            SELECT run_date,
-                   COUNT(*) as docs,
-                   SUM(schema_valid) as valid,
-                   AVG(entity_overlap_pct) as entity_pct,
-                   AVG(relation_overlap_pct) as relation_pct,
-                   AVG(understudy_duration_ms) as avg_ms
-            FROM extraction_comparison
-            WHERE understudy_model = ?
-            """ + (" AND run_date >= ?" if min_date else "") + """
-            GROUP BY run_date
-            ORDER BY run_date DESC
-            """,
-            (model, min_date) if min_date else (model,),
-        )
-        daily_rows = cursor.fetchall()
+        daily_rows = daily_by_model.get(model, [])
 
         # Promotion check
         schema_ok = schema >= PROMOTE_SCHEMA_PASS
@@ -230,23 +319,23 @@ def run_report(db_path: Path, days: int | None, domain: str | None = None) -> in
         docs_ok = total >= PROMOTE_MIN_DOCS
         promotable = schema_ok and entity_ok and relation_ok and docs_ok
 
-        print(f"\n  {model}")
-        print(f"  {'─' * 60}")
-        print(f"  Docs processed:    {total:>6}       [{grade(total, PROMOTE_MIN_DOCS)}] need {PROMOTE_MIN_DOCS}+")
-        print(f"  Schema pass rate:  {schema:>6.1f}%      [{grade(schema, PROMOTE_SCHEMA_PASS)}] need {PROMOTE_SCHEMA_PASS}%+")
+        out(f"\n  {model}")
+        out(f"  {'─' * 60}")
+        out(f"  Docs processed:    {total:>6}       [{_GRADE[docs_ok]}] need {PROMOTE_MIN_DOCS}+")
+        out(f"  Schema pass rate:  {schema:>6.1f}%      [{_GRADE[schema_ok]}] need {PROMOTE_SCHEMA_PASS}%+")
         if entity is not None:
-            print(f"  Entity overlap:    {entity:>6.1f}%      [{grade(entity, PROMOTE_ENTITY_OVERLAP)}] need {PROMOTE_ENTITY_OVERLAP}%+")
+            out(f"  Entity overlap:    {entity:>6.1f}%      [{_GRADE[entity_ok]}] need {PROMOTE_ENTITY_OVERLAP}%+")
         else:
-            print(f"  Entity overlap:       --         [  --] need {PROMOTE_ENTITY_OVERLAP}%+")
+            out(f"  Entity overlap:       --         [  --] need {PROMOTE_ENTITY_OVERLAP}%+")
         if relation is not None:
-            print(f"  Relation overlap:  {relation:>6.1f}%      [{grade(relation, PROMOTE_RELATION_OVERLAP)}] need {PROMOTE_RELATION_OVERLAP}%+")
+            out(f"  Relation overlap:  {relation:>6.1f}%      [{_GRADE[relation_ok]}] need {PROMOTE_RELATION_OVERLAP}%+")
         else:
-            print(f"  Relation overlap:     --         [  --] need {PROMOTE_RELATION_OVERLAP}%+")
+            out(f"  Relation overlap:     --         [  --] need {PROMOTE_RELATION_OVERLAP}%+")
         if duration is not None:
-            print(f"  Avg latency:       {duration:>6.0f}ms")
+            out(f"  Avg latency:       {duration:>6.0f}ms")
 
         if promotable:
-            print(f"  >>> READY FOR PROMOTION <<<")
+            out(f"  >>> READY FOR PROMOTION <<<")
         elif total > 0:
             gaps = []
             if not docs_ok:
@@ -257,21 +346,21 @@ def run_report(db_path: Path, days: int | None, domain: str | None = None) -> in
                 gaps.append(f"entity {entity or 0:.0f}% < {PROMOTE_ENTITY_OVERLAP}%")
             if not relation_ok:
                 gaps.append(f"relation {relation or 0:.0f}% < {PROMOTE_RELATION_OVERLAP}%")
-            print(f"  Gaps: {'; '.join(gaps)}")
+            out(f"  Gaps: {'; '.join(gaps)}")
 
         # Daily breakdown
         if daily_rows:
-            print(f"\n  Daily breakdown:")
-            print(f"  {'Date':<12} {'Docs':>5} {'Schema%':>8} {'Entity%':>8} {'Rel%':>8} {'Avg ms':>8}")
-            for row in daily_rows:
-                d_schema = (row["valid"] / row["docs"] * 100) if row["docs"] else 0
-                d_entity = f"{row['entity_pct']:>7.0f}%" if row["entity_pct"] is not None else f"{'--':>8}"
-                d_relation = f"{row['relation_pct']:>7.0f}%" if row["relation_pct"] is not None else f"{'--':>8}"
-                d_ms = f"{row['avg_ms']:>8.0f}" if row["avg_ms"] is not None else f"{'--':>8}"
-                print(f"  {row['run_date']:<12} {row['docs']:>5} {d_schema:>7.0f}% {d_entity} {d_relation} {d_ms}")
-
-    print("\n" + "=" * 80)
-    conn.close()
+            out(f"\n  Daily breakdown:")
+            out(f"  {'Date':<12} {'Docs':>5} {'Schema%':>8} {'Entity%':>8} {'Rel%':>8} {'Avg ms':>8}")
+            for run_date, docs, valid, entity_pct, relation_pct, avg_ms in daily_rows:
+                d_schema = (valid / docs * 100) if docs else 0
+                d_entity = f"{entity_pct:>7.0f}%" if entity_pct is not None else f"{'--':>8}"
+                d_relation = f"{relation_pct:>7.0f}%" if relation_pct is not None else f"{'--':>8}"
+                d_ms = f"{avg_ms:>8.0f}" if avg_ms is not None else f"{'--':>8}"
+                out(f"  {run_date:<12} {docs:>5} {d_schema:>7.0f}% {d_entity} {d_relation} {d_ms}")
+
+    out("\n" + "=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
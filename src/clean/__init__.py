@@ -5,10 +5,18 @@ Extracts main content from HTML, removing navigation, ads, and other boilerplate
 
 from __future__ import annotations
 
+import hashlib
 import re
+from collections import OrderedDict
 from typing import Any, Optional
 
-from bs4 import BeautifulSoup, Comment, NavigableString
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+try:
+    import lxml  # noqa: F401
+    _PARSER = "lxml"
+except ImportError:  # optional speedup; the pure-Python parser is the fallback
+    _PARSER = "html.parser"
 
 
 # Tags to completely remove (including their content)
@@ -54,11 +62,9 @@ BOILERPLATE_PATTERNS = [
     r"categories",
 ]
 
-# Compiled regex for boilerplate detection
-BOILERPLATE_REGEX = re.compile(
-    "|".join(BOILERPLATE_PATTERNS),
-    re.IGNORECASE
-)
+# Compiled regex for boilerplate detection.  The patterns are lowercase
+# and callers lowercase the class/id string, so no IGNORECASE folding.
+BOILERPLATE_REGEX = re.compile("|".join(BOILERPLATE_PATTERNS))
 
 # Tags/classes that likely contain main content
 CONTENT_SELECTORS = [
@@ -77,8 +83,38 @@ CONTENT_SELECTORS = [
 ]
 
 
-def _is_boilerplate(element) -> bool:
-    """Check if an element is likely boilerplate based on class/id."""
+def _selector_key(selector: str) -> tuple[Optional[str], str]:
+    """(attribute, value) for a .class, #id, [attr=val] or tag selector.
+
+    Tag selectors use None as the attribute.
+    """
+    if selector.startswith("."):
+        return ("class", selector[1:])
+    if selector.startswith("#"):
+        return ("id", selector[1:])
+    if selector.startswith("["):
+        match = re.fullmatch(r"\[(\w+)=(\w+)\]", selector)
+        if not match:
+            raise ValueError(f"Unsupported content selector: {selector}")
+        return (match.group(1), match.group(2))
+    return (None, selector)
+
+
+# CONTENT_SELECTORS as (attribute, value) -> priority (lower wins), and
+# the attributes those selectors look at
+_CONTENT_RANK: dict[tuple[Optional[str], str], int] = {}
+for _rank, _selector in enumerate(CONTENT_SELECTORS):
+    _CONTENT_RANK.setdefault(_selector_key(_selector), _rank)
+del _rank, _selector
+_CONTENT_ATTRS = tuple({attr for attr, _ in _CONTENT_RANK if attr is not None})
+
+
+def _is_boilerplate(element, cache: Optional[dict[tuple, bool]] = None) -> bool:
+    """Check if an element is likely boilerplate based on class/id.
+
+    *cache* memoizes the pattern check per (classes, id) signature, so
+    repeated markup such as 40 identical menu items is matched once.
+    """
     # Check if element is still valid (not decomposed)
     if not hasattr(element, 'name') or element.name is None:
         return False
@@ -93,73 +129,86 @@ def _is_boilerplate(element) -> bool:
     classes = element.get("class", [])
     if isinstance(classes, str):
         classes = [classes]
-    class_str = " ".join(classes)
-
     element_id = element.get("id", "")
+    if not classes and not element_id:
+        return False
 
-    # Check class and id against boilerplate patterns
-    if BOILERPLATE_REGEX.search(class_str):
-        return True
-    if element_id and BOILERPLATE_REGEX.search(element_id):
-        return True
+    key = (tuple(classes), element_id)
+    if cache is not None and key in cache:
+        return cache[key]
 
-    return False
+    # Check class and id against boilerplate patterns in one search; no
+    # pattern contains a space, so a match cannot span the joined parts
+    result = BOILERPLATE_REGEX.search(
+        " ".join((*classes, element_id)).lower()
+    ) is not None
+    if cache is not None:
+        cache[key] = result
+    return result
 
 
 def _remove_boilerplate(soup: BeautifulSoup) -> None:
     """Remove boilerplate elements from soup in place."""
-    # Remove tags that should be completely removed
-    for tag in REMOVE_TAGS:
-        for element in list(soup.find_all(tag)):
-            element.decompose()
-
-    # Remove HTML comments
-    for comment in list(soup.find_all(string=lambda text: isinstance(text, Comment))):
-        comment.extract()
-
-    # Collect boilerplate elements first, then remove
-    # (to avoid modifying during iteration)
+    # One walk over the tree collects removed tags (REMOVE_TAGS and
+    # boilerplate by tag/class/id) and HTML comments; removal happens
+    # afterwards so the walk never sees a modified tree.
     to_remove = []
-    for element in soup.find_all(True):
-        if _is_boilerplate(element):
-            to_remove.append(element)
-
-    for element in to_remove:
-        # Check if element is still in the tree (not already removed as child of another)
-        if element.parent is not None:
-            element.decompose()
+    cache: dict[tuple, bool] = {}
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            if node.name in REMOVE_TAGS or _is_boilerplate(node, cache):
+                to_remove.append(node)
+        elif isinstance(node, Comment):
+            to_remove.append(node)
+
+    for node in to_remove:
+        # Skip nodes already destroyed along with a removed ancestor
+        if node.decomposed:
+            continue
+        if isinstance(node, Comment):
+            node.extract()
+        else:
+            node.decompose()
+
+
+def _content_rank(element: Tag) -> Optional[int]:
+    """Priority of the best CONTENT_SELECTORS entry matching element."""
+    rank = _CONTENT_RANK.get((None, element.name))
+    attrs = element.attrs
+    if not attrs:
+        return rank
+    for attr in _CONTENT_ATTRS:
+        value = attrs.get(attr)
+        if not value:
+            continue
+        for v in (value if isinstance(value, list) else (value,)):
+            r = _CONTENT_RANK.get((attr, v))
+            if r is not None and (rank is None or r < rank):
+                rank = r
+    return rank
 
 
 def _find_main_content(soup: BeautifulSoup) -> Optional[BeautifulSoup]:
     """Try to find the main content container."""
-    for selector in CONTENT_SELECTORS:
-        if selector.startswith("."):
-            element = soup.find(class_=selector[1:])
-        elif selector.startswith("#"):
-            element = soup.find(id=selector[1:])
-        elif selector.startswith("["):
-            # Handle attribute selectors like [role=main]
-            match = re.match(r"\[(\w+)=(\w+)\]", selector)
-            if match:
-                element = soup.find(attrs={match.group(1): match.group(2)})
-            else:
-                element = None
-        else:
-            element = soup.find(selector)
-
-        if element:
-            return element
+    # One walk ranks every element against all selectors at once; the
+    # first element (document order) with the best rank wins, exactly as
+    # trying each selector with soup.find() in priority order would.
+    best = None
+    best_rank = len(CONTENT_SELECTORS)
+    for element in soup.find_all(True):
+        rank = _content_rank(element)
+        if rank is not None and rank < best_rank:
+            best, best_rank = element, rank
+            if rank == 0:
+                break
 
-    return None
+    return best
 
 
 def _normalize_whitespace(text: str) -> str:
     """Normalize whitespace in text."""
-    # Replace multiple whitespace with single space
-    text = re.sub(r"\s+", " ", text)
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    return text
+    # Collapse whitespace runs to single spaces and strip both ends
+    return " ".join(text.split())
 
 
 def _extract_text(element) -> str:
@@ -167,35 +216,36 @@ def _extract_text(element) -> str:
     if element is None:
         return ""
 
-    # Get text, separating block elements with newlines
-    texts = []
-    for child in element.descendants:
-        if isinstance(child, NavigableString) and not isinstance(child, Comment):
-            text = str(child).strip()
-            if text:
-                texts.append(text)
-
-    text = " ".join(texts)
-    return _normalize_whitespace(text)
+    # Join the text nodes first and split once: one C-level split over the
+    # whole text instead of a Python-level generator step per word
+    strings = [
+        child
+        for child in element.descendants
+        if isinstance(child, NavigableString) and not isinstance(child, Comment)
+    ]
+    return " ".join(" ".join(strings).split())
 
 
-def extract_content(html: str) -> str:
+def extract_content(html: str, soup: Optional[BeautifulSoup] = None) -> str:
     """Extract main content from HTML, removing boilerplate.
 
     Args:
         html: Raw HTML string
+        soup: html already parsed; boilerplate is removed from it in place
 
     Returns:
         Cleaned text content
     """
-    if not html or not html.strip():
+    # isspace() answers the same question as strip() without copying html
+    if not html or html.isspace():
         return ""
 
     # Check if it's plain text (no HTML tags)
     if "<" not in html:
         return _normalize_whitespace(html)
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, _PARSER)
 
     # Remove boilerplate
     _remove_boilerplate(soup)
@@ -216,13 +266,14 @@ def extract_content(html: str) -> str:
     return text
 
 
-def extract_title(html: str) -> Optional[str]:
+def extract_title(html: str, soup: Optional[BeautifulSoup] = None) -> Optional[str]:
     """Extract title from HTML.
 
     Prefers h1 over title tag.
 
     Args:
         html: Raw HTML string
+        soup: html already parsed (not modified)
 
     Returns:
         Title string or None
@@ -230,7 +281,8 @@ def extract_title(html: str) -> Optional[str]:
     if not html:
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, _PARSER)
 
     # Try h1 first
     h1 = soup.find("h1")
@@ -249,11 +301,52 @@ def extract_title(html: str) -> Optional[str]:
     return None
 
 
-def extract_metadata(html: str) -> dict[str, Any]:
+# <meta> (attribute, value) -> metadata field.  Keys for the same field
+# are listed in priority order; the first one present with a value wins.
+_META_MAP: dict[tuple[str, str], str] = {
+    ("name", "author"): "author",
+    ("name", "description"): "description",
+    ("property", "article:published_time"): "published",
+    ("name", "date"): "published",
+    ("name", "pubdate"): "published",
+    ("property", "og:published_time"): "published",
+    ("property", "og:title"): "og_title",
+    ("property", "og:description"): "og_description",
+}
+
+# Field -> its _META_MAP keys in priority order (fields in output order)
+_META_FIELDS: dict[str, list[tuple[str, str]]] = {}
+for _key, _field in _META_MAP.items():
+    _META_FIELDS.setdefault(_field, []).append(_key)
+del _key, _field
+
+# Attributes read for a field's value, first non-empty wins (default: content)
+_META_VALUE_ATTRS: dict[str, tuple[str, ...]] = {
+    "published": ("content", "datetime"),
+}
+
+# Open Graph fields that are only used when the plain field is missing
+_META_FALLBACK_FOR: dict[str, str] = {
+    "og_title": "title",
+    "og_description": "description",
+}
+
+
+def _first_attr(element: Tag, attrs: tuple[str, ...]) -> Optional[str]:
+    """First non-empty value among attrs of element."""
+    for attr in attrs:
+        value = element.get(attr)
+        if value:
+            return value
+    return None
+
+
+def extract_metadata(html: str, soup: Optional[BeautifulSoup] = None) -> dict[str, Any]:
     """Extract metadata from HTML meta tags.
 
     Args:
         html: Raw HTML string
+        soup: html already parsed (not modified)
 
     Returns:
         Dictionary of metadata
@@ -261,51 +354,56 @@ def extract_metadata(html: str) -> dict[str, Any]:
     if not html:
         return {}
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, _PARSER)
     metadata = {}
 
-    # Author
-    author_meta = soup.find("meta", attrs={"name": "author"})
-    if author_meta and author_meta.get("content"):
-        metadata["author"] = author_meta["content"]
-
-    # Description
-    desc_meta = soup.find("meta", attrs={"name": "description"})
-    if desc_meta and desc_meta.get("content"):
-        metadata["description"] = desc_meta["content"]
-
-    # Published date - check various sources
-    date_selectors = [
-        ("meta", {"property": "article:published_time"}),
-        ("meta", {"name": "date"}),
-        ("meta", {"name": "pubdate"}),
-        ("meta", {"property": "og:published_time"}),
-        ("time", {"itemprop": "datePublished"}),
-    ]
+    # Index the first <meta> per mapped (attribute, value) in a single walk;
+    # each entry matches what soup.find("meta", attrs=...) returned.
+    metas: dict[tuple[str, str], Any] = {}
+    for meta in soup.find_all("meta"):
+        for attr in ("name", "property"):
+            value = meta.get(attr)
+            if isinstance(value, str) and (attr, value) in _META_MAP:
+                metas.setdefault((attr, value), meta)
+
+    for field, keys in _META_FIELDS.items():
+        if _META_FALLBACK_FOR.get(field) in metadata:
+            continue
+        value_attrs = _META_VALUE_ATTRS.get(field, ("content",))
+        for key in keys:
+            element = metas.get(key)
+            if element is None:
+                continue
+            value = _first_attr(element, value_attrs)
+            if value:
+                metadata[field] = value
+                break
 
-    for tag, attrs in date_selectors:
-        element = soup.find(tag, attrs=attrs)
+    # Published date from <time itemprop="datePublished"> as a last resort
+    if "published" not in metadata:
+        element = soup.find("time", attrs={"itemprop": "datePublished"})
         if element:
-            date_val = element.get("content") or element.get("datetime")
-            if date_val:
-                metadata["published"] = date_val
-                break
+            value = _first_attr(element, _META_VALUE_ATTRS["published"])
+            if value:
+                metadata["published"] = value
 
-    # Open Graph title/description as fallback
-    og_title = soup.find("meta", attrs={"property": "og:title"})
-    if og_title and og_title.get("content") and "title" not in metadata:
-        metadata["og_title"] = og_title["content"]
+    return metadata
 
-    og_desc = soup.find("meta", attrs={"property": "og:description"})
-    if og_desc and og_desc.get("content") and "description" not in metadata:
-        metadata["og_description"] = og_desc["content"]
 
-    return metadata
+# clean_document results by blake2b digest of the HTML, least recently
+# used first.  Keyed by digest so the cache never holds the raw pages.
+_CLEAN_CACHE_SIZE = 1024
+_clean_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
 
 
 def clean_document(html: str) -> dict[str, Any]:
     """Clean an HTML document and extract structured data.
 
+    Results are memoized on a hash of the HTML, so re-cleaning an
+    identical page (retries, re-fetches) skips parsing.  Each call gets
+    its own copy of the result dict.
+
     Args:
         html: Raw HTML string
 
@@ -315,8 +413,36 @@ def clean_document(html: str) -> dict[str, Any]:
             - title: Extracted title
             - metadata: Extracted metadata
     """
+    if not html:
+        return {"content": "", "title": None, "metadata": {}}
+
+    key = hashlib.blake2b(
+        html.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    result = _clean_cache.get(key)
+    if result is None:
+        result = _clean_document(html)
+        _clean_cache[key] = result
+        if len(_clean_cache) > _CLEAN_CACHE_SIZE:
+            _clean_cache.popitem(last=False)
+    else:
+        _clean_cache.move_to_end(key)
+    return {**result, "metadata": dict(result["metadata"])}
+
+
+clean_document.cache_clear = _clean_cache.clear
+
+
+def _clean_document(html: str) -> dict[str, Any]:
+    """Uncached clean_document() for non-empty html."""
+    # Parse once for all three extractors.  Title and metadata read the
+    # tree first; content extraction then strips boilerplate in place
+    # (which can remove <h1>s and <meta> tags they rely on).
+    soup = BeautifulSoup(html, _PARSER)
+    title = extract_title(html, soup=soup)
+    metadata = extract_metadata(html, soup=soup)
     return {
-        "content": extract_content(html),
-        "title": extract_title(html),
-        "metadata": extract_metadata(html),
+        "content": extract_content(html, soup=soup),
+        "title": title,
+        "metadata": metadata,
     }
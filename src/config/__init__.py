@@ -11,6 +11,11 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml; pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
+
 
 # --------------------------------------------------------------------------- #
 # Export / UI defaults
@@ -85,7 +90,7 @@ def load_feeds(
 
     try:
         content = config_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {config_path}: {e}") from e
 
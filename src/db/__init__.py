@@ -5,15 +5,121 @@ Provides CRUD operations for the knowledge graph storage.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Parser / encoder for the aliases/external_ids JSON columns
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor on conn that returns plain tuples.
+
+    init_db sets sqlite3.Row on the connection; queries that only read
+    columns by position use this to skip building a Row per result row.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
+def _row_to_entity(row: sqlite3.Row, parse_json: bool = True) -> dict[str, Any]:
+    """Entity dict from an entities row, with JSON fields parsed.
+
+    With parse_json=False, aliases/external_ids stay raw JSON strings.
+    """
+    entity = dict(row)
+    if not parse_json:
+        return entity
+    if entity.get("aliases"):
+        entity["aliases"] = _json_loads(entity["aliases"])
+    if entity.get("external_ids"):
+        entity["external_ids"] = _json_loads(entity["external_ids"])
+    return entity
+
+
+_SCHEMA_PATH = Path(__file__).resolve().parents[2] / "schemas" / "sqlite.sql"
+
+# Cache the schema text and its hash (they don't change within a run)
+_SCHEMA_SQL: Optional[str] = None
+_SCHEMA_HASH: Optional[str] = None
 
 
 def _schema_path() -> Path:
     """Return path to SQL schema file."""
-    return Path(__file__).resolve().parents[2] / "schemas" / "sqlite.sql"
+    return _SCHEMA_PATH
+
+
+def _get_schema() -> str:
+    global _SCHEMA_SQL
+    if _SCHEMA_SQL is None:
+        _SCHEMA_SQL = _schema_path().read_text(encoding="utf-8")
+    return _SCHEMA_SQL
+
+
+def _get_schema_hash() -> str:
+    global _SCHEMA_HASH
+    if _SCHEMA_HASH is None:
+        _SCHEMA_HASH = hashlib.sha256(_get_schema().encode("utf-8")).hexdigest()
+    return _SCHEMA_HASH
+
+
+def _stored_schema_hash(conn: sqlite3.Connection) -> Optional[str]:
+    """Return the schema hash recorded by the last init_db, if any."""
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='_meta'"
+    ).fetchone():
+        return None
+    row = conn.execute("SELECT value FROM _meta WHERE key = 'schema_hash'").fetchone()
+    return row[0] if row else None
+
+
+# Prepared statements kept per connection (sqlite3 default: 128).  The
+# code base issues a few hundred distinct statements; a long-lived shared
+# connection (scripts/pipeline.py) would otherwise evict and re-prepare
+# the hot inserts and lookups.
+_CACHED_STATEMENTS = 512
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Per-connection tuning applied by init_db.
+
+    WAL lets readers (e.g. export/trending) run while another stage
+    writes; the mode is persistent in the database file and needs the
+    database directory to be writable for its -wal/-shm sidecar files.
+    foreign_keys stays off: MENTIONS edges use doc: node ids as
+    source_id, which the relations -> entities foreign key would reject.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # 64 MB page cache (negative values are KiB) and 256 MB of mmap reads
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+
+
+def _connect(db_path: Path, **kwargs: Any) -> sqlite3.Connection:
+    """Open a connection with the module's row factory and PRAGMAs."""
+    conn = sqlite3.connect(db_path, cached_statements=_CACHED_STATEMENTS, **kwargs)
+    conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn)
+    return conn
 
 
 def init_db(db_path: Path) -> sqlite3.Connection:
@@ -21,6 +127,8 @@ def init_db(db_path: Path) -> sqlite3.Connection:
 
     On existing databases, runs a one-time migration to remove duplicate
     relations and add the dedup unique index if it doesn't exist yet.
+    The schema DDL only runs when the schema file differs from the one
+    last applied (tracked by hash in the _meta table).
 
     Args:
         db_path: Path to SQLite database file
@@ -30,8 +138,7 @@ def init_db(db_path: Path) -> sqlite3.Connection:
     """
     db_path.parent.mkdir(parents=True, exist_ok=True)
     is_existing = db_path.exists() and db_path.stat().st_size > 0
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    conn = _connect(db_path)
 
     # For existing DBs, clean duplicates before applying schema (which
     # includes the UNIQUE INDEX that would fail if dupes exist).
@@ -50,18 +157,48 @@ def init_db(db_path: Path) -> sqlite3.Connection:
                 if removed:
                     print(f"[db] Removed {removed} duplicate relation(s) during migration")
 
-    schema = _schema_path().read_text(encoding="utf-8")
-    conn.executescript(schema)
-    conn.commit()
+    # Re-running every CREATE ... IF NOT EXISTS is skipped when this exact
+    # schema file was already applied to the database.
+    schema_hash = _get_schema_hash()
+    if _stored_schema_hash(conn) != schema_hash:
+        conn.executescript(_get_schema())
+        conn.execute(
+            "INSERT OR REPLACE INTO _meta (key, value) VALUES ('schema_hash', ?)",
+            (schema_hash,),
+        )
+        conn.commit()
 
     # Migrations: add new columns to existing databases
     if is_existing:
         _migrate_documents_extraction_cols(conn)
         _migrate_documents_source_type(conn)
+        _migrate_extraction_comparison_index(conn)
+        _analyze_once(conn)
 
     return conn
 
 
+def _analyze_once(conn: sqlite3.Connection) -> None:
+    """Collect planner statistics the first time a populated DB is opened.
+
+    Without sqlite_stat1 the planner guesses index selectivity (e.g. type
+    vs. (type, first_seen) for date-range listings).  analysis_limit
+    samples each index instead of reading it in full, so this stays cheap
+    on large tables.  Databases without relations yet are skipped: stats
+    on empty tables would be useless and would stop this from ever
+    running again.
+    """
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+    ).fetchone():
+        return
+    if not conn.execute("SELECT 1 FROM relations LIMIT 1").fetchone():
+        return
+    conn.execute("PRAGMA analysis_limit=1000")
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
 def _migrate_documents_extraction_cols(conn: sqlite3.Connection) -> None:
     """Add extracted_by, quality_score, escalation_failed columns if missing."""
     cols = {
@@ -92,6 +229,118 @@ def _migrate_documents_source_type(conn: sqlite3.Connection) -> None:
         conn.commit()
 
 
+def _migrate_extraction_comparison_index(conn: sqlite3.Connection) -> None:
+    """Index legacy extraction_comparison tables for shadow_report.py.
+
+    The table is not part of the schema (migrate_batch_api.py drops it),
+    so the index is only added where the table still exists.  It covers
+    the per-model / per-day aggregates in load_shadow_stats.
+    """
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='extraction_comparison'"
+    ).fetchone():
+        return
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_extcmp_model_date'"
+    ).fetchone():
+        return
+    conn.execute(
+        """
+        CREATE INDEX idx_extcmp_model_date
+        ON extraction_comparison(understudy_model, run_date, schema_valid,
+                                 entity_overlap_pct, relation_overlap_pct,
+                                 understudy_duration_ms)
+        """
+    )
+    conn.commit()
+
+
+class DBPool:
+    """Per-thread read connections plus one shared, locked writer.
+
+    Under WAL, readers on their own connections see the last committed
+    state and never wait on the writer.  SQLite allows one writer at a
+    time, so writes go through a single connection serialized by a lock
+    instead of contending for the database lock across connections.
+
+    The schema is applied once by init_db when the pool is created;
+    reader connections only get the PRAGMAs and are opened query_only.
+
+    Usage:
+        pool = DBPool(db_path)
+        entities = list_entity_names(pool.reader())
+        with pool.writer() as conn:
+            insert_entity(conn, ..., commit=False)
+        pool.close()
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        init_db(db_path).close()
+        # Used from whichever thread holds the write lock
+        self._writer = _connect(db_path, check_same_thread=False)
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    def reader(self) -> sqlite3.Connection:
+        """This thread's read-only connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can run from any
+            # thread; each reader is otherwise used by its own thread.
+            conn = _connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA query_only=ON")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """The writer connection, held exclusively for the with-block.
+
+        Commits on normal exit and rolls back if the block raises.
+        """
+        with self._write_lock:
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.rollback()
+                raise
+            self._writer.commit()
+
+    def close(self) -> None:
+        """Close the writer and every reader the pool opened."""
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        with self._write_lock:
+            self._writer.close()
+
+
+# Insert, or on conflict keep first_seen and overwrite the other columns
+# only where the new value is non-NULL.
+_UPSERT_ENTITY = """
+    INSERT INTO entities (entity_id, name, type, aliases, external_ids, first_seen, last_seen)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(entity_id) DO UPDATE SET
+        name = COALESCE(excluded.name, entities.name),
+        type = COALESCE(excluded.type, entities.type),
+        aliases = COALESCE(excluded.aliases, entities.aliases),
+        external_ids = COALESCE(excluded.external_ids, entities.external_ids),
+        last_seen = COALESCE(excluded.last_seen, entities.last_seen)
+    -- Re-ingesting an unchanged entity writes nothing
+    WHERE COALESCE(excluded.name, entities.name) IS NOT entities.name
+       OR COALESCE(excluded.type, entities.type) IS NOT entities.type
+       OR COALESCE(excluded.aliases, entities.aliases) IS NOT entities.aliases
+       OR COALESCE(excluded.external_ids, entities.external_ids) IS NOT entities.external_ids
+       OR COALESCE(excluded.last_seen, entities.last_seen) IS NOT entities.last_seen
+"""
+
+
 def insert_entity(
     conn: sqlite3.Connection,
     entity_id: str,
@@ -101,6 +350,7 @@ def insert_entity(
     external_ids: Optional[dict[str, str]] = None,
     first_seen: Optional[str] = None,
     last_seen: Optional[str] = None,
+    commit: bool = True,
 ) -> str:
     """Insert or update an entity.
 
@@ -115,50 +365,71 @@ def insert_entity(
         external_ids: Dict of external ID mappings
         first_seen: First observation date (ISO)
         last_seen: Last observation date (ISO)
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
 
     Returns:
         The entity_id
     """
-    aliases_json = json.dumps(aliases) if aliases else None
-    external_ids_json = json.dumps(external_ids) if external_ids else None
+    aliases_json = _json_dumps(aliases) if aliases else None
+    external_ids_json = _json_dumps(external_ids) if external_ids else None
+
+    conn.execute(
+        _UPSERT_ENTITY,
+        (entity_id, name, entity_type, aliases_json, external_ids_json, first_seen, last_seen),
+    )
+    if commit:
+        conn.commit()
+    return entity_id
 
-    # Check if entity exists
-    existing = get_entity(conn, entity_id)
 
-    if existing:
-        # Update: preserve first_seen, update last_seen
-        conn.execute(
-            """
-            UPDATE entities
-            SET name = COALESCE(?, name),
-                type = COALESCE(?, type),
-                aliases = COALESCE(?, aliases),
-                external_ids = COALESCE(?, external_ids),
-                last_seen = COALESCE(?, last_seen)
-            WHERE entity_id = ?
-            """,
-            (name, entity_type, aliases_json, external_ids_json, last_seen, entity_id),
-        )
-    else:
-        # Insert new entity
-        conn.execute(
-            """
-            INSERT INTO entities (entity_id, name, type, aliases, external_ids, first_seen, last_seen)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (entity_id, name, entity_type, aliases_json, external_ids_json, first_seen, last_seen),
-        )
+def insert_entities_batch(
+    conn: sqlite3.Connection,
+    rows: Iterable[dict[str, Any]],
+    commit: bool = True,
+) -> int:
+    """Insert or update many entities with a single commit.
 
-    conn.commit()
-    return entity_id
+    Each row takes the same keys as insert_entity's keyword arguments
+    (entity_id, name, entity_type, aliases, external_ids, first_seen,
+    last_seen) and is applied with the same semantics, in order.
 
+    Args:
+        conn: Database connection
+        rows: Entity dicts
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
 
-def get_entity(conn: sqlite3.Connection, entity_id: str) -> Optional[dict[str, Any]]:
+    Returns:
+        Number of rows applied
+    """
+    params = []
+    for row in rows:
+        aliases = row.get("aliases")
+        external_ids = row.get("external_ids")
+        params.append((
+            row["entity_id"], row["name"], row["entity_type"],
+            _json_dumps(aliases) if aliases else None,
+            _json_dumps(external_ids) if external_ids else None,
+            row.get("first_seen"), row.get("last_seen"),
+        ))
+    conn.executemany(_UPSERT_ENTITY, params)
+    if commit:
+        conn.commit()
+    return len(params)
+
+
+def get_entity(
+    conn: sqlite3.Connection,
+    entity_id: str,
+    parse_json: bool = True,
+) -> Optional[dict[str, Any]]:
     """Get entity by ID.
 
     Args:
         conn: Database connection
         entity_id: Canonical entity ID
+        parse_json: Parse aliases/external_ids (False keeps the raw JSON text)
 
     Returns:
         Entity dict or None if not found
@@ -171,21 +442,20 @@ def get_entity(conn: sqlite3.Connection, entity_id: str) -> Optional[dict[str, A
     if row is None:
         return None
 
-    entity = dict(row)
-    # Parse JSON fields
-    if entity.get("aliases"):
-        entity["aliases"] = json.loads(entity["aliases"])
-    if entity.get("external_ids"):
-        entity["external_ids"] = json.loads(entity["external_ids"])
-    return entity
+    return _row_to_entity(row, parse_json)
 
 
-def get_entity_by_name(conn: sqlite3.Connection, name: str) -> list[dict[str, Any]]:
+def get_entity_by_name(
+    conn: sqlite3.Connection,
+    name: str,
+    parse_json: bool = True,
+) -> list[dict[str, Any]]:
     """Find entities by name.
 
     Args:
         conn: Database connection
         name: Entity name to search for
+        parse_json: Parse aliases/external_ids (False keeps the raw JSON text)
 
     Returns:
         List of matching entity dicts
@@ -194,29 +464,26 @@ def get_entity_by_name(conn: sqlite3.Connection, name: str) -> list[dict[str, An
         "SELECT * FROM entities WHERE name = ?",
         (name,),
     )
-    entities = []
-    for row in cursor.fetchall():
-        entity = dict(row)
-        if entity.get("aliases"):
-            entity["aliases"] = json.loads(entity["aliases"])
-        if entity.get("external_ids"):
-            entity["external_ids"] = json.loads(entity["external_ids"])
-        entities.append(entity)
-    return entities
+    return [_row_to_entity(row, parse_json) for row in cursor]
 
 
 def list_entities(
     conn: sqlite3.Connection,
     entity_type: Optional[str] = None,
-) -> list[dict[str, Any]]:
+    parse_json: bool = True,
+) -> Iterator[dict[str, Any]]:
     """List all entities, optionally filtered by type.
 
+    Rows are decoded as they are read; wrap in list() if you need len()
+    or indexing.
+
     Args:
         conn: Database connection
         entity_type: Optional type filter
+        parse_json: Parse aliases/external_ids (False keeps the raw JSON text)
 
-    Returns:
-        List of entity dicts
+    Yields:
+        Entity dicts
     """
     if entity_type:
         cursor = conn.execute(
@@ -226,24 +493,60 @@ def list_entities(
     else:
         cursor = conn.execute("SELECT * FROM entities")
 
-    entities = []
-    for row in cursor.fetchall():
-        entity = dict(row)
-        if entity.get("aliases"):
-            entity["aliases"] = json.loads(entity["aliases"])
-        if entity.get("external_ids"):
-            entity["external_ids"] = json.loads(entity["external_ids"])
-        entities.append(entity)
-    return entities
+    for row in cursor:
+        yield _row_to_entity(row, parse_json)
 
 
-def list_entities_in_date_range(
+def list_entity_names(
+    conn: sqlite3.Connection,
+    entity_type: Optional[str] = None,
+) -> list[tuple[str, str]]:
+    """List (entity_id, name) pairs, optionally filtered by type.
+
+    For callers that only need ids and names: no JSON columns are read.
+
+    Args:
+        conn: Database connection
+        entity_type: Optional type filter
+
+    Returns:
+        List of (entity_id, name) tuples
+    """
+    cursor = tuple_cursor(conn)
+    if entity_type:
+        cursor.execute(
+            "SELECT entity_id, name FROM entities WHERE type = ?",
+            (entity_type,),
+        )
+    else:
+        cursor.execute("SELECT entity_id, name FROM entities")
+    return cursor.fetchall()
+
+
+# SQL text per filter shape (start, end, type given), built on first use.
+_ENTITY_RANGE_SQL: dict[tuple[bool, bool, bool], str] = {}
+
+
+def _entity_range_sql(has_start: bool, has_end: bool, has_type: bool) -> str:
+    clauses: list[str] = []
+    if has_start:
+        clauses.append("(last_seen IS NULL OR last_seen >= ?)")
+    if has_end:
+        clauses.append("(first_seen IS NULL OR first_seen <= ?)")
+    if has_type:
+        clauses.append("type = ?")
+    where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+    return f"SELECT * FROM entities{where}"
+
+
+def iter_entities_in_date_range(
     conn: sqlite3.Connection,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     entity_type: Optional[str] = None,
-) -> list[dict[str, Any]]:
-    """List entities active within a date range.
+    parse_json: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Yield entities active within a date range, one row at a time.
 
     An entity is "active" if its last_seen >= start_date AND first_seen <= end_date.
     Dates here are article publication dates (see schemas/sqlite.sql).
@@ -253,35 +556,37 @@ def list_entities_in_date_range(
         start_date: Earliest date (ISO), inclusive. None = no lower bound.
         end_date: Latest date (ISO), inclusive. None = no upper bound.
         entity_type: Optional type filter
+        parse_json: Parse aliases/external_ids (False keeps the raw JSON text)
 
-    Returns:
-        List of entity dicts
+    Yields:
+        Entity dicts
     """
-    clauses: list[str] = []
-    params: list[Any] = []
+    key = (bool(start_date), bool(end_date), bool(entity_type))
+    sql = _ENTITY_RANGE_SQL.get(key)
+    if sql is None:
+        sql = _ENTITY_RANGE_SQL[key] = _entity_range_sql(*key)
+    params = [p for p in (start_date, end_date, entity_type) if p]
+    cursor = conn.execute(sql, params)
 
-    if start_date:
-        clauses.append("(last_seen IS NULL OR last_seen >= ?)")
-        params.append(start_date)
-    if end_date:
-        clauses.append("(first_seen IS NULL OR first_seen <= ?)")
-        params.append(end_date)
-    if entity_type:
-        clauses.append("type = ?")
-        params.append(entity_type)
+    for row in cursor:
+        yield _row_to_entity(row, parse_json)
 
-    where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
-    cursor = conn.execute(f"SELECT * FROM entities{where}", params)
 
-    entities = []
-    for row in cursor.fetchall():
-        entity = dict(row)
-        if entity.get("aliases"):
-            entity["aliases"] = json.loads(entity["aliases"])
-        if entity.get("external_ids"):
-            entity["external_ids"] = json.loads(entity["external_ids"])
-        entities.append(entity)
-    return entities
+def list_entities_in_date_range(
+    conn: sqlite3.Connection,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    entity_type: Optional[str] = None,
+    parse_json: bool = True,
+) -> list[dict[str, Any]]:
+    """List entities active within a date range.
+
+    See iter_entities_in_date_range for the arguments; this materializes
+    its rows.
+    """
+    return list(iter_entities_in_date_range(
+        conn, start_date, end_date, entity_type, parse_json,
+    ))
 
 
 def get_latest_published_date(conn: sqlite3.Connection) -> Optional[str]:
@@ -294,7 +599,7 @@ def get_latest_published_date(conn: sqlite3.Connection) -> Optional[str]:
     Returns:
         ISO date string (YYYY-MM-DD) or None if no documents have a published_at.
     """
-    cursor = conn.execute(
+    cursor = tuple_cursor(conn).execute(
         "SELECT MAX(published_at) FROM documents WHERE published_at IS NOT NULL"
     )
     row = cursor.fetchone()
@@ -303,12 +608,22 @@ def get_latest_published_date(conn: sqlite3.Connection) -> Optional[str]:
     return str(row[0])[:10]
 
 
-def list_relations_in_date_range(
+# Every readable relations column; also the whitelist for callers that
+# pick a subset (names are interpolated into SQL).
+_RELATION_SELECT_COLUMNS = (
+    "relation_id", "source_id", "rel", "target_id", "kind", "confidence",
+    "doc_id", "extractor_version", "verb_raw", "polarity", "modality",
+    "time_text", "time_start", "time_end", "created_at",
+)
+
+
+def iter_relations_in_date_range(
     conn: sqlite3.Connection,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-) -> list[dict[str, Any]]:
-    """List relations whose source document was published within a date range.
+    columns: Optional[Iterable[str]] = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield relations whose source document was published within a date range.
 
     Joins on documents.published_at (the article publication date).
 
@@ -316,10 +631,22 @@ def list_relations_in_date_range(
         conn: Database connection
         start_date: Earliest published date (ISO), inclusive. None = no lower bound.
         end_date: Latest published date (ISO), inclusive. None = no upper bound.
+        columns: Relation columns to return.  None = all of them.
 
-    Returns:
-        List of relation dicts
+    Yields:
+        Relation dicts
+
+    Raises:
+        ValueError: If columns names something that is not a relations column.
     """
+    if columns is None:
+        columns = _RELATION_SELECT_COLUMNS
+    else:
+        columns = tuple(columns)
+        unknown = set(columns).difference(_RELATION_SELECT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown relation column(s): {sorted(unknown)}")
+
     clauses: list[str] = []
     params: list[Any] = []
 
@@ -332,13 +659,52 @@ def list_relations_in_date_range(
 
     where = (" AND " + " AND ".join(clauses)) if clauses else ""
     query = f"""
-        SELECT r.*
+        SELECT {", ".join("r." + col for col in columns)}
         FROM relations r
         JOIN documents d ON r.doc_id = d.doc_id
         WHERE 1=1{where}
     """
-    cursor = conn.execute(query, params)
-    return [dict(row) for row in cursor.fetchall()]
+    for row in conn.execute(query, params):
+        yield dict(row)
+
+
+def list_relations_in_date_range(
+    conn: sqlite3.Connection,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Optional[Iterable[str]] = None,
+) -> list[dict[str, Any]]:
+    """List relations whose source document was published within a date range.
+
+    See iter_relations_in_date_range for the arguments; this materializes
+    its rows.
+    """
+    return list(iter_relations_in_date_range(conn, start_date, end_date, columns))
+
+
+_RELATION_COLUMNS = (
+    "source_id", "rel", "target_id", "kind", "confidence",
+    "doc_id", "extractor_version", "verb_raw", "polarity", "modality",
+    "time_text", "time_start", "time_end",
+)
+
+_INSERT_RELATION_OR_IGNORE = (
+    f"INSERT OR IGNORE INTO relations ({', '.join(_RELATION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_RELATION_COLUMNS))})"
+)
+
+# Single-statement insert-or-fetch (SQLite >= 3.35 for RETURNING).  The
+# conflict target is idx_relations_dedup; the no-op DO UPDATE makes
+# RETURNING report the existing row's id for a duplicate.
+if sqlite3.sqlite_version_info >= (3, 35, 0):
+    _UPSERT_RELATION: Optional[str] = (
+        f"INSERT INTO relations ({', '.join(_RELATION_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(_RELATION_COLUMNS))}) "
+        "ON CONFLICT(source_id, rel, target_id, kind, COALESCE(doc_id, '')) "
+        "DO UPDATE SET rel = rel RETURNING relation_id"
+    )
+else:
+    _UPSERT_RELATION = None
 
 
 def insert_relation(
@@ -356,6 +722,7 @@ def insert_relation(
     time_text: Optional[str] = None,
     time_start: Optional[str] = None,
     time_end: Optional[str] = None,
+    commit: bool = True,
 ) -> int:
     """Insert a relation between entities, skipping duplicates.
 
@@ -378,35 +745,94 @@ def insert_relation(
         time_text: Raw time text
         time_start: ISO date for time range start
         time_end: ISO date for time range end
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
 
     Returns:
         The relation_id (existing if duplicate, new otherwise)
     """
-    # Check for existing duplicate
-    existing = conn.execute(
+    relation_id = _insert_relation_row(conn, (
+        source_id, rel, target_id, kind, confidence,
+        doc_id, extractor_version, verb_raw, polarity, modality,
+        time_text, time_start, time_end,
+    ))
+    if commit:
+        conn.commit()
+    return relation_id
+
+
+def _insert_relation_row(conn: sqlite3.Connection, params: tuple) -> int:
+    """Insert one relation (params in _RELATION_COLUMNS order); return its id."""
+    if _UPSERT_RELATION is not None:
+        return tuple_cursor(conn).execute(_UPSERT_RELATION, params).fetchone()[0]
+    conn.execute(_INSERT_RELATION_OR_IGNORE, params)
+    source_id, rel, target_id, kind, _, doc_id = params[:6]
+    return tuple_cursor(conn).execute(
         """SELECT relation_id FROM relations
-           WHERE source_id = ? AND rel = ? AND target_id = ? AND kind = ? AND doc_id = ?""",
+           WHERE source_id = ? AND rel = ? AND target_id = ? AND kind = ?
+                 AND COALESCE(doc_id, '') = COALESCE(?, '')""",
         (source_id, rel, target_id, kind, doc_id),
-    ).fetchone()
-    if existing:
-        return existing["relation_id"] if isinstance(existing, sqlite3.Row) else existing[0]
+    ).fetchone()[0]
 
-    cursor = conn.execute(
-        """
-        INSERT INTO relations (
-            source_id, rel, target_id, kind, confidence,
-            doc_id, extractor_version, verb_raw, polarity, modality,
-            time_text, time_start, time_end
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            source_id, rel, target_id, kind, confidence,
-            doc_id, extractor_version, verb_raw, polarity, modality,
-            time_text, time_start, time_end,
-        ),
+
+def insert_relations_batch(
+    conn: sqlite3.Connection,
+    rows: Iterable[dict[str, Any]],
+    commit: bool = True,
+) -> int:
+    """Insert many relations with a single commit, skipping duplicates.
+
+    Each row takes the same keys as insert_relation's keyword arguments.
+    Duplicates (per the idx_relations_dedup unique index) are ignored,
+    whether they already exist or repeat within the batch.
+
+    Args:
+        conn: Database connection
+        rows: Relation dicts
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
+
+    Returns:
+        Number of relations actually inserted
+    """
+    before = conn.total_changes
+    conn.executemany(
+        _INSERT_RELATION_OR_IGNORE,
+        (tuple(row.get(col) for col in _RELATION_COLUMNS) for row in rows),
     )
-    conn.commit()
-    return cursor.lastrowid
+    if commit:
+        conn.commit()
+    return conn.total_changes - before
+
+
+def insert_relations_batch_ids(
+    conn: sqlite3.Connection,
+    rows: Iterable[dict[str, Any]],
+    commit: bool = True,
+) -> list[int]:
+    """Insert many relations with a single commit and return their ids.
+
+    Like insert_relations_batch, but for callers that chain evidence to
+    the new rows: each id comes back from INSERT ... RETURNING (one
+    statement per row, since executemany cannot return rows), and a
+    duplicate yields the existing relation's id.
+
+    Args:
+        conn: Database connection
+        rows: Relation dicts
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
+
+    Returns:
+        relation_id for each row, in input order
+    """
+    relation_ids = [
+        _insert_relation_row(conn, tuple(row.get(col) for col in _RELATION_COLUMNS))
+        for row in rows
+    ]
+    if commit:
+        conn.commit()
+    return relation_ids
 
 
 def deduplicate_relations(conn: sqlite3.Connection) -> int:
@@ -422,51 +848,48 @@ def deduplicate_relations(conn: sqlite3.Connection) -> int:
     Returns:
         Number of duplicate rows removed
     """
-    # Find relation_ids to keep (one per unique group)
-    keep_ids = conn.execute(
+    # One window pass pairs every duplicate with its group's survivor
+    # (lowest relation_id).  The pairs go to a temp rowid table so no
+    # relation ids pass through Python, and the evidence update / delete
+    # below probe it by primary key.
+    conn.execute("DROP TABLE IF EXISTS temp.relation_dups")
+    conn.execute(
+        "CREATE TEMP TABLE relation_dups "
+        "(relation_id INTEGER PRIMARY KEY, keep_id INTEGER NOT NULL)"
+    )
+    removed = conn.execute(
         """
-        SELECT MIN(relation_id) AS keep_id
-        FROM relations
-        GROUP BY source_id, rel, target_id, kind, COALESCE(doc_id, '')
+        INSERT INTO relation_dups (relation_id, keep_id)
+        SELECT relation_id, keep_id
+        FROM (
+            SELECT relation_id,
+                   MIN(relation_id) OVER (
+                       PARTITION BY source_id, rel, target_id, kind, COALESCE(doc_id, '')
+                   ) AS keep_id
+            FROM relations
+        )
+        WHERE relation_id != keep_id
         """
-    ).fetchall()
-    keep_set = {row[0] for row in keep_ids}
-
-    # Find all duplicates (relation_ids NOT in the keep set)
-    all_ids = conn.execute("SELECT relation_id FROM relations").fetchall()
-    dup_ids = [row[0] for row in all_ids if row[0] not in keep_set]
-
-    if not dup_ids:
-        return 0
-
-    # For each duplicate, reassign its evidence to the surviving relation
-    for dup_id in dup_ids:
-        # Find the group key for this dup
-        dup_row = conn.execute(
-            "SELECT source_id, rel, target_id, kind, doc_id FROM relations WHERE relation_id = ?",
-            (dup_id,),
-        ).fetchone()
-        if not dup_row:
-            continue
-
-        # Find the keep_id for this group
-        survivor = conn.execute(
-            """SELECT MIN(relation_id) AS keep_id FROM relations
-               WHERE source_id = ? AND rel = ? AND target_id = ? AND kind = ?
-                     AND COALESCE(doc_id, '') = COALESCE(?, '')""",
-            (dup_row[0], dup_row[1], dup_row[2], dup_row[3], dup_row[4]),
-        ).fetchone()
-        if survivor and survivor[0] != dup_id:
-            conn.execute(
-                "UPDATE evidence SET relation_id = ? WHERE relation_id = ?",
-                (survivor[0], dup_id),
-            )
+    ).rowcount
 
-    # Delete duplicates
-    placeholders = ",".join("?" for _ in dup_ids)
-    conn.execute(f"DELETE FROM relations WHERE relation_id IN ({placeholders})", dup_ids)
+    if removed:
+        # Reassign evidence of every duplicate to its survivor, then delete
+        conn.execute(
+            """
+            UPDATE evidence
+            SET relation_id = (
+                SELECT keep_id FROM relation_dups d
+                WHERE d.relation_id = evidence.relation_id
+            )
+            WHERE relation_id IN (SELECT relation_id FROM relation_dups)
+            """
+        )
+        conn.execute(
+            "DELETE FROM relations WHERE relation_id IN (SELECT relation_id FROM relation_dups)"
+        )
     conn.commit()
-    return len(dup_ids)
+    conn.execute("DROP TABLE relation_dups")
+    return removed
 
 
 def get_relations_for_entity(
@@ -482,12 +905,16 @@ def get_relations_for_entity(
     Returns:
         List of relation dicts
     """
+    # Two index seeks (idx_relations_source / idx_relations_target) joined
+    # with UNION ALL; the second arm skips self-loops already returned by
+    # the first, so no rowid de-duplication pass is needed.
     cursor = conn.execute(
         """
-        SELECT * FROM relations
-        WHERE source_id = ? OR target_id = ?
+        SELECT * FROM relations WHERE source_id = ?
+        UNION ALL
+        SELECT * FROM relations WHERE target_id = ? AND source_id != ?
         """,
-        (entity_id, entity_id),
+        (entity_id, entity_id, entity_id),
     )
     return [dict(row) for row in cursor.fetchall()]
 
@@ -501,6 +928,7 @@ def insert_evidence(
     snippet: str,
     char_start: Optional[int] = None,
     char_end: Optional[int] = None,
+    commit: bool = True,
 ) -> int:
     """Insert evidence for a relation.
 
@@ -513,6 +941,8 @@ def insert_evidence(
         snippet: Evidence text snippet
         char_start: Character offset start
         char_end: Character offset end
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
 
     Returns:
         The evidence_id
@@ -524,17 +954,91 @@ def insert_evidence(
         """,
         (relation_id, doc_id, url, published, snippet, char_start, char_end),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     return cursor.lastrowid
 
 
-def add_alias(conn: sqlite3.Connection, alias: str, canonical_id: str) -> None:
+def insert_evidences_batch(
+    conn: sqlite3.Connection,
+    rows: Iterable[dict[str, Any]],
+    commit: bool = True,
+) -> int:
+    """Insert many evidence rows with a single commit.
+
+    Each row takes the same keys as insert_evidence's keyword arguments.
+
+    Args:
+        conn: Database connection
+        rows: Evidence dicts
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
+
+    Returns:
+        Number of evidence rows inserted
+    """
+    before = conn.total_changes
+    conn.executemany(
+        """
+        INSERT INTO evidence (relation_id, doc_id, url, published, snippet, char_start, char_end)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                row["relation_id"], row["doc_id"], row["url"], row.get("published"),
+                row["snippet"], row.get("char_start"), row.get("char_end"),
+            )
+            for row in rows
+        ),
+    )
+    if commit:
+        conn.commit()
+    return conn.total_changes - before
+
+
+def insert_relation_with_evidence(
+    conn: sqlite3.Connection,
+    relation: dict[str, Any],
+    evidence: dict[str, Any],
+    commit: bool = True,
+) -> tuple[int, int]:
+    """Insert a relation and one evidence row for it with a single commit.
+
+    relation takes insert_relation's keyword arguments; evidence takes
+    insert_evidence's, without relation_id (filled in from the relation,
+    which is the existing row when the relation is a duplicate).
+
+    Args:
+        conn: Database connection
+        relation: Relation fields
+        evidence: Evidence fields
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
+
+    Returns:
+        (relation_id, evidence_id)
+    """
+    relation_id = insert_relation(conn, **relation, commit=False)
+    evidence_id = insert_evidence(conn, relation_id=relation_id, **evidence, commit=False)
+    if commit:
+        conn.commit()
+    return relation_id, evidence_id
+
+
+def add_alias(
+    conn: sqlite3.Connection,
+    alias: str,
+    canonical_id: str,
+    commit: bool = True,
+) -> None:
     """Add an alias mapping for entity resolution.
 
     Args:
         conn: Database connection
         alias: Alias string (e.g. "Open AI")
         canonical_id: Canonical entity ID (e.g. "org:openai")
+        commit: Commit after the write.  Callers batching several
+            writes pass False and commit once themselves.
     """
     conn.execute(
         """
@@ -543,7 +1047,8 @@ def add_alias(conn: sqlite3.Connection, alias: str, canonical_id: str) -> None:
         """,
         (alias, canonical_id),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def resolve_alias(conn: sqlite3.Connection, alias: str) -> Optional[str]:
@@ -556,12 +1061,11 @@ def resolve_alias(conn: sqlite3.Connection, alias: str) -> Optional[str]:
     Returns:
         Canonical entity ID or None if not found
     """
-    cursor = conn.execute(
+    row = tuple_cursor(conn).execute(
         "SELECT canonical_id FROM entity_aliases WHERE alias = ?",
         (alias,),
-    )
-    row = cursor.fetchone()
-    return row["canonical_id"] if row else None
+    ).fetchone()
+    return row[0] if row else None
 
 
 # ---------------------------------------------------------------------------
@@ -23,7 +23,12 @@ import json
 import re
 from collections import Counter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 from schema import (
     validate_extraction,
@@ -225,15 +230,32 @@ def parse_extraction_response(
     return data
 
 
+def dumps_extraction(extraction: dict[str, Any]) -> bytes:
+    """Serialize an extraction as indented UTF-8 JSON.
+
+    Uses orjson when installed, else ``json.dumps(..., indent=2,
+    ensure_ascii=False)``.  The two produce equivalent JSON for
+    extraction dicts, not byte-identical JSON in general: orjson rejects
+    non-str keys, writes NaN/Infinity as null and may format some floats
+    differently.
+    """
+    if orjson is not None:
+        return orjson.dumps(extraction, option=orjson.OPT_INDENT_2)
+    return json.dumps(extraction, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def save_extraction(
     extraction: dict[str, Any],
     output_dir: Path,
+    serializer: Optional[Callable[[dict[str, Any]], bytes]] = None,
 ) -> Path:
     """Save extraction to JSON file.
 
     Args:
         extraction: Validated extraction dict
         output_dir: Directory to save to
+        serializer: Callable returning the file bytes
+            (default: dumps_extraction)
 
     Returns:
         Path to saved file
@@ -242,8 +264,7 @@ def save_extraction(
     doc_id = extraction["docId"]
     output_path = output_dir / f"{doc_id}.json"
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(extraction, f, indent=2, ensure_ascii=False)
+    output_path.write_bytes((serializer or dumps_extraction)(extraction))
 
     return output_path
 
@@ -12,7 +12,7 @@ from __future__ import annotations
 import json
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 import sqlite3
 
 import yaml
@@ -149,6 +149,16 @@ def build_edge(relation: dict[str, Any], evidence: list[dict[str, Any]] = None)
     return {"data": data}
 
 
+# Keep IN (...) lists under SQLite's default bound-parameter limit (999 on
+# older builds); _get_relations_touching binds each chunk twice.
+_MAX_IN_PARAMS = 450
+
+
+def _chunked(ids: list[str], size: int = _MAX_IN_PARAMS) -> Iterator[list[str]]:
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
 class GraphExporter:
     """Export graph data to Cytoscape.js format.
 
@@ -196,13 +206,35 @@ class GraphExporter:
         where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
         cursor = self.conn.execute(f"SELECT * FROM entities{where}", params)
 
+        return [self._entity_from_row(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _entity_from_row(row: sqlite3.Row) -> dict[str, Any]:
+        entity = dict(row)
+        if entity.get("aliases"):
+            entity["aliases"] = json.loads(entity["aliases"])
+        if entity.get("external_ids"):
+            entity["external_ids"] = json.loads(entity["external_ids"])
+        return entity
+
+    def _get_entities_by_ids(self, entity_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Get only the given entities, in table order.
+
+        Looks each id up by primary key instead of scanning the whole
+        entities table (used by the top-N trending view).
+        """
+        rows = []
+        for chunk in _chunked(sorted(set(entity_ids))):
+            marks = ",".join("?" * len(chunk))
+            rows.extend(self.conn.execute(
+                f"SELECT rowid AS _rowid, * FROM entities WHERE entity_id IN ({marks})",
+                chunk,
+            ).fetchall())
+        rows.sort(key=lambda row: row["_rowid"])
         entities = []
-        for row in cursor.fetchall():
-            entity = dict(row)
-            if entity.get("aliases"):
-                entity["aliases"] = json.loads(entity["aliases"])
-            if entity.get("external_ids"):
-                entity["external_ids"] = json.loads(entity["external_ids"])
+        for row in rows:
+            entity = self._entity_from_row(row)
+            del entity["_rowid"]
             entities.append(entity)
         return entities
 
@@ -297,6 +329,29 @@ class GraphExporter:
 
         return relations
 
+    def _get_relations_touching(self, entity_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Get deduplicated relations with at least one endpoint in entity_ids.
+
+        Same rows (and order) as filtering _get_relations() in Python, but
+        only relations touching the given entities are read, via the
+        source/target indexes.  The dedup group key includes both endpoints,
+        so deduplicating the filtered rows picks the same relation_ids.
+        """
+        by_id: dict[int, dict[str, Any]] = {}
+        for chunk in _chunked(sorted(set(entity_ids))):
+            marks = ",".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                f"""SELECT * FROM relations WHERE relation_id IN (
+                        SELECT MIN(relation_id) FROM relations
+                        WHERE source_id IN ({marks}) OR target_id IN ({marks})
+                        GROUP BY source_id, rel, target_id, kind, COALESCE(doc_id, '')
+                    )""",
+                chunk + chunk,
+            )
+            for row in cursor.fetchall():
+                by_id[row["relation_id"]] = dict(row)
+        return [by_id[rid] for rid in sorted(by_id)]
+
     def _get_evidence_for_relation(self, relation_id: int) -> list[dict[str, Any]]:
         """Get evidence records for a relation.
 
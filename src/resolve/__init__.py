@@ -8,7 +8,8 @@ from __future__ import annotations
 import json
 import re
 import sqlite3
-from typing import Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
 
 from schema import ENTITY_TYPES
 from util import slugify
@@ -66,10 +67,11 @@ def name_similarity(name1: str, name2: str) -> float:
     Returns:
         Similarity score 0.0 to 1.0
     """
-    # Normalize both names
-    norm1 = normalize_name(name1)
-    norm2 = normalize_name(name2)
+    return _normalized_similarity(normalize_name(name1), normalize_name(name2))
 
+
+def _normalized_similarity(norm1: str, norm2: str) -> float:
+    """name_similarity() on names already passed through normalize_name()."""
     # Exact match after normalization
     if norm1 == norm2:
         return 1.0
@@ -150,16 +152,14 @@ def find_similar_entities(
     """
     matches = []
 
+    from db import resolve_alias
+
     # First check alias table for exact match
-    cursor = conn.execute(
-        "SELECT canonical_id FROM entity_aliases WHERE alias = ?",
-        (name,)
-    )
-    alias_row = cursor.fetchone()
-    if alias_row:
+    canonical_id = resolve_alias(conn, name)
+    if canonical_id:
         entity_cursor = conn.execute(
             "SELECT * FROM entities WHERE entity_id = ?",
-            (alias_row[0],)
+            (canonical_id,)
         )
         entity_row = entity_cursor.fetchone()
         if entity_row:
@@ -200,10 +200,140 @@ def find_similar_entities(
     return matches
 
 
+# Queries per process-pool task in run_resolution_pass(jobs > 1)
+_MATCH_CHUNK = 256
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _CandidateIndex:
+    """Blocking index over a candidate list for run_resolution_pass.
+
+    name_similarity() can only reach a positive threshold when the two
+    normalized names have the same compact form, share a word, or one
+    is a substring of the other.  Indexing candidate names and aliases
+    by compact form, by word and by character trigram yields a superset
+    of the pairs that can match, so only those are scored and the
+    result is the same as comparing against every candidate.
+    """
+
+    def __init__(self, candidates: list[dict[str, Any]]):
+        self.size = len(candidates)
+        # Normalized name, then aliases, per candidate: scoring reuses
+        # these instead of normalizing both sides of every pair
+        self.norms: list[list[str]] = [
+            [normalize_name(n) for n in [c["name"], *(c.get("aliases") or [])]]
+            for c in candidates
+        ]
+        self.keys: dict[str, set[int]] = {}
+        # Names too short for trigrams can be a substring of anything
+        self.short: set[int] = set()
+        for i, norms in enumerate(self.norms):
+            for norm in norms:
+                self._add("c:" + norm.replace(" ", "").replace("-", ""), i)
+                for word in norm.split():
+                    self._add("w:" + word, i)
+                if len(norm) < 3:
+                    if norm:
+                        self.short.add(i)
+                    continue
+                # "g:" any trigram (query inside candidate),
+                # "f:" leading trigram (candidate inside query)
+                for gram in _trigrams(norm):
+                    self._add("g:" + gram, i)
+                self._add("f:" + norm[:3], i)
+
+    def _add(self, key: str, i: int) -> None:
+        self.keys.setdefault(key, set()).add(i)
+
+    def lookup(self, norm: str) -> list[int]:
+        """Candidate positions (in list order) that may match a normalized name."""
+        if 0 < len(norm) < 3:
+            # A one- or two-character name may sit inside any candidate
+            return list(range(self.size))
+        keys = self.keys
+        found = set(keys.get("c:" + norm.replace(" ", "").replace("-", ""), ()))
+        for word in norm.split():
+            found.update(keys.get("w:" + word, ()))
+        if norm:
+            found.update(keys.get("g:" + norm[:3], ()))
+            for gram in _trigrams(norm):
+                found.update(keys.get("f:" + gram, ()))
+            found.update(self.short)
+        return sorted(found)
+
+
+def _match_ids(
+    entity_id: str,
+    name: str,
+    candidates: list[dict[str, Any]],
+    threshold: float,
+    index: Optional[_CandidateIndex] = None,
+) -> list[str]:
+    """IDs of candidates whose name or any alias scores >= threshold.
+
+    Scores with the index's pre-normalized names; with a positive
+    threshold only the candidates the index returns are scored.
+    """
+    if index is None:
+        index = _CandidateIndex(candidates)
+    norm = normalize_name(name)
+    positions = index.lookup(norm) if threshold > 0 else range(len(candidates))
+    matches = []
+    for i in positions:
+        candidate = candidates[i]
+        if candidate["entity_id"] == entity_id:
+            continue
+        cand_norm, *alias_norms = index.norms[i]
+        sim = _normalized_similarity(norm, cand_norm)
+        if sim < threshold:
+            # Also check aliases
+            for alias_norm in alias_norms:
+                sim = max(sim, _normalized_similarity(norm, alias_norm))
+        if sim >= threshold:
+            matches.append(candidate["entity_id"])
+    return matches
+
+
+# Process-pool worker state for _match_block, set once per worker by
+# _init_match_worker: every candidate block of the pass, and the blocking
+# index of each block the worker has been handed so far.
+_worker_blocks: list[list[dict[str, Any]]] = []
+_worker_indexes: dict[int, _CandidateIndex] = {}
+_worker_threshold = 0.0
+
+
+def _init_match_worker(blocks: list[list[dict[str, Any]]], threshold: float) -> None:
+    """Process-pool initializer: receive the candidate blocks once."""
+    global _worker_blocks, _worker_threshold
+    _worker_blocks = blocks
+    _worker_threshold = threshold
+    _worker_indexes.clear()
+
+
+def _match_block(
+    block: int,
+    queries: list[tuple[str, str]],
+) -> list[tuple[str, list[str]]]:
+    """Process-pool worker: _match_ids for (entity_id, name) queries
+    against candidate block number block."""
+    candidates = _worker_blocks[block]
+    index = _worker_indexes.get(block)
+    if index is None:
+        index = _worker_indexes[block] = _CandidateIndex(candidates)
+    return [
+        (entity_id, _match_ids(entity_id, name, candidates, _worker_threshold, index))
+        for entity_id, name in queries
+    ]
+
+
 def merge_entities(
     conn: sqlite3.Connection,
     duplicate_id: str,
     canonical_id: str,
+    commit: bool = True,
 ) -> None:
     """Merge a duplicate entity into a canonical entity.
 
@@ -216,7 +346,11 @@ def merge_entities(
         conn: Database connection
         duplicate_id: ID of entity to merge away
         canonical_id: ID of canonical entity to merge into
+        commit: Commit after the merge.  Batch callers pass False and
+            commit once, so a pass with many merges is one transaction.
     """
+    from db import add_alias
+
     # Get both entities
     dup_cursor = conn.execute(
         "SELECT * FROM entities WHERE entity_id = ?",
@@ -269,6 +403,9 @@ def merge_entities(
     # source_id, rel, target_id, kind, doc_id as an existing relation),
     # we reassign evidence from the colliding row to the survivor and
     # delete the collision instead of crashing on the UNIQUE index.
+    # Collisions are checked row by row; the writes for each column go out
+    # as executemany batches.  Deferring them is safe: the dedup index means
+    # no two rows of one pass can repoint onto the same key.
     for col in ("source_id", "target_id"):
         # Find relations that reference the duplicate entity
         dup_rels = conn.execute(
@@ -277,6 +414,9 @@ def merge_entities(
             (duplicate_id,),
         ).fetchall()
 
+        evidence_moves: list[tuple[int, int]] = []
+        collided: list[tuple[int]] = []
+        repoints: list[tuple[str, int]] = []
         for dr in dup_rels:
             # Compute what the row would look like after the repoint
             new_source = canonical_id if col == "source_id" else dr["source_id"]
@@ -294,29 +434,29 @@ def merge_entities(
 
             if existing:
                 # Collision: reassign evidence to the surviving relation, then delete
-                conn.execute(
-                    "UPDATE evidence SET relation_id = ? WHERE relation_id = ?",
-                    (existing["relation_id"], dr["relation_id"]),
-                )
-                conn.execute(
-                    "DELETE FROM relations WHERE relation_id = ?",
-                    (dr["relation_id"],),
-                )
+                evidence_moves.append((existing["relation_id"], dr["relation_id"]))
+                collided.append((dr["relation_id"],))
             else:
                 # Safe to repoint
-                conn.execute(
-                    f"UPDATE relations SET {col} = ? WHERE relation_id = ?",
-                    (canonical_id, dr["relation_id"]),
-                )
+                repoints.append((canonical_id, dr["relation_id"]))
+
+        if evidence_moves:
+            conn.executemany(
+                "UPDATE evidence SET relation_id = ? WHERE relation_id = ?",
+                evidence_moves,
+            )
+            conn.executemany(
+                "DELETE FROM relations WHERE relation_id = ?",
+                collided,
+            )
+        if repoints:
+            conn.executemany(
+                f"UPDATE relations SET {col} = ? WHERE relation_id = ?",
+                repoints,
+            )
 
     # Add alias mapping for the duplicate's name
-    conn.execute(
-        """
-        INSERT OR REPLACE INTO entity_aliases (alias, canonical_id)
-        VALUES (?, ?)
-        """,
-        (dup_entity["name"], canonical_id)
-    )
+    add_alias(conn, dup_entity["name"], canonical_id, commit=False)
 
     # Delete the duplicate entity
     conn.execute(
@@ -324,7 +464,8 @@ def merge_entities(
         (duplicate_id,)
     )
 
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 class EntityResolver:
@@ -465,6 +606,8 @@ class EntityResolver:
         disambiguate_model: str = "gpt-5-nano",
         run_date: Optional[str] = None,
         dry_run: bool = False,
+        since: Optional[str] = None,
+        jobs: int = 1,
     ) -> dict[str, int]:
         """Run resolution on all entities in database.
 
@@ -477,6 +620,13 @@ class EntityResolver:
             disambiguate_model: Model to use for LLM disambiguation.
             run_date: ISO date for logging (defaults to today).
             dry_run: If True, evaluate but don't merge (disambiguation only).
+            since: ISO date; when set, only pairs involving an entity with
+                last_seen >= since are compared.  Pairs of older entities
+                were already checked by earlier passes, so this turns the
+                O(N^2) scan into O(N_new * N).
+            jobs: Worker processes for the similarity scan.  With jobs > 1
+                the matches are computed up front in a process pool, per
+                type block; merging stays serial, so results are the same.
 
         Returns:
             Statistics dict with counts
@@ -493,9 +643,13 @@ class EntityResolver:
         # Building an in-memory type→entities map reduces that to one query.
         from collections import defaultdict
         cursor = self.conn.execute(
-            "SELECT entity_id, name, type, aliases FROM entities ORDER BY type, first_seen"
+            "SELECT entity_id, name, type, aliases, last_seen FROM entities "
+            "ORDER BY type, first_seen"
         )
         by_type: dict[str, list[dict]] = defaultdict(list)
+        # Incremental mode: entities touched since the cutoff, per type
+        recent_by_type: dict[str, list[dict]] = defaultdict(list)
+        recent_ids: set[str] = set()
         for row in cursor.fetchall():
             entry = dict(row)
             if entry.get("aliases"):
@@ -504,10 +658,28 @@ class EntityResolver:
                 except (ValueError, TypeError):
                     entry["aliases"] = []
             by_type[entry["type"]].append(entry)
+            if since is not None and (entry.get("last_seen") or "") >= since:
+                recent_by_type[entry["type"]].append(entry)
+                recent_ids.add(entry["entity_id"])
 
         # Flatten back to ordered list for the merge loop
         entities = [e for group in by_type.values() for e in group]
 
+        no_candidates: list[dict] = []
+
+        def candidates_for(entity: dict) -> list[dict]:
+            # In incremental mode an old entity is only compared against
+            # recent ones; recent entities are compared against everything.
+            if since is None or entity["entity_id"] in recent_ids:
+                return by_type.get(entity["type"], no_candidates)
+            return recent_by_type.get(entity["type"], no_candidates)
+
+        precomputed = None
+        if jobs > 1:
+            precomputed = self._parallel_matches(entities, candidates_for, jobs)
+        # Blocking index per candidate list, built on first use
+        indexes: dict[int, _CandidateIndex] = {}
+
         processed = set()
 
         for entity in entities:
@@ -517,34 +689,32 @@ class EntityResolver:
                 continue
 
             # Find similar entities within the pre-loaded type group
-            same_type = by_type.get(entity["type"], [])
-            matches = []
-            for candidate in same_type:
-                if candidate["entity_id"] == entity["entity_id"]:
-                    continue
-                sim = name_similarity(entity["name"], candidate["name"])
-                if sim < self.threshold:
-                    # Also check aliases
-                    for alias in (candidate.get("aliases") or []):
-                        sim = max(sim, name_similarity(entity["name"], alias))
-                if sim >= self.threshold:
-                    candidate["similarity"] = sim
-                    matches.append(candidate)
+            if precomputed is not None:
+                match_ids = precomputed[entity["entity_id"]]
+            else:
+                candidates = candidates_for(entity)
+                index = indexes.get(id(candidates))
+                if index is None:
+                    index = indexes[id(candidates)] = _CandidateIndex(candidates)
+                match_ids = _match_ids(
+                    entity["entity_id"], entity["name"],
+                    candidates, self.threshold, index,
+                )
 
             # Filter to only unprocessed entities
-            duplicates = [
-                m for m in matches
-                if m["entity_id"] not in processed
-            ]
+            duplicates = [m for m in match_ids if m not in processed]
 
             # Merge duplicates into this entity (earliest one wins as canonical)
-            for dup in duplicates:
-                merge_entities(self.conn, dup["entity_id"], entity["entity_id"])
-                processed.add(dup["entity_id"])
+            for dup_id in duplicates:
+                merge_entities(self.conn, dup_id, entity["entity_id"], commit=False)
+                processed.add(dup_id)
                 stats["merges_performed"] += 1
 
             processed.add(entity["entity_id"])
 
+        # One commit for the whole fuzzy pass instead of one per merge
+        self.conn.commit()
+
         # --- LLM disambiguation pass (Feature 1) ---
         if llm_disambiguate:
             from resolve.disambiguate import run_llm_disambiguation
@@ -562,3 +732,51 @@ class EntityResolver:
             stats["merges_performed"] += dr.merges_performed
 
         return stats
+
+    def _parallel_matches(
+        self,
+        entities: list[dict],
+        candidates_for: Callable[[dict], list[dict]],
+        jobs: int,
+    ) -> dict[str, list[str]]:
+        """Compute every entity's match IDs in a process pool.
+
+        Entities sharing a candidate list (same type, same incremental
+        role) form a block; each block is split into chunks of queries so
+        large types spread across workers.  Each worker receives the
+        candidates once and builds a block's index on its first chunk.
+        """
+        results: dict[str, list[str]] = {}
+        blocks: dict[int, tuple[list[dict], list[tuple[str, str]]]] = {}
+        for entity in entities:
+            candidates = candidates_for(entity)
+            if not candidates:
+                results[entity["entity_id"]] = []
+                continue
+            block = blocks.setdefault(id(candidates), (candidates, []))
+            block[1].append((entity["entity_id"], entity["name"]))
+
+        # Only the fields _match_ids reads cross the process boundary, and
+        # only once per worker (initializer); tasks carry a block number
+        # and a slice of queries.
+        slim_blocks = [
+            [
+                {"entity_id": c["entity_id"], "name": c["name"],
+                 "aliases": c.get("aliases")}
+                for c in candidates
+            ]
+            for candidates, _ in blocks.values()
+        ]
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_match_worker,
+            initargs=(slim_blocks, self.threshold),
+        ) as pool:
+            futures = [
+                pool.submit(_match_block, block, queries[start:start + _MATCH_CHUNK])
+                for block, (_, queries) in enumerate(blocks.values())
+                for start in range(0, len(queries), _MATCH_CHUNK)
+            ]
+            for future in futures:
+                results.update(future.result())
+        return results
@@ -5,6 +5,7 @@ Computes lightweight trend signals for entities per AGENTS.md specification.
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import sqlite3
@@ -326,10 +327,10 @@ class TrendScorer:
                 w_activity * activity_factor
             )
 
-        # Sort by trend score
-        filtered.sort(key=lambda x: x["trend_score"], reverse=True)
-
-        top = filtered[:limit]
+        # Top N by trend score: a bounded heap, not a full sort (same order,
+        # ties keep scan order). Scores are computed in Python, so the
+        # selection cannot move into an ORDER BY ... LIMIT query.
+        top = heapq.nlargest(limit, filtered, key=lambda x: x["trend_score"])
 
         # Persist trend scores to trend_history table
         self._save_trend_history(all_scores, top)
@@ -454,16 +455,21 @@ class TrendScorer:
 
         trending = self.get_trending(limit=limit)
 
-        # Enrich with entity info
-        for item in trending:
-            cursor = self.conn.execute(
-                "SELECT name, type FROM entities WHERE entity_id = ?",
-                (item["entity_id"],)
+        # Enrich with entity info in one query: the ids travel as a single
+        # JSON array parameter unpacked by json_each, so there is no
+        # per-entity lookup and no slicing under SQLite's variable limit
+        ids = [item["entity_id"] for item in trending]
+        info: dict[str, tuple[str, str]] = {
+            row[0]: (row[1], row[2])
+            for row in self.conn.execute(
+                "SELECT entity_id, name, type FROM entities "
+                "WHERE entity_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(ids),),
             )
-            row = cursor.fetchone()
-            if row:
-                item["name"] = row[0]
-                item["type"] = row[1]
+        }
+        for item in trending:
+            if item["entity_id"] in info:
+                item["name"], item["type"] = info[item["entity_id"]]
 
         # Generate trend narratives ("What's Hot and WHY")
         if generate_narratives and trending:
@@ -0,0 +1,29 @@
+"""Machine-readable stats line for pipeline stage scripts.
+
+A stage prints one ``##STATS##{...}`` line at the end of its run;
+run_pipeline.py picks it up and uses those values instead of scraping
+the human-readable log lines above it.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+STATS_SENTINEL = "##STATS##"
+
+
+def emit_stage_stats(stats: dict[str, Any]) -> None:
+    """Print the stats line for run_pipeline.py (keys in camelCase)."""
+    print(f"{STATS_SENTINEL}{json.dumps(stats, separators=(',', ':'))}", flush=True)
+
+
+def parse_stage_stats(line: str) -> Optional[dict[str, Any]]:
+    """Return the stats dict from a stats line, or None for any other line."""
+    if not line.startswith(STATS_SENTINEL):
+        return None
+    try:
+        stats = json.loads(line[len(STATS_SENTINEL):])
+    except ValueError:
+        return None
+    return stats if isinstance(stats, dict) else None
@@ -282,6 +282,20 @@ class TestCleanDocument:
         assert result["title"] is not None
         assert "GPT-5" in result["title"]
 
+    def test_repeat_call_returns_independent_copy(self):
+        """A cached result is returned as a fresh dict each time."""
+        clean = _get_clean_module()
+        clean.clean_document.cache_clear()
+        first = clean.clean_document(SAMPLE_WEBPAGE_HTML)
+        first["metadata"]["author"] = "changed"
+        first["title"] = "changed"
+
+        second = clean.clean_document(SAMPLE_WEBPAGE_HTML)
+
+        assert second["title"] != "changed"
+        assert second["metadata"].get("author") != "changed"
+        assert second["content"] == first["content"]
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
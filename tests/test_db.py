@@ -9,10 +9,17 @@ import pytest
 from pathlib import Path
 
 from db import (
+    DBPool,
     init_db,
     insert_entity,
     insert_relation,
     insert_evidence,
+    insert_entities_batch,
+    insert_relations_batch,
+    insert_relations_batch_ids,
+    insert_evidences_batch,
+    insert_relation_with_evidence,
+    deduplicate_relations,
     get_entity,
     get_entity_by_name,
     get_relations_for_entity,
@@ -20,8 +27,11 @@ from db import (
     add_alias,
     resolve_alias,
     list_entities,
+    list_entity_names,
     list_entities_in_date_range,
     list_relations_in_date_range,
+    iter_entities_in_date_range,
+    iter_relations_in_date_range,
 )
 
 
@@ -80,6 +90,100 @@ class TestInitDb:
         assert cursor.fetchone() is not None
 
 
+    def test_applies_connection_pragmas(self, db_conn):
+        """Should open in WAL mode with the tuned per-connection settings."""
+        assert db_conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db_conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert db_conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert db_conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+    def test_skips_schema_when_hash_matches(self, tmp_path):
+        """Should only re-run the schema DDL when the stored hash differs."""
+        db_path = tmp_path / "test.sqlite"
+        conn = init_db(db_path)
+        conn.execute("DROP INDEX idx_documents_url")
+        conn.commit()
+        conn.close()
+
+        conn = init_db(db_path)
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='idx_documents_url'"
+        ).fetchone() is None
+        conn.execute("UPDATE _meta SET value = 'stale' WHERE key = 'schema_hash'")
+        conn.commit()
+        conn.close()
+
+        conn = init_db(db_path)
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='idx_documents_url'"
+        ).fetchone() is not None
+        conn.close()
+
+    def test_indexes_legacy_extraction_comparison(self, tmp_path):
+        """Should add the shadow-report index only where the table exists."""
+        db_path = tmp_path / "test.sqlite"
+        conn = init_db(db_path)
+        conn.execute(
+            """CREATE TABLE extraction_comparison (
+                understudy_model TEXT, run_date TEXT, schema_valid INTEGER,
+                entity_overlap_pct REAL, relation_overlap_pct REAL,
+                understudy_duration_ms INTEGER)"""
+        )
+        conn.commit()
+        conn.close()
+
+        conn = init_db(db_path)
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='idx_extcmp_model_date'"
+        ).fetchone() is not None
+        conn.close()
+
+
+class TestDBPool:
+    """Test per-thread readers with a single locked writer."""
+
+    def test_readers_are_per_thread_and_see_commits(self, tmp_path):
+        """Each thread gets its own read-only connection."""
+        import threading
+
+        pool = DBPool(tmp_path / "pool.sqlite")
+        try:
+            with pool.writer() as conn:
+                insert_entity(conn, "org:openai", "OpenAI", "Org", commit=False)
+
+            seen = {}
+
+            def read(key):
+                conn = pool.reader()
+                seen[key] = (id(conn), get_entity(conn, "org:openai")["name"])
+
+            threads = [threading.Thread(target=read, args=(i,)) for i in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert {name for _, name in seen.values()} == {"OpenAI"}
+            assert len({conn_id for conn_id, _ in seen.values()}) == 3
+            assert pool.reader() is pool.reader()
+            with pytest.raises(sqlite3.OperationalError):
+                pool.reader().execute("DELETE FROM entities")
+        finally:
+            pool.close()
+
+    def test_writer_rolls_back_on_error(self, tmp_path):
+        """A failed write block leaves nothing behind."""
+        pool = DBPool(tmp_path / "pool.sqlite")
+        try:
+            with pytest.raises(RuntimeError):
+                with pool.writer() as conn:
+                    insert_entity(conn, "org:openai", "OpenAI", "Org", commit=False)
+                    raise RuntimeError("boom")
+            assert get_entity(pool.reader(), "org:openai") is None
+        finally:
+            pool.close()
+
+
 class TestInsertEntity:
     """Test entity insertion."""
 
@@ -129,6 +233,21 @@ class TestInsertEntity:
         # first_seen should not change
         assert entity["first_seen"] == "2025-01-01"
 
+    def test_unchanged_reinsert_writes_nothing(self, db_conn):
+        """Should skip the UPDATE when a re-insert changes no column."""
+        kwargs = dict(
+            entity_id="model:gpt4", name="GPT-4", entity_type="Model",
+            aliases=["GPT4"], external_ids={"wikidata": "Q123"}, last_seen="2025-12-15",
+        )
+        insert_entity(db_conn, **kwargs)
+        before = db_conn.total_changes
+        insert_entity(db_conn, **kwargs)
+        assert db_conn.total_changes == before
+
+        insert_entity(db_conn, **{**kwargs, "aliases": ["GPT4", "gpt-4"]})
+        assert db_conn.total_changes == before + 1
+        assert get_entity(db_conn, "model:gpt4")["aliases"] == ["GPT4", "gpt-4"]
+
 
 class TestGetEntity:
     """Test entity retrieval."""
@@ -207,6 +326,36 @@ class TestInsertRelation:
         assert relation_id is not None
 
 
+    def test_insert_relation_without_commit(self, db_conn):
+        """Should leave the write in the caller's open transaction."""
+        insert_relation(
+            db_conn, "org:openai", "CREATED", "model:gpt4",
+            "asserted", 0.95, "doc1", "1.0.0", commit=False,
+        )
+        assert db_conn.in_transaction
+        db_conn.rollback()
+        assert get_relations_for_entity(db_conn, "org:openai") == []
+
+
+    @pytest.mark.parametrize("returning", [True, False])
+    def test_duplicate_returns_existing_id(self, db_conn, monkeypatch, returning):
+        """Should return the existing id for a duplicate, NULL doc_id included."""
+        import db
+        if not returning:
+            monkeypatch.setattr(db, "_UPSERT_RELATION", None)
+
+        for doc_id in ("doc1", None):
+            first = insert_relation(
+                db_conn, "org:openai", "CREATED", "model:gpt4",
+                "asserted", 0.95, doc_id, "1.0.0"
+            )
+            again = insert_relation(
+                db_conn, "org:openai", "CREATED", "model:gpt4",
+                "asserted", 0.5, doc_id, "1.0.0"
+            )
+            assert again == first
+        assert len(get_relations_for_entity(db_conn, "org:openai")) == 2
+
 class TestInsertEvidence:
     """Test evidence insertion."""
 
@@ -262,6 +411,161 @@ class TestInsertEvidence:
         )
         assert evidence_id is not None
 
+    def test_insert_relation_with_evidence(self, db_conn):
+        """Should insert both rows and link evidence to the (deduplicated) relation."""
+        insert_entity(db_conn, "org:openai", "OpenAI", "Org")
+        insert_entity(db_conn, "model:gpt4", "GPT-4", "Model")
+        relation = {
+            "source_id": "org:openai",
+            "rel": "CREATED",
+            "target_id": "model:gpt4",
+            "kind": "asserted",
+            "confidence": 0.95,
+            "doc_id": "doc123",
+            "extractor_version": "1.0.0",
+        }
+        evidence = {
+            "doc_id": "doc123",
+            "url": "https://example.com/article",
+            "published": "2025-12-01",
+            "snippet": "OpenAI announced GPT-4...",
+        }
+        rid, eid = insert_relation_with_evidence(db_conn, relation, evidence)
+        rid2, eid2 = insert_relation_with_evidence(db_conn, relation, evidence)
+
+        assert rid2 == rid
+        assert eid2 != eid
+        rows = db_conn.execute(
+            "SELECT relation_id FROM evidence WHERE evidence_id IN (?, ?)", (eid, eid2)
+        ).fetchall()
+        assert [r[0] for r in rows] == [rid, rid]
+
+
+class TestBatchInserts:
+    """Test executemany batch variants."""
+
+    def test_entities_batch_matches_single_inserts(self, db_conn):
+        """Should insert new rows and update existing ones like insert_entity."""
+        insert_entity(
+            db_conn, "org:openai", "OpenAI", "Org",
+            first_seen="2025-01-01", last_seen="2025-01-01",
+        )
+        count = insert_entities_batch(db_conn, [
+            {"entity_id": "org:openai", "name": "OpenAI", "entity_type": "Org",
+             "last_seen": "2025-12-01"},
+            {"entity_id": "model:gpt4", "name": "GPT-4", "entity_type": "Model",
+             "aliases": ["GPT4"], "first_seen": "2025-03-01", "last_seen": "2025-03-01"},
+            {"entity_id": "model:gpt4", "name": "GPT-4", "entity_type": "Model",
+             "last_seen": "2025-04-01"},
+        ])
+        assert count == 3
+
+        openai = get_entity(db_conn, "org:openai")
+        assert openai["first_seen"] == "2025-01-01"
+        assert openai["last_seen"] == "2025-12-01"
+        gpt4 = get_entity(db_conn, "model:gpt4")
+        assert gpt4["aliases"] == ["GPT4"]
+        assert gpt4["first_seen"] == "2025-03-01"
+        assert gpt4["last_seen"] == "2025-04-01"
+
+    def test_relations_batch_skips_duplicates(self, db_conn):
+        """Should ignore rows already present or repeated in the batch."""
+        insert_relation(
+            db_conn, "org:openai", "CREATED", "model:gpt4",
+            "asserted", 0.95, "doc1", "1.0.0"
+        )
+        row = {
+            "source_id": "org:openai", "rel": "CREATED", "target_id": "model:gpt3",
+            "kind": "asserted", "confidence": 0.9, "doc_id": "doc2",
+            "extractor_version": "1.0.0",
+        }
+        inserted = insert_relations_batch(db_conn, [
+            {**row, "target_id": "model:gpt4", "doc_id": "doc1"},
+            row,
+            dict(row),
+        ])
+        assert inserted == 1
+        assert len(get_relations_for_entity(db_conn, "org:openai")) == 2
+
+    @pytest.mark.parametrize("returning", [True, False])
+    def test_relations_batch_ids(self, db_conn, monkeypatch, returning):
+        """Should return one id per row, reusing existing ids for duplicates."""
+        import db
+        if not returning:
+            monkeypatch.setattr(db, "_UPSERT_RELATION", None)
+
+        existing = insert_relation(
+            db_conn, "org:openai", "CREATED", "model:gpt4",
+            "asserted", 0.95, "doc1", "1.0.0"
+        )
+        row = {
+            "source_id": "org:openai", "rel": "CREATED", "target_id": "model:gpt3",
+            "kind": "asserted", "confidence": 0.9, "doc_id": "doc2",
+            "extractor_version": "1.0.0",
+        }
+        ids = insert_relations_batch_ids(db_conn, [
+            {**row, "target_id": "model:gpt4", "doc_id": "doc1"},
+            row,
+            dict(row),
+        ])
+        assert ids[0] == existing
+        assert ids[1] == ids[2] != existing
+        assert {r["relation_id"] for r in get_relations_for_entity(db_conn, "org:openai")} == (
+            set(ids)
+        )
+
+    def test_evidences_batch(self, db_conn):
+        """Should insert every evidence row."""
+        relation_id = insert_relation(
+            db_conn, "org:openai", "CREATED", "model:gpt4",
+            "asserted", 0.95, "doc1", "1.0.0"
+        )
+        inserted = insert_evidences_batch(db_conn, [
+            {"relation_id": relation_id, "doc_id": "doc1", "url": "https://example.com/a",
+             "published": "2025-12-01", "snippet": "first"},
+            {"relation_id": relation_id, "doc_id": "doc1", "url": "https://example.com/a",
+             "published": "2025-12-01", "snippet": "second", "char_start": 5, "char_end": 11},
+        ])
+        assert inserted == 2
+        count = db_conn.execute(
+            "SELECT COUNT(*) FROM evidence WHERE relation_id = ?", (relation_id,)
+        ).fetchone()[0]
+        assert count == 2
+
+
+class TestDeduplicateRelations:
+    """Test the duplicate-relation migration."""
+
+    def test_keeps_lowest_id_and_moves_evidence(self, db_conn):
+        """Should delete later duplicates and repoint their evidence."""
+        ids = [
+            insert_relation(db_conn, "org:openai", "CREATED", "model:gpt4",
+                            "asserted", 0.9, doc_id, "1.0.0")
+            for doc_id in ("doc1", "doc2")
+        ]
+        # Simulate a database from before the dedup index existed
+        db_conn.execute("DROP INDEX idx_relations_dedup")
+        for doc_id in ("doc1", "doc2", "doc1"):
+            ids.append(db_conn.execute(
+                """INSERT INTO relations (source_id, rel, target_id, kind, confidence,
+                                          doc_id, extractor_version)
+                   VALUES ('org:openai', 'CREATED', 'model:gpt4', 'asserted', 0.5, ?, '1.0.0')""",
+                (doc_id,),
+            ).lastrowid)
+        for relation_id in ids:
+            insert_evidence(db_conn, relation_id, "doc1", "https://example.com", None, "s")
+
+        assert deduplicate_relations(db_conn) == 3
+
+        remaining = [r["relation_id"] for r in get_relations_for_entity(db_conn, "org:openai")]
+        assert sorted(remaining) == ids[:2]
+        evidence = [
+            row[0] for row in
+            db_conn.execute("SELECT relation_id FROM evidence ORDER BY evidence_id")
+        ]
+        assert evidence == [ids[0], ids[1], ids[0], ids[1], ids[0]]
+        assert deduplicate_relations(db_conn) == 0
+
 
 class TestGetRelations:
     """Test relation retrieval."""
@@ -284,6 +588,20 @@ class TestGetRelations:
         relations = get_relations_for_entity(db_conn, "org:openai")
         assert len(relations) == 2
 
+    def test_get_relations_as_target_and_self_loop(self, db_conn):
+        """Should include incoming relations and return a self-loop once."""
+        insert_relation(
+            db_conn, "org:openai", "CREATED", "model:gpt4",
+            "asserted", 0.95, "doc1", "1.0.0"
+        )
+        insert_relation(
+            db_conn, "model:gpt4", "BASED_ON", "model:gpt4",
+            "asserted", 0.5, "doc1", "1.0.0"
+        )
+
+        relations = get_relations_for_entity(db_conn, "model:gpt4")
+        assert sorted(r["rel"] for r in relations) == ["BASED_ON", "CREATED"]
+
 
 class TestEntityAliases:
     """Test entity alias resolution."""
@@ -315,6 +633,52 @@ class TestEntityAliases:
         canonical = resolve_alias(db_conn, "OpenAI")
         assert canonical == "org:openai"
 
+    def test_add_alias_replaces_target(self, db_conn):
+        """Should resolve to the latest target written by add_alias."""
+        assert resolve_alias(db_conn, "Open AI") is None
+        add_alias(db_conn, "Open AI", "org:openai")
+        assert resolve_alias(db_conn, "Open AI") == "org:openai"
+        add_alias(db_conn, "Open AI", "org:open-ai")
+        assert resolve_alias(db_conn, "Open AI") == "org:open-ai"
+
+    def test_resolves_direct_writes(self, db_conn):
+        """Should find an alias inserted directly after a failed lookup."""
+        assert resolve_alias(db_conn, "Open AI") is None
+        db_conn.execute(
+            "INSERT INTO entity_aliases (alias, canonical_id) VALUES ('Open AI', 'org:openai')"
+        )
+        assert resolve_alias(db_conn, "Open AI") == "org:openai"
+
+    def test_rolled_back_alias_not_resolved(self, db_conn):
+        """Should not resolve an alias whose write was rolled back."""
+        add_alias(db_conn, "Open AI", "org:openai", commit=False)
+        assert resolve_alias(db_conn, "Open AI") == "org:openai"
+        db_conn.rollback()
+        assert resolve_alias(db_conn, "Open AI") is None
+
+    def test_pool_reader_sees_writer_aliases(self, tmp_path):
+        """A pool reader should see aliases the writer commits or changes."""
+        pool = DBPool(tmp_path / "pool.sqlite")
+        try:
+            reader = pool.reader()
+            assert resolve_alias(reader, "Open AI") is None
+            with pool.writer() as conn:
+                add_alias(conn, "Open AI", "org:openai", commit=False)
+            assert resolve_alias(reader, "Open AI") == "org:openai"
+            with pool.writer() as conn:
+                add_alias(conn, "Open AI", "org:open-ai", commit=False)
+            assert resolve_alias(reader, "Open AI") == "org:open-ai"
+
+            with pytest.raises(RuntimeError):
+                with pool.writer() as conn:
+                    add_alias(conn, "OAI", "org:openai", commit=False)
+                    assert resolve_alias(conn, "OAI") == "org:openai"
+                    raise RuntimeError("boom")
+            with pool.writer() as conn:
+                assert resolve_alias(conn, "OAI") is None
+        finally:
+            pool.close()
+
 
 class TestListEntities:
     """Test entity listing."""
@@ -325,7 +689,7 @@ class TestListEntities:
         insert_entity(db_conn, "org:anthropic", "Anthropic", "Org")
         insert_entity(db_conn, "model:gpt4", "GPT-4", "Model")
 
-        entities = list_entities(db_conn)
+        entities = list(list_entities(db_conn))
         assert len(entities) == 3
 
     def test_list_entities_by_type(self, db_conn):
@@ -334,12 +698,29 @@ class TestListEntities:
         insert_entity(db_conn, "org:anthropic", "Anthropic", "Org")
         insert_entity(db_conn, "model:gpt4", "GPT-4", "Model")
 
-        orgs = list_entities(db_conn, entity_type="Org")
+        orgs = list(list_entities(db_conn, entity_type="Org"))
         assert len(orgs) == 2
 
-        models = list_entities(db_conn, entity_type="Model")
+        models = list(list_entities(db_conn, entity_type="Model"))
         assert len(models) == 1
 
+    def test_list_entities_raw_json(self, db_conn):
+        """Should leave JSON columns unparsed when asked."""
+        insert_entity(db_conn, "model:gpt4", "GPT-4", "Model", aliases=["GPT4"])
+
+        (entity,) = list_entities(db_conn, parse_json=False)
+        assert entity["aliases"] == '["GPT4"]'
+
+    def test_list_entity_names(self, db_conn):
+        """Should return (entity_id, name) pairs, optionally by type."""
+        insert_entity(db_conn, "org:openai", "OpenAI", "Org")
+        insert_entity(db_conn, "model:gpt4", "GPT-4", "Model")
+
+        assert sorted(list_entity_names(db_conn)) == [
+            ("model:gpt4", "GPT-4"), ("org:openai", "OpenAI"),
+        ]
+        assert list_entity_names(db_conn, entity_type="Org") == [("org:openai", "OpenAI")]
+
 
 class TestDateRangeQueries:
     """Test date range filtering for entities and relations.
@@ -458,6 +839,32 @@ class TestDateRangeQueries:
         )
         assert len(result) == 1  # only doc_mid
 
+    def test_relations_selected_columns(self, db_conn):
+        """columns narrows each row to the requested relation columns."""
+        self._insert_dated_relations(db_conn)
+        result = list_relations_in_date_range(
+            db_conn, start_date="2025-11-01", columns=("source_id", "target_id")
+        )
+        assert len(result) == 2
+        assert all(set(r) == {"source_id", "target_id"} for r in result)
+
+    def test_relations_unknown_column_rejected(self, db_conn):
+        """Column names outside the relations table raise ValueError."""
+        with pytest.raises(ValueError):
+            list_relations_in_date_range(db_conn, columns=["rel; DROP TABLE relations"])
+
+    def test_iter_variants_stream_same_rows(self, db_conn):
+        """Generator variants yield the rows the list functions return."""
+        self._insert_dated_relations(db_conn)
+        relations = iter_relations_in_date_range(db_conn, start_date="2025-11-01")
+        assert not isinstance(relations, list)
+        assert list(relations) == list_relations_in_date_range(
+            db_conn, start_date="2025-11-01"
+        )
+        assert list(iter_entities_in_date_range(db_conn, end_date="2025-12-31")) == (
+            list_entities_in_date_range(db_conn, end_date="2025-12-31")
+        )
+
 
 class TestGetLatestPublishedDate:
     """Test the latest-published-date helper used by export's anchor=latest mode."""
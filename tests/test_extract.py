@@ -166,6 +166,59 @@ class TestSaveAndLoadExtraction:
         expected_path = tmp_path / "2025-12-01_test_abc.json"
         assert expected_path.exists()
 
+    def test_save_extraction_matches_stdlib_json(self, tmp_path):
+        """Saved bytes should match json.dumps(indent=2, ensure_ascii=False)."""
+        extraction = {
+            "docId": "doc_unicode",
+            "extractorVersion": "1.0.0",
+            "entities": [{"name": "Café Société", "type": "Org", "confidence": 0.85}],
+            "relations": [],
+            "techTerms": [],
+            "dates": [],
+        }
+
+        path = save_extraction(extraction, tmp_path)
+
+        expected = json.dumps(extraction, indent=2, ensure_ascii=False)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_save_extraction_round_trips_extraction_fields(self, tmp_path):
+        """Saved JSON should load back to the extraction, nested fields included."""
+        extraction = {
+            "docId": "doc_full",
+            "extractorVersion": "1.0.0",
+            "entities": [
+                {"name": "OpenAI", "type": "Org", "aliases": ["Open AI"],
+                 "externalIds": {"wikidata": "Q123"}, "confidence": 0.1},
+            ],
+            "relations": [{
+                "source": "OpenAI", "rel": "CREATED", "target": "GPT-4",
+                "kind": "asserted", "confidence": 0.95, "polarity": None,
+                "time": {"text": "in March", "start": "2023-03-14", "end": None},
+                "evidence": [{
+                    "docId": "doc_full", "url": "https://example.com/a",
+                    "published": "2023-03-14", "snippet": "« GPT-4 » — launched",
+                    "charSpan": {"start": 0, "end": 1234567},
+                }],
+            }],
+            "techTerms": ["RLHF"],
+            "dates": [{"text": "March 14", "start": "2023-03-14"}],
+            "_qualityScore": 0.333333333333333,
+            "_escalationFailed": False,
+        }
+
+        path = save_extraction(extraction, tmp_path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == extraction
+
+    def test_save_extraction_custom_serializer(self, tmp_path):
+        """A caller-supplied serializer should produce the file bytes."""
+        extraction = {"docId": "doc_custom", "entities": []}
+
+        path = save_extraction(extraction, tmp_path, serializer=lambda e: b"{}")
+
+        assert path.read_bytes() == b"{}"
+
     def test_load_extraction(self, tmp_path):
         """Should load extraction from JSON file."""
         extraction = {
@@ -236,6 +236,33 @@ class TestGraphExporter:
 
         conn.close()
 
+    def test_id_filtered_queries_match_full_scan(self, tmp_path: Path):
+        """_get_*_by_ids/_touching return the same rows as filtering in Python."""
+        graph = _get_graph_module()
+        conn = init_db(tmp_path / "test.db")
+
+        for eid in ("org:c", "org:a", "org:b", "org:d"):
+            insert_entity(conn, eid, eid.upper(), "Org")
+        for src, tgt, doc in [("org:a", "org:b", "d1"), ("org:b", "org:c", "d1"),
+                              ("org:c", "org:d", "d2"), ("org:a", "org:b", "d2")]:
+            insert_relation(conn, source_id=src, rel="PARTNERED_WITH", target_id=tgt,
+                            kind="asserted", confidence=0.9, doc_id=doc,
+                            extractor_version="1.0.0")
+
+        exporter = graph.GraphExporter(conn)
+        ids = {"org:a", "org:c"}
+
+        expected_entities = [e for e in exporter._get_entities() if e["entity_id"] in ids]
+        assert exporter._get_entities_by_ids(ids) == expected_entities
+        assert [e["entity_id"] for e in expected_entities] == ["org:c", "org:a"]
+
+        expected_relations = [r for r in exporter._get_relations()
+                              if r["source_id"] in ids or r["target_id"] in ids]
+        assert exporter._get_relations_touching(ids) == expected_relations
+        assert len(expected_relations) == 4
+
+        conn.close()
+
 
 class TestViewExports:
     """Test different graph views."""
@@ -7,6 +7,7 @@ Does NOT test actual pipeline execution (that requires network + API keys).
 from __future__ import annotations
 
 import json
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -26,7 +27,15 @@ from run_pipeline import (
     parse_trending_output,
     copy_graphs_to_live,
     run_stage,
+    run_stages_concurrently,
+    DocpackOutputParser,
+    IngestOutputParser,
+    ResolveOutputParser,
+    StageParser,
+    STDOUT_TAIL_CHARS,
+    StageWorkerPool,
     utc_now,
+    _acquire_pipeline_lock,
 )
 
 
@@ -313,6 +322,22 @@ class TestParseTrendingOutput:
         assert stats["trendingEdges"] == 0
 
 
+class TestPipelineLock:
+    def test_second_acquire_fails_while_held(self, tmp_path):
+        lock_path = tmp_path / "pipeline.lock"
+        fd = _acquire_pipeline_lock(lock_path)
+        assert fd is not None
+        try:
+            assert lock_path.read_text().strip() == str(os.getpid())
+            assert _acquire_pipeline_lock(lock_path) is None
+        finally:
+            lock_path.unlink()
+            os.close(fd)
+        fd = _acquire_pipeline_lock(lock_path)
+        assert fd is not None
+        os.close(fd)
+
+
 class TestCopyGraphsToLive:
     def test_copies_json_files(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -332,6 +357,23 @@ class TestCopyGraphsToLive:
             assert (live_dir / "claims.json").exists()
             assert (live_dir / "trending.json").exists()
 
+    def test_overwrites_existing_live_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            graphs_dir = Path(tmpdir) / "graphs"
+            source_dir = graphs_dir / "2026-02-14"
+            source_dir.mkdir(parents=True)
+            (source_dir / "trending.json").write_text('{"fresh": true}')
+
+            live_dir = Path(tmpdir) / "live"
+            live_dir.mkdir()
+            (live_dir / "trending.json").write_text('{"stale": true, "padding": "xxxxxxxx"}')
+
+            assert copy_graphs_to_live(graphs_dir, "2026-02-14", live_dir) is True
+            assert (live_dir / "trending.json").read_text() == '{"fresh": true}'
+            # Live copy is independent of the source file
+            (source_dir / "trending.json").write_text("{}")
+            assert (live_dir / "trending.json").read_text() == '{"fresh": true}'
+
     def test_returns_false_when_source_missing(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             graphs_dir = Path(tmpdir) / "graphs"
@@ -361,10 +403,178 @@ class TestRunStage:
         )
         assert result["status"] == "timeout"
 
+    def test_timeout_keeps_partial_output(self):
+        result = run_stage(
+            "test",
+            [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(10)"],
+            timeout=1,
+        )
+        assert result["status"] == "timeout"
+        assert result["stdout"] == "started\n"
+        assert "timed out" in result["stderr"]
+
+    def test_streaming_timeout_reaps_process(self, capsys):
+        result = run_stage(
+            "test",
+            [sys.executable, "-c", "import os, time; print(os.getpid(), flush=True); time.sleep(10)"],
+            timeout=1,
+            stream=True,
+        )
+        assert result["status"] == "timeout"
+        pid = int(result["stdout"].split()[0])
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
     def test_nonexistent_command(self):
         result = run_stage("test", ["/nonexistent/command"])
         assert result["status"] == "error"
 
+    def test_parser_stats_match_captured_parse(self):
+        script = (
+            "import sys\n"
+            "print('Processing feed: Alpha')\n"
+            "print('  Feed OK: 3 new documents, 2 duplicates skipped')\n"
+            "print('[diag] bozo_exception=SAXParseException', file=sys.stderr)\n"
+        )
+        result = run_stage("ingest", [sys.executable, "-c", script],
+                           parser=IngestOutputParser())
+        assert result["status"] == "ok"
+        assert result["stats"] == parse_ingest_output(result["stdout"], result["stderr"])
+        assert result["stats"]["newDocsFound"] == 3
+
+    def test_parser_keeps_only_stdout_tail(self):
+        script = "for i in range(2000): print(f'line {i:05d} bundled')"
+        result = run_stage("docpack", [sys.executable, "-c", script],
+                           parser=DocpackOutputParser())
+        assert result["stats"]["docsBundled"] == 1999
+        assert len(result["stdout"]) < 2 * STDOUT_TAIL_CHARS
+        assert result["stdout"].endswith("line 01999 bundled\n")
+
+    def test_stat_less_parser_keeps_same_tail(self):
+        script = "for i in range(20000): print(f'line {i:05d} \u00e9')"
+        result = run_stage("submit", [sys.executable, "-c", script],
+                           parser=StageParser())
+        assert result["status"] == "ok"
+        assert result["stdout"].endswith("line 19999 \u00e9\n")
+        assert STDOUT_TAIL_CHARS <= len(result["stdout"]) < 2 * STDOUT_TAIL_CHARS
+
+
+class TestEmittedStageStats:
+    def test_stats_line_overrides_scraped_values(self):
+        script = (
+            "print('Resolution pass complete:')\n"
+            "print('  - 42 entities checked')\n"
+            "print('##STATS##{\"entitiesChecked\": 40, \"mergesPerformed\": 3}')\n"
+        )
+        result = run_stage("resolve", [sys.executable, "-c", script],
+                           parser=ResolveOutputParser())
+        assert result["stats"]["entitiesChecked"] == 40
+        assert result["stats"]["mergesPerformed"] == 3
+        assert result["stats"]["disambigMerges"] == 0
+
+    def test_malformed_stats_line_falls_back_to_parser(self):
+        script = "print('  - 42 entities checked'); print('##STATS##{not json')"
+        result = run_stage("resolve", [sys.executable, "-c", script],
+                           parser=ResolveOutputParser())
+        assert result["stats"]["entitiesChecked"] == 42
+
+    def test_parse_honours_stats_line(self):
+        stats = ResolveOutputParser.parse(
+            "  - 42 entities checked\n##STATS##{\"entitiesChecked\": 7}\n"
+        )
+        assert stats["entitiesChecked"] == 7
+
+
+class TestRunStagesConcurrently:
+    def test_results_in_spec_order(self):
+        results = run_stages_concurrently([
+            ("slow", [sys.executable, "-c", "import time; time.sleep(0.5); print('slow')"], 10, None),
+            ("fast", [sys.executable, "-c", "print('fast')"], 10, None),
+        ])
+        assert [r["stage"] for r in results] == ["slow", "fast"]
+        assert all(r["status"] == "ok" for r in results)
+        assert "slow" in results[0]["stdout"]
+        assert "fast" in results[1]["stdout"]
+
+    def test_failure_and_timeout_isolated(self):
+        results = run_stages_concurrently([
+            ("fail", [sys.executable, "-c", "import sys; sys.exit(2)"], 10, None),
+            ("hang", [sys.executable, "-c", "import time; time.sleep(10)"], 1, None),
+            ("missing", ["/nonexistent/command"], 10, None),
+        ])
+        assert results[0]["status"] == "error"
+        assert results[0]["returncode"] == 2
+        assert results[1]["status"] == "timeout"
+        assert results[2]["status"] == "error"
+
+    def test_parser_fed_line_by_line(self):
+        script = "print('Resolution pass complete:'); print('  - 42 entities checked')"
+        results = run_stages_concurrently([
+            ("resolve", [sys.executable, "-c", script], 10, ResolveOutputParser()),
+        ])
+        assert results[0]["stats"]["entitiesChecked"] == 42
+
+
+class TestStageWorkerPool:
+    def _script(self, tmp_path, body):
+        script = tmp_path / "stage.py"
+        script.write_text(body)
+        return [sys.executable, str(script)]
+
+    def test_runs_script_in_process(self, tmp_path):
+        cmd = self._script(tmp_path, (
+            "import sys\n"
+            "print('Resolution pass complete:')\n"
+            "print('  - 7 entities checked')\n"
+            "print('careful', file=sys.stderr)\n"
+            "raise SystemExit(3)\n"
+        ))
+        pool = StageWorkerPool()
+        try:
+            result = pool.run("resolve", cmd, cwd=tmp_path, parser=ResolveOutputParser())
+        finally:
+            pool.close()
+        assert result["status"] == "error"
+        assert result["returncode"] == 3
+        assert result["stats"]["entitiesChecked"] == 7
+        assert "careful" in result["stderr"]
+
+    def test_timeout_replaces_worker(self, tmp_path):
+        slow = self._script(tmp_path, "import time; time.sleep(10)\n")
+        pool = StageWorkerPool()
+        try:
+            assert pool.run("slow", slow, cwd=tmp_path, timeout=1)["status"] == "timeout"
+            fast = [sys.executable, "-c"]  # not a script: can_run is False
+            assert not pool.can_run(fast)
+            ok = self._script(tmp_path, "print('fine')\n")
+            assert pool.run("ok", ok, cwd=tmp_path)["stdout"] == "fine\n"
+        finally:
+            pool.close()
+
+    def test_worker_death_fails_stage_without_timeout(self, tmp_path):
+        import threading
+
+        crash = self._script(tmp_path, "import os; os._exit(9)\n")
+        pool = StageWorkerPool()
+        results = []
+        try:
+            runner = threading.Thread(
+                target=lambda: results.append(
+                    pool.run("crash", crash, cwd=tmp_path, timeout=None)
+                ),
+                daemon=True,
+            )
+            runner.start()
+            runner.join(30)
+            assert not runner.is_alive(), "run() hung on a dead worker"
+            assert results[0]["status"] == "error"
+            assert "exited with code 9" in results[0]["stderr"]
+
+            ok = self._script(tmp_path, "print('fine')\n")
+            assert pool.run("ok", ok, cwd=tmp_path)["stdout"] == "fine\n"
+        finally:
+            pool.close()
+
 
 class TestDryRun:
     def test_dry_run_prints_stages(self):
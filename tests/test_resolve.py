@@ -500,6 +500,80 @@ class TestBatchResolution:
 
         conn.close()
 
+    def test_run_resolution_pass_since_skips_old_pairs(self, tmp_path: Path):
+        """Incremental pass only compares pairs involving recent entities."""
+        resolve = _get_resolve_module()
+        db_path = tmp_path / "test.db"
+        conn = init_db(db_path)
+
+        # Old duplicate pair — left alone by an incremental pass
+        insert_entity(conn, "org:openai_1", "OpenAI", "Org",
+                      first_seen="2023-01-01", last_seen="2023-01-01")
+        insert_entity(conn, "org:openai_2", "Open AI", "Org",
+                      first_seen="2023-02-01", last_seen="2023-02-01")
+        # New duplicate of an old entity — merged into the older canonical
+        insert_entity(conn, "org:anthropic_1", "Anthropic", "Org",
+                      first_seen="2023-01-01", last_seen="2023-01-01")
+        insert_entity(conn, "org:anthropic_2", "Anthropic.", "Org",
+                      first_seen="2024-05-01", last_seen="2024-05-01")
+
+        resolver = resolve.EntityResolver(conn, threshold=0.9)
+        stats = resolver.run_resolution_pass(since="2024-01-01")
+
+        assert stats["merges_performed"] == 1
+        assert get_entity(conn, "org:anthropic_1") is not None
+        assert get_entity(conn, "org:anthropic_2") is None
+        assert get_entity(conn, "org:openai_1") is not None
+        assert get_entity(conn, "org:openai_2") is not None
+
+        conn.close()
+
+    def test_run_resolution_pass_parallel_matches_serial(self, tmp_path: Path):
+        """jobs > 1 computes matches in a process pool with the same merges."""
+        resolve = _get_resolve_module()
+
+        def build(path):
+            conn = init_db(path)
+            insert_entity(conn, "org:openai_1", "OpenAI", "Org", first_seen="2023-01-01")
+            insert_entity(conn, "org:openai_2", "Open AI", "Org", first_seen="2023-02-01")
+            insert_entity(conn, "org:google", "Google", "Org", first_seen="2023-01-01")
+            insert_entity(conn, "model:gpt4_1", "GPT-4", "Model", first_seen="2023-03-01")
+            insert_entity(conn, "model:gpt4_2", "GPT 4", "Model", first_seen="2023-04-01")
+            return conn
+
+        serial = build(tmp_path / "serial.db")
+        parallel = build(tmp_path / "parallel.db")
+        s_stats = resolve.EntityResolver(serial, threshold=0.9).run_resolution_pass()
+        p_stats = resolve.EntityResolver(parallel, threshold=0.9).run_resolution_pass(jobs=2)
+
+        assert p_stats == s_stats
+        assert p_stats["merges_performed"] == 2
+        ids = "SELECT entity_id FROM entities ORDER BY entity_id"
+        assert parallel.execute(ids).fetchall() == serial.execute(ids).fetchall()
+
+        serial.close()
+        parallel.close()
+
+    def test_blocking_index_matches_full_scan(self):
+        """The candidate index never drops a pair the full scan would match."""
+        resolve = _get_resolve_module()
+        names = ["OpenAI", "Open AI", "Open-AI Inc.", "AI", "Anthropic",
+                 "Anthropic PBC", "GPT-4", "GPT 4", "GPT-4o", "Meta", "Meta AI",
+                 "DeepMind", "Google DeepMind", "!!", ""]
+        candidates = [
+            {"entity_id": f"e{i}", "name": n, "aliases": ["Open A.I."] if i == 3 else None}
+            for i, n in enumerate(names)
+        ]
+        index = resolve._CandidateIndex(candidates)
+        for threshold in (0.0, 0.3, 0.5, 0.7, 0.85, 1.0):
+            for name in names + ["open", "Deep", "gpt"]:
+                expected = [
+                    c["entity_id"] for c in candidates
+                    if max(resolve.name_similarity(name, n)
+                           for n in [c["name"], *(c["aliases"] or [])]) >= threshold
+                ]
+                assert resolve._match_ids("q", name, candidates, threshold, index) == expected
+
 
 class TestCanonicalIdGeneration:
     """Test canonical ID generation."""
@@ -0,0 +1,115 @@
+"""Tests for the synchronous extraction fallback script."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import run_extract
+
+
+@pytest.fixture
+def docpack(tmp_path):
+    path = tmp_path / "docpack.jsonl"
+    path.write_text(
+        json.dumps({"docId": "doc1", "title": "T", "text": "Body"}) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def api_models(monkeypatch):
+    """Stub the API call and record the model each call was made with."""
+    models = []
+
+    def fake_extract(doc, model, max_tokens=8192, prompt=None):
+        models.append(model)
+        return "{}", 1
+
+    monkeypatch.setattr(run_extract, "extract_with_anthropic", fake_extract)
+    return models
+
+
+class TestRunExtractionModel:
+    def test_default_model_when_none(self, docpack, tmp_path, api_models, monkeypatch):
+        monkeypatch.delenv("PRIMARY_MODEL", raising=False)
+        processed, _, _ = run_extract.run_extraction(docpack, tmp_path / "out", model=None)
+        assert processed == 1
+        assert api_models == ["claude-sonnet-5"]
+
+    def test_primary_model_env(self, docpack, tmp_path, api_models, monkeypatch):
+        monkeypatch.setenv("PRIMARY_MODEL", "custom-model")
+        run_extract.run_extraction(docpack, tmp_path / "out", model=None)
+        assert api_models == ["custom-model"]
+
+
+class _FakeStream:
+    """Records writes and flushes in order; isatty() as configured."""
+
+    def __init__(self, tty: bool) -> None:
+        self.tty = tty
+        self.events: list[str] = []
+
+    def isatty(self) -> bool:
+        return self.tty
+
+    def write(self, text: str) -> None:
+        self.events.append(text)
+
+    def flush(self) -> None:
+        self.events.append("<flush>")
+
+    @property
+    def text(self) -> str:
+        return "".join(e for e in self.events if e != "<flush>")
+
+
+class TestProgressLog:
+    def test_tty_writes_marker_then_status(self):
+        stream = _FakeStream(tty=True)
+        with run_extract.ProgressLog(stream) as progress:
+            progress.start("  [%d/%d] %s: extracting...", 1, 2, "doc1")
+            progress.finish("OK (%de, %dr, %dms)", 3, 2, 10)
+            progress.line("  [%d/%d] %s: SKIPPED (exists)", 2, 2, "doc2")
+
+        assert stream.events == [
+            "  [1/2] doc1: extracting... ", "<flush>",
+            "OK (3e, 2r, 10ms)\n", "<flush>",
+            "  [2/2] doc2: SKIPPED (exists)\n", "<flush>",
+            "<flush>",
+        ]
+
+    def test_redirected_writes_whole_lines_in_flush_batches(self):
+        stream = _FakeStream(tty=False)
+        with run_extract.ProgressLog(stream, flush_every=2) as progress:
+            for i in (1, 2, 3):
+                progress.start("  [%d/3] %s: extracting...", i, f"doc{i}")
+                progress.finish("%s: %s", "FAILED", "bad json")
+
+        assert stream.events == [
+            "  [1/3] doc1: extracting... FAILED: bad json\n",
+            "  [2/3] doc2: extracting... FAILED: bad json\n",
+            "<flush>",
+            "  [3/3] doc3: extracting... FAILED: bad json\n",
+            "<flush>",  # on close
+        ]
+
+    def test_close_drains_and_detaches(self):
+        stream = _FakeStream(tty=False)
+        with run_extract.ProgressLog(stream, flush_every=100) as progress:
+            for i in range(50):
+                progress.line("line %d", i)
+        assert stream.text == "".join(f"line {i}\n" for i in range(50))
+        assert stream.events[-1] == "<flush>"
+
+        # After exit the listener is stopped and the handler removed
+        progress.line("late")
+        assert "late" not in stream.text
+        assert progress._queue_handler not in run_extract._progress_logger.handlers
+
@@ -612,6 +612,45 @@ class TestTrendingBridgeEntities:
         bridge_nodes = [n for n in data["elements"]["nodes"] if n["data"].get("bridge")]
         assert len(bridge_nodes) == 0
 
+    def test_shared_connection_left_open(self, tmp_path: Path):
+        """A connection passed in is reused and not closed by the export."""
+        import sys as _sys
+        _sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+        from run_trending import export_trending
+
+        db_path = tmp_path / "test.db"
+        conn = init_db(db_path)
+        self._setup_connected_graph(conn)
+        conn.commit()
+
+        export_trending(db_path, tmp_path / "graphs", 50, conn=conn)
+
+        assert (tmp_path / "graphs" / "trending.json").exists()
+        assert conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0] == 3
+        conn.close()
+
+    def test_streaming_writes_ndjson(self, tmp_path: Path):
+        """--streaming writes the meta line, then one element per line."""
+        import json
+        import sys as _sys
+        _sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+        from run_trending import export_trending
+
+        db_path = tmp_path / "test.db"
+        conn = init_db(db_path)
+        self._setup_connected_graph(conn)
+        conn.commit()
+        conn.close()
+
+        path = export_trending(db_path, tmp_path / "graphs", 50, streaming=True)
+
+        assert path.name == "trending.ndjson"
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        meta = lines[0]["meta"]
+        groups = [line["group"] for line in lines[1:]]
+        assert groups.count("nodes") == meta["nodeCount"] == 3
+        assert groups.count("edges") == meta["edgeCount"]
+
     def test_bridge_reconnects_isolated_trending(self, tmp_path: Path):
         """A non-trending entity that connects two isolated trending entities
         should be included as a bridge node."""